@@ -0,0 +1,39 @@
+"""Balíček s benchmarky výkonu jednotlivých částí hry.
+
+Každý modul lze spustit samostatně, např. `python -m benchmarks.phrase_memory`.
+Tento initor poskytuje společné pomocné funkce, především generátor
+syntetických tajenek s pevným semínkem, aby byly výsledky reprodukovatelné.
+"""
+
+import random
+
+# Písmena, ze kterých se skládají syntetická slova (včetně české diakritiky)
+ALPHABET = "AÁBCČDĎEÉĚFGHIÍJKLMNŇOÓPQRŘSŠTŤUÚŮVWXYÝZŽ"
+
+# Interpunkční znaménka, kterými mohou syntetické věty končit
+PUNCTUATION = ".!?"
+
+
+def synthetic_words(count: int, seed: int = 0) -> list[str]:
+    """Funkce vygeneruje `count` syntetických slov o délce 2 až 10 znaků."""
+    rng = random.Random(seed)
+    return ["".join(rng.choice(ALPHABET) for _ in range(rng.randint(2, 10)))
+            for _ in range(count)]
+
+
+def synthetic_phrases(count: int, length: int, seed: int = 0) -> list[str]:
+    """Funkce vygeneruje `count` syntetických tajenek o délce přibližně
+    `length` znaků (slova oddělená mezerami, na konci interpunkce)."""
+    rng = random.Random(seed)
+    phrases = []
+    for _ in range(count):
+        words = []
+        size = 0
+        while size < length:
+            word = "".join(rng.choice(ALPHABET)
+                           for _ in range(rng.randint(2, 10)))
+            words.append(word)
+            size += len(word) + 1
+        phrases.append(" ".join(words).capitalize()
+                       + rng.choice(PUNCTUATION))
+    return phrases
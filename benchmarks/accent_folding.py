@@ -0,0 +1,60 @@
+"""Benchmark odstraňování diakritiky.
+
+Porovnává původní funkci `remove_accents` (normalizace NFD a kódování do
+ASCII při každém volání) s tabulkovými funkcemi `fold_letter` (pro jediný
+znak) a `fold_accents` (pro celý řetězec). Před měřením ověřuje, že se
+výsledky shodují pro všechny předpočítané kódové body.
+"""
+
+import argparse
+import timeit
+
+from benchmarks import synthetic_phrases
+from src.game.phrase import (
+    FOLDED_RANGE, fold_accents, fold_letter, remove_accents)
+
+
+def verify():
+    """Funkce ověří, že se tabulkové funkce shodují s `remove_accents` pro
+    všechny předpočítané kódové body i pro znaky mimo jejich rozsah."""
+    for code_point in [*FOLDED_RANGE, 0x01CE, 0x1E9E, 0x20AC, 0xFB01]:
+        letter = chr(code_point)
+        assert fold_letter(letter) == remove_accents(letter), letter
+        assert fold_accents(letter) == remove_accents(letter), letter
+
+
+def bench(label: str, function, arguments: list[str], repeat: int):
+    """Funkce změří a vypíše průměrnou dobu jednoho volání funkce."""
+    elapsed = min(timeit.repeat(
+        lambda: [function(argument) for argument in arguments],
+        number=1, repeat=repeat))
+    print(f"\t{label:<16} {elapsed / len(arguments) * 1e9:>8.0f} ns/volání")
+
+
+def main():
+    """Spuštění benchmarku z příkazové řádky."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=2_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    verify()
+    phrases = synthetic_phrases(args.count, 60)
+    plain = [fold_accents(phrase) for phrase in phrases]
+    letters = [letter for phrase in phrases for letter in phrase]
+
+    print(f"Jednotlivé znaky ({len(letters)})")
+    bench("remove_accents", remove_accents, letters, args.repeat)
+    bench("fold_letter", fold_letter, letters, args.repeat)
+
+    print(f"Celé tajenky ({len(phrases)}, ~60 znaků)")
+    bench("remove_accents", remove_accents, phrases, args.repeat)
+    bench("fold_accents", fold_accents, phrases, args.repeat)
+
+    print(f"Celé tajenky bez diakritiky ({len(plain)}, ~60 znaků)")
+    bench("remove_accents", remove_accents, plain, args.repeat)
+    bench("fold_accents", fold_accents, plain, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Benchmark načítání korpusu tajenek.
+
+Porovnává dobu do získání první tajenky a maximální velikost rezidentní
+paměti (RSS) procesu, který z velkého korpusu odehraje náhodný vzorek
+tajenek:
+
+- `text`: všechny tajenky se načtou z textového souboru a předem se z nich
+  vybudují objekty `SecretPhrase`,
+- `corpus`: tajenky se čtou z binárního korpusu přes `mmap` a objekty se
+  budují až pro vybraný vzorek (viz `src.game.corpus.PhraseCorpus`).
+
+Každé měření běží v samostatném procesu, aby se RSS jednotlivých variant
+neovlivňovaly.
+"""
+
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+from time import perf_counter
+
+from benchmarks import synthetic_phrases
+from src.game.corpus import PhraseCorpus, convert, read_text_phrases
+from src.game.phrase import SecretPhrase
+
+
+def measure(mode: str, path: str, sample: int):
+    """Funkce změří jednu variantu v aktuálním procesu a vypíše dobu do
+    získání první tajenky, celkovou dobu a maximální RSS v kB."""
+    start = perf_counter()
+    if mode == "text":
+        phrases = [SecretPhrase(text) for text in read_text_phrases(path)]
+        chosen = iter(phrases[:sample])
+    else:
+        corpus = PhraseCorpus(path)
+        chosen = corpus.sample(sample, seed=0)
+
+    next(chosen)
+    first = perf_counter() - start
+    for _ in chosen:
+        pass
+    total = perf_counter() - start
+
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(first, total, rss)
+
+
+def run(mode: str, path: str, sample: int) -> tuple[float, float, int]:
+    """Funkce spustí měření varianty v samostatném procesu a vrací jeho
+    výsledek."""
+    output = subprocess.run(
+        [sys.executable, "-m", "benchmarks.corpus_loading",
+         "--measure", mode, path, "--sample", str(sample)],
+        capture_output=True, text=True, check=True).stdout.split()
+    return float(output[0]), float(output[1]), int(output[2])
+
+
+def main():
+    """Spuštění benchmarku z příkazové řádky."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--length", type=int, default=40)
+    parser.add_argument("--sample", type=int, default=1_000)
+    parser.add_argument("--measure", nargs=2, metavar=("MODE", "PATH"),
+                        help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        measure(args.measure[0], args.measure[1], args.sample)
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        text_path = os.path.join(directory, "phrases.txt")
+        corpus_path = os.path.join(directory, "phrases.wofc")
+        with open(text_path, "w", encoding="utf-8") as file:
+            for phrase in synthetic_phrases(args.count, args.length):
+                file.write(phrase + "\n")
+
+        start = perf_counter()
+        convert(text_path, corpus_path)
+        print(f"{args.count} tajenek o délce ~{args.length} znaků, "
+              f"převod: {perf_counter() - start:.2f} s, "
+              f"korpus: {os.path.getsize(corpus_path) / 2**20:.1f} MiB")
+        print(f"vzorek {args.sample} tajenek:")
+
+        _, _, baseline = run("corpus", corpus_path, 1)
+        for mode, path in (("text", text_path), ("corpus", corpus_path)):
+            first, total, rss = run(mode, path, args.sample)
+            print(f"\t{mode:<8} první tajenka {first * 1000:>9.1f} ms, "
+                  f"celkem {total * 1000:>9.1f} ms, RSS {rss / 1024:>7.1f} "
+                  f"MiB (+{(rss - baseline) / 1024:.1f} MiB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Benchmark záznamu her a jeho přehrávání.
+
+Odehraje syntetické hry umlčeným moderátorem střídavě bez záznamu a se
+záznamem a vypíše režii záznamu (podle nejkratších dob) a jeho velikost na
+jeden tah. Poté záznam načte a přehraje: ověří, že přehrané hry mají stejné
+skóre, zkoušená písmena i podobu tajenky jako odehrané hry, a vypíše počet
+přehraných tahů za sekundu (celou hru metodou `replay` i samotná skóre
+metodou `scores`).
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+from time import perf_counter
+
+from benchmarks import synthetic_phrases
+from src.game import default_wheel
+from src.game.event_log import EventLog, read_log
+from src.game.game import MultiplayerGame
+from src.game.moderator import Moderator
+from src.player.entropy_driven_player import (
+    EntropyDrivenPlayerCZ, EntropyDrivenPlayerEN)
+
+
+def play(phrases: list[str], players: int, event_log=None
+         ) -> tuple[list, float]:
+    """Funkce odehraje hry nad dodanými tajenkami a vrací dvojici (odehrané
+    hry, doba hraní)."""
+    wheel = default_wheel()
+    wheel.seed(0)
+    lineup = [EntropyDrivenPlayerCZ() if seat % 2 else EntropyDrivenPlayerEN()
+              for seat in range(players)]
+    games = []
+    start = perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for text in phrases:
+            game = MultiplayerGame(text, wheel, lineup)
+            Moderator(game, quiet=True, event_log=event_log).run_game()
+            games.append(game)
+    return games, perf_counter() - start
+
+
+def main():
+    """Spuštění benchmarku z příkazové řádky."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--games", type=int, default=2_000)
+    parser.add_argument("--players", type=int, default=3)
+    parser.add_argument("--length", type=int, default=40)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    phrases = synthetic_phrases(args.games, args.length)
+    plain_time = recorded_time = float("inf")
+
+    with tempfile.TemporaryDirectory() as directory:
+        # Hraní bez záznamu a se záznamem se střídá, bere se nejkratší doba
+        for _ in range(args.repeat):
+            _, duration = play(phrases, args.players)
+            plain_time = min(plain_time, duration)
+            path = os.path.join(directory, "games.wofe")
+            if os.path.exists(path):
+                os.remove(path)
+            with EventLog(path) as event_log:
+                games, duration = play(phrases, args.players, event_log)
+            recorded_time = min(recorded_time, duration)
+        size = os.path.getsize(path)
+
+        start = perf_counter()
+        records = list(read_log(path))
+        read_time = perf_counter() - start
+
+    turns = sum(record.turn_count for record in records)
+    print(f"hraní bez záznamu {plain_time:.2f} s, se záznamem "
+          f"{recorded_time:.2f} s ({recorded_time / plain_time - 1:+.1%})")
+    print(f"{len(records)} her, {turns} tahů, {size} B "
+          f"({size / turns:.2f} B/tah, samotné tahy "
+          f"{sum(len(record.events) for record in records) / turns:.2f} "
+          f"B/tah), načtení {read_time * 1000:.0f} ms")
+
+    start = perf_counter()
+    replayed = [record.replay() for record in records]
+    replay_time = perf_counter() - start
+    start = perf_counter()
+    scores = [record.scores() for record in records]
+    scores_time = perf_counter() - start
+    print(f"přehrání her  {turns / replay_time:>12.0f} tahů/s")
+    print(f"jen skóre     {turns / scores_time:>12.0f} tahů/s")
+    print(f"hraní         {turns / plain_time:>12.0f} tahů/s")
+
+    same = all(
+        game.scores == again.scores == score
+        and tuple(game.guessed_letters) == tuple(again.guessed_letters)
+        and game.phrase.current_phrase == again.phrase.current_phrase
+        for game, again, score in zip(games, replayed, scores))
+    if not same or len(records) != len(games):
+        sys.exit("Přehrané hry se neshodují s odehranými!")
+    print("přehrané hry se shodují s odehranými")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Benchmark správce souběžných her.
+
+Pro rostoucí počet souběžných her přidá hry do správce `GameManager`,
+změří paměť, kterou hry zabírají, a poté je všechny po dávkách dohraje.
+Vypisuje počet dohraných her za sekundu a paměť na jednu hru.
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+from benchmarks import synthetic_phrases
+from src.game import default_wheel
+from src.game.manager import GameManager
+from src.player.entropy_driven_player import (
+    EntropyDrivenPlayerCZ, EntropyDrivenPlayerEN)
+
+
+def main():
+    """Spuštění benchmarku z příkazové řádky."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--games", type=int, nargs="+",
+                        default=[100, 1_000, 10_000])
+    parser.add_argument("--players", type=int, default=4)
+    parser.add_argument("--length", type=int, default=40)
+    args = parser.parse_args()
+
+    lineup = [EntropyDrivenPlayerCZ() if seat % 2 else EntropyDrivenPlayerEN()
+              for seat in range(args.players)]
+
+    for count in args.games:
+        phrases = synthetic_phrases(count, args.length)
+        wheel = default_wheel()
+        wheel.seed(0)
+        manager = GameManager(wheel)
+
+        gc.collect()
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        for phrase in phrases:
+            manager.add_game(phrase, lineup)
+        memory = tracemalloc.get_traced_memory()[0] - before
+        tracemalloc.stop()
+
+        start = time.perf_counter()
+        ticks = 0
+        while manager.active_games:
+            manager.tick()
+            ticks += 1
+        elapsed = time.perf_counter() - start
+
+        print(f"{count:>8} her: {count / elapsed:>10.0f} her/s, "
+              f"{memory / count:>6.0f} B/hra, {ticks} tiknutí")
+
+
+if __name__ == "__main__":
+    main()
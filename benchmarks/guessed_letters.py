@@ -0,0 +1,77 @@
+"""Benchmark evidence zkoušených písmen.
+
+Porovnává původní postup hry a hráče řízeného četností (kopie seznamu
+zkoušených písmen do n-tice při každém dotazu a lineární hledání prvního
+nezkoušeného písmene pořadí) s bitovou evidencí `GuessedLetters`, pohledem
+pro hráče a pořadím `LetterRanking`. Měří i odmítnutí opakovaného písmene.
+Před měřením ověřuje, že oba postupy volí stejná písmena.
+"""
+
+import argparse
+import random
+import timeit
+
+from src.game.letters import (ALPHABET, GuessedLetters, LetterRanking,
+                              guessed_mask)
+
+# Pořadí písmen podle četnosti v češtině (viz `EntropyDrivenPlayerCZ`)
+RANKING = "OENATVSILKRDPMUZJYCBHFGXWQ"
+
+
+def first_unguessed(already_guessed: tuple[str, ...]) -> str:
+    """Původní hledání prvního nezkoušeného písmene pořadí."""
+    for character in RANKING:
+        if character not in already_guessed:
+            return character
+
+
+def states(count: int) -> list[list[str]]:
+    """Funkce vrací náhodné seznamy zkoušených písmen různé délky."""
+    generator = random.Random(0)
+    return [generator.sample(ALPHABET, generator.randint(0, 25))
+            for _ in range(count)]
+
+
+def bench(label: str, function, count: int, repeat: int):
+    """Funkce změří a vypíše průměrnou dobu jednoho volání funkce."""
+    elapsed = min(timeit.repeat(function, number=1, repeat=repeat))
+    print(f"\t{label:<24} {elapsed / count * 1e9:>8.0f} ns/dotaz")
+
+
+def main():
+    """Spuštění benchmarku z příkazové řádky."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    lists = states(args.count)
+    evidences = [GuessedLetters(letters) for letters in lists]
+    views = [evidence.view for evidence in evidences]
+    ranking = LetterRanking(RANKING)
+    for letters, view in zip(lists, views):
+        assert (ranking.first_unguessed(guessed_mask(view))
+                == first_unguessed(tuple(letters)))
+
+    print("Další písmeno pořadí (včetně předání zkoušených písmen hráči):")
+    bench("n-tice a hledání",
+          lambda: [first_unguessed(tuple(letters)) for letters in lists],
+          args.count, args.repeat)
+    bench("pohled a bitová maska",
+          lambda: [ranking.first_unguessed(guessed_mask(view))
+                   for view in views],
+          args.count, args.repeat)
+
+    print("Test opakovaného písmene:")
+    probes = [(letters, letters[-1] if letters else "A") for letters in lists]
+    bench("seznam", lambda: [letter in letters for letters, letter in probes],
+          args.count, args.repeat)
+    probes = [(evidence, letters[-1].lower() if letters else "Á")
+              for evidence, letters in zip(evidences, lists)]
+    bench("bitová množina",
+          lambda: [letter in evidence for evidence, letter in probes],
+          args.count, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Ověření a benchmark zkompilovaného jádra hry (viz `src.game.kernel`).
+
+Odehraje tytéž hry se stejně inicializovanými koly nejprve referenční
+implementací v čistém Pythonu (`python_play_turn` a `PythonSecretPhrase`)
+a poté vybranou implementací jádra (`play_turn` a `FastSecretPhrase`).
+Ověří, že se shodují výsledky tahů, zkoušená písmena, skóre i stav
+generátoru náhodných čísel kola, a vypíše počet tahů za sekundu obou
+implementací. Hraje se s kolem se stejnými i s různými vahami klínů, ve hře
+více hráčů, jediného hráče i v hře odvozené třídy (obecná cesta jádra).
+
+Není-li jádro zkompilované, srovnává referenční implementaci samu se sebou.
+"""
+
+import argparse
+import sys
+from time import perf_counter
+
+from benchmarks import synthetic_phrases
+from src.game import default_wheel
+from src.game.game import MultiplayerGame, SinglePlayerGame
+from src.game.kernel import (ACCELERATED, FastSecretPhrase, PythonSecretPhrase,
+                             play_turn, python_play_turn)
+from src.game.turn import GIVE_UP
+from src.game.wheel import Wedge, Wheel
+from src.player.entropy_driven_player import (
+    EntropyDrivenPlayerCZ, EntropyDrivenPlayerEN)
+
+
+class _DerivedGame(MultiplayerGame):
+    """Hra odvozené třídy, pro kterou jádro postupuje obecně."""
+
+
+def weighted_wheel() -> Wheel:
+    """Funkce vrací výchozí kolo s různými vahami klínů."""
+    return Wheel([Wedge(wedge.name, wedge.multiplier, 1 + position % 3)
+                  for position, wedge in enumerate(default_wheel().wedges)])
+
+
+def play(phrases: list[str], wheel: Wheel, create_game, turn,
+         phrase_factory, max_turns: int = 10_000) -> tuple[list, float]:
+    """Funkce dohraje hry nad dodanými tajenkami a vrací dvojici (záznamy
+    průběhu her, čas strávený v tazích)."""
+    wheel.seed(0)
+    records = []
+    duration = 0.0
+    for text in phrases:
+        game = create_game(phrase_factory(text), wheel)
+        phrase = game.phrase
+        outcomes = []
+        start = perf_counter()
+        while not phrase.is_finished and len(outcomes) < max_turns:
+            outcome = turn(game)
+            outcomes.append(outcome)
+            if outcome == GIVE_UP:
+                break
+        duration += perf_counter() - start
+        records.append((outcomes, tuple(game.guessed_letters), game.scores,
+                        phrase.current_phrase, wheel._random.getstate()))
+    return records, duration
+
+
+def main():
+    """Spuštění ověření a benchmarku z příkazové řádky."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--games", type=int, default=500)
+    parser.add_argument("--length", type=int, default=40)
+    args = parser.parse_args()
+
+    print(f"zkompilované jádro: {'ano' if ACCELERATED else 'ne'}")
+    phrases = synthetic_phrases(args.games, args.length)
+    lineup = [EntropyDrivenPlayerCZ(), EntropyDrivenPlayerEN(),
+              EntropyDrivenPlayerCZ()]
+    games = {
+        "více hráčů": lambda phrase, wheel: MultiplayerGame(
+            phrase, wheel, lineup),
+        "jediný hráč": lambda phrase, wheel: SinglePlayerGame(
+            phrase, wheel, lineup[0]),
+        "odvozená hra": lambda phrase, wheel: _DerivedGame(
+            phrase, wheel, lineup),
+    }
+    wheels = {"stejné váhy": default_wheel, "různé váhy": weighted_wheel}
+
+    failed = False
+    for game_name, create_game in games.items():
+        for wheel_name, create_wheel in wheels.items():
+            reference, python_time = play(
+                phrases, create_wheel(), create_game, python_play_turn,
+                PythonSecretPhrase)
+            result, kernel_time = play(
+                phrases, create_wheel(), create_game, play_turn,
+                FastSecretPhrase)
+            turns = sum(len(record[0]) for record in reference)
+            same = result == reference
+            failed |= not same
+            print(f"{game_name:<13} {wheel_name:<12} "
+                  f"{'shoda' if same else 'ROZDÍL':<7}"
+                  f"python {turns / python_time:>9.0f} tahů/s, "
+                  f"jádro {turns / kernel_time:>9.0f} tahů/s "
+                  f"({python_time / kernel_time:.2f}×)")
+
+    if failed:
+        sys.exit("Implementace jádra se neshodují!")
+
+
+if __name__ == "__main__":
+    main()
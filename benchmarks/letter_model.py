@@ -0,0 +1,104 @@
+"""Benchmark budování jazykového modelu písmen a hráče, který jej používá.
+
+Vygeneruje syntetický korpus (věty ze slov syntetického slovníku, jejichž
+četnosti odpovídají Zipfovu zákonu) a vybuduje z něj model v jediném
+procesu i ve více procesech. Ověří, že oba modely i model po uložení a
+načtení mají shodné četnosti, a vypíše rychlost budování, velikost souboru
+modelu a dobu jeho načtení.
+
+Nakonec odehraje hry nad tajenkami ze stejného rozdělení slov mezi
+`NGramPlayer` a `EntropyDrivenPlayer` s pořadím písmen podle téhož modelu
+(oba hráči se střídají v pořadí) a vypíše jejich průměrné skóre a počet
+výher.
+"""
+
+import argparse
+import os
+import random
+import tempfile
+from itertools import accumulate
+from time import perf_counter
+
+from benchmarks import synthetic_words
+from src.game import default_wheel
+from src.game.simulation import Simulator
+from src.player.entropy_driven_player import EntropyDrivenPlayer
+from src.player.letter_model import (DEFAULT_CHUNK_SIZE, LetterModel,
+                                     build_model)
+from src.player.ngram_player import NGramPlayer
+
+
+def sentences(vocabulary: list[str], count: int, seed: int) -> list[str]:
+    """Funkce vygeneruje `count` vět z dodaných slov, jejichž četnosti
+    odpovídají Zipfovu zákonu podle pořadí ve slovníku."""
+    rng = random.Random(seed)
+    weights = list(accumulate(1 / rank
+                              for rank in range(1, len(vocabulary) + 1)))
+    return [" ".join(rng.choices(vocabulary, cum_weights=weights,
+                                 k=rng.randint(3, 8))).capitalize() + "."
+            for _ in range(count)]
+
+
+def main():
+    """Spuštění benchmarku z příkazové řádky."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--megabytes", type=float, default=16)
+    parser.add_argument("--words", type=int, default=20_000)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--chunk-size", type=int,
+                        default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--games", type=int, default=200)
+    args = parser.parse_args()
+
+    vocabulary = synthetic_words(args.words)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "corpus.txt")
+        with open(path, "w", encoding="utf-8") as file:
+            seed = 0
+            while file.tell() < args.megabytes * 2 ** 20:
+                file.write("\n".join(sentences(vocabulary, 10_000, seed)))
+                file.write("\n")
+                seed += 1
+        size = os.path.getsize(path) / 2 ** 20
+
+        models = []
+        for workers in sorted({1, args.workers}):
+            start = perf_counter()
+            models.append(build_model([path], args.chunk_size, workers))
+            duration = perf_counter() - start
+            print(f"procesů {workers}: {size:.1f} MB za {duration:.2f} s "
+                  f"({size / duration:.1f} MB/s)")
+
+        model_path = os.path.join(directory, "model.wofm")
+        models[0].save(model_path)
+        start = perf_counter()
+        loaded = LetterModel.from_file(model_path)
+        duration = perf_counter() - start
+        print(f"model {os.path.getsize(model_path)} B, načtení "
+              f"{duration * 1000:.2f} ms, pořadí písmen {loaded.ranking()}")
+
+    if any(model.counts != loaded.counts for model in models):
+        raise SystemExit("Modely se neshodují!")
+    print("modely se shodují")
+
+    phrases = sentences(vocabulary, args.games, seed=-1)
+    players = [NGramPlayer("N-GRAM NPC", loaded),
+               EntropyDrivenPlayer("ENTROPY-DRIVEN NPC", loaded.ranking())]
+    totals = [0, 0]
+    wins = [0, 0]
+    for order in (players, players[::-1]):
+        wheel = default_wheel()
+        wheel.seed(0)
+        for result in Simulator(wheel, order).run(phrases):
+            for seat, player in enumerate(order):
+                position = players.index(player)
+                totals[position] += result.scores[seat]
+                wins[position] += result.winner == seat
+    for position, player in enumerate(players):
+        print(f"{player.player_name:<20} průměrné skóre "
+              f"{totals[position] / (2 * len(phrases)):>8.0f}, "
+              f"výher {wins[position]}")
+
+
+if __name__ == "__main__":
+    main()
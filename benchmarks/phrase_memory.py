@@ -0,0 +1,50 @@
+"""Benchmark paměťové náročnosti tajenek.
+
+Porovnává paměť, kterou zabírá velké množství najednou načtených tajenek
+v podobě `SecretPhrase` (jedna instance `Letter` na znak) a úsporné
+`CompactSecretPhrase`. Paměť je měřena pomocí `tracemalloc`.
+"""
+
+import argparse
+import gc
+import tracemalloc
+
+from benchmarks import synthetic_phrases
+from src.game.phrase import CompactSecretPhrase, SecretPhrase
+
+
+def measure(phrase_type: type, phrases: list[str]) -> int:
+    """Funkce vrací počet bajtů, které zabírají tajenky dodaného typu
+    vybudované ze všech dodaných textů."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    built = [phrase_type(phrase) for phrase in phrases]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del built
+    return after - before
+
+
+def main():
+    """Spuštění benchmarku z příkazové řádky."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=20_000)
+    parser.add_argument("--length", type=int, nargs="+",
+                        default=[20, 60, 200])
+    args = parser.parse_args()
+
+    text_size = 0
+    for length in args.length:
+        phrases = synthetic_phrases(args.count, length)
+        text_size = sum(len(phrase.encode()) for phrase in phrases)
+        print(f"{args.count} tajenek o délce ~{length} znaků "
+              f"(text: {text_size / args.count:.0f} B/tajenka)")
+        for phrase_type in (SecretPhrase, CompactSecretPhrase):
+            size = measure(phrase_type, phrases)
+            print(f"\t{phrase_type.__name__:<20} "
+                  f"{size / args.count:>10.0f} B/tajenka")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Benchmark doby rozhodování slovníkových hráčů.
+
+Pro syntetický slovník a syntetické tajenky složené z jeho slov odehraje
+hry jednotlivých hráčů pomocí simulátoru a měří dobu každého volání
+`guess_letter`. Vypisuje medián, 99. percentil a průměr doby jednoho tahu
+a průměrný počet pokusů na jednu tajenku. Kromě skutečné doby měří i
+procesorový čas vlákna, do kterého se nepočítá, když je proces na sdíleném
+stroji přerušen (na vytíženém stroji jinak skutečnou dobu tahu, a tedy
+hlavně 99. percentil, ovlivňují přerušení v řádu milisekund).
+"""
+
+import argparse
+import statistics
+import time
+from typing import Iterable
+
+from benchmarks import synthetic_phrases, synthetic_words
+from src.game import default_wheel
+from src.game.simulation import Simulator
+from src.player.abstract_player import AbstractPlayer
+from src.player.dictionary_player import DictionaryPlayer
+from src.player.information_player import InformationPlayer
+from src.player.word_index import WordIndex
+
+
+class TimedPlayer(AbstractPlayer):
+    """Obal hráče, který měří dobu jeho rozhodování."""
+
+    def __init__(self, player: AbstractPlayer):
+        """Initor, který přijímá měřeného hráče."""
+        super().__init__(player.player_name)
+        self._player = player
+        self._timings: list[float] = []
+        self._cpu_timings: list[float] = []
+
+    @property
+    def timings(self) -> list[float]:
+        """Naměřené doby jednotlivých tahů v sekundách."""
+        return self._timings
+
+    @property
+    def cpu_timings(self) -> list[float]:
+        """Procesorové časy jednotlivých tahů v sekundách."""
+        return self._cpu_timings
+
+    def guess_letter(self, already_guessed: Iterable[str], phrase: str) -> str:
+        """Metoda změří dobu rozhodování obaleného hráče."""
+        start = time.perf_counter()
+        cpu_start = time.thread_time()
+        guess = self._player.guess_letter(already_guessed, phrase)
+        self._cpu_timings.append(time.thread_time() - cpu_start)
+        self._timings.append(time.perf_counter() - start)
+        return guess
+
+
+def main():
+    """Spuštění benchmarku z příkazové řádky."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--words", type=int, default=200_000)
+    parser.add_argument("--phrases", type=int, default=200)
+    parser.add_argument("--length", type=int, default=40)
+    args = parser.parse_args()
+
+    phrases = synthetic_phrases(args.phrases, args.length)
+    words = synthetic_words(args.words) + [
+        word for phrase in phrases for word in phrase[:-1].split()]
+
+    start = time.perf_counter()
+    index = WordIndex(words)
+    print(f"Index {len(index)} slov vybudován za "
+          f"{time.perf_counter() - start:.2f} s")
+
+    for player in (DictionaryPlayer("DICTIONARY", index),
+                   InformationPlayer("INFORMATION", index),
+                   InformationPlayer("SCORE", index, InformationPlayer.SCORE)):
+        timed = TimedPlayer(player)
+        wheel = default_wheel()
+        wheel.seed(0)
+        simulator = Simulator(wheel, [timed])
+
+        # Zahřátí (líně budované masky indexu)
+        simulator.run(phrases[:5])
+        timed.timings.clear()
+        timed.cpu_timings.clear()
+
+        results = simulator.run(phrases)
+        print(f"\t{player.player_name:<12}  pokusů/tajenka "
+              f"{sum(r.guesses for r in results) / len(results):5.1f}")
+        for label, timings in (("doba", timed.timings),
+                               ("CPU", timed.cpu_timings)):
+            timings = sorted(timings)
+            print(f"\t\t{label:<5}"
+                  f" p50 {statistics.median(timings) * 1e3:6.3f} ms"
+                  f"  p99 {timings[int(len(timings) * 0.99)] * 1e3:6.3f} ms"
+                  f"  průměr {statistics.fmean(timings) * 1e3:6.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Benchmark rolloutů hráče Monte Carlo.
+
+Pro syntetický slovník a tajenku složenou z jeho slov změří, kolik rolloutů
+za sekundu odehraje `MonteCarloPlayer` v jednom tahu, a to v jediném
+procesu i s rollouty rozloženými do více procesů. Nakonec odehraje několik
+her proti `EntropyDrivenPlayerCZ` a vypíše průměrné skóre obou hráčů.
+"""
+
+import argparse
+from time import perf_counter
+
+from benchmarks import synthetic_phrases, synthetic_words
+from src.game import default_wheel
+from src.game.game import MultiplayerGame
+from src.game.simulation import Simulator
+from src.player.entropy_driven_player import EntropyDrivenPlayerCZ
+from src.player.monte_carlo_player import MonteCarloPlayer
+from src.player.word_index import WordIndex
+
+
+def main():
+    """Spuštění benchmarku z příkazové řádky."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--words", type=int, default=50_000)
+    parser.add_argument("--length", type=int, default=40)
+    parser.add_argument("--budget", type=float, default=0.2)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--games", type=int, default=20)
+    args = parser.parse_args()
+
+    phrases = synthetic_phrases(args.games + 1, args.length)
+    index = WordIndex(synthetic_words(args.words) + [
+        word for phrase in phrases for word in phrase[:-1].split()])
+    wheel = default_wheel()
+    phrase = "".join("_" if letter.isalpha() else letter
+                     for letter in phrases[0])
+
+    for workers in args.workers:
+        player = MonteCarloPlayer("MC", index, wheel, args.budget,
+                                  workers=workers, seed=0)
+        player.guess_letter([], phrase)  # zahřátí (start procesů)
+        before = player.rollouts
+        start = perf_counter()
+        player.guess_letter(["E"], phrase)
+        duration = perf_counter() - start
+        player.close()
+        print(f"procesů {workers}: "
+              f"{(player.rollouts - before) / duration:>10.0f} rolloutů/s")
+
+    player = MonteCarloPlayer("MC", index, wheel, args.budget / 10, seed=0)
+    opponent = EntropyDrivenPlayerCZ()
+
+    def attached_game(phrase, game_wheel, players):
+        game = MultiplayerGame(phrase, game_wheel, players)
+        player.attach(game)
+        return game
+
+    wheel.seed(0)
+    results = Simulator(wheel, [player, opponent],
+                        game_factory=attached_game).run(phrases[1:])
+    for seat, name in enumerate(("MC", opponent.player_name)):
+        mean = sum(result.scores[seat] for result in results) / len(results)
+        wins = sum(result.winner == seat for result in results)
+        print(f"{name:<26} průměrné skóre {mean:>8.0f}, výher {wins}")
+
+
+if __name__ == "__main__":
+    main()
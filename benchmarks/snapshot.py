@@ -0,0 +1,116 @@
+"""Ověření a benchmark snímků rozehraných her (viz `src.game.snapshot`).
+
+Rozehraje syntetické hry, v polovině každé pořídí snímek a převede jej do
+binárního tvaru. Z něj obnoví novou hru (s novým kolem, jehož generátor se
+obnoví ze snímku), obě hry dohraje a ověří, že skončily stejně. Ověří také
+větvení: hra se po dohrání vrátí metodou `restore` do stavu snímku a znovu
+dohraje se stejným výsledkem.
+
+Nakonec vypíše, kolik snímků za sekundu lze pořídit a obnovit (v paměti i
+přes binární tvar) a pro srovnání kolik kopií téže hry zvládne `deepcopy`
+a `pickle`, a velikost binárního snímku.
+"""
+
+import argparse
+import copy
+import pickle
+import sys
+from time import perf_counter
+
+from benchmarks import synthetic_phrases
+from src.game import default_wheel
+from src.game.game import MultiplayerGame
+from src.game.kernel import FastSecretPhrase, play_turn
+from src.game.phrase import SecretPhrase
+from src.game.snapshot import GameSnapshot
+from src.game.turn import GIVE_UP
+from src.player.entropy_driven_player import (
+    EntropyDrivenPlayerCZ, EntropyDrivenPlayerEN)
+
+
+def finish(game, max_turns: int = 10_000) -> tuple:
+    """Funkce dohraje hru a vrací její výsledný stav."""
+    phrase = game.phrase
+    for _ in range(max_turns):
+        if phrase.is_finished or play_turn(game) == GIVE_UP:
+            break
+    return game.scores, tuple(game.guessed_letters), phrase.current_phrase
+
+
+def rate(function, count: int) -> float:
+    """Funkce vrací, kolikrát za sekundu lze zavolat dodanou funkci."""
+    start = perf_counter()
+    for _ in range(count):
+        function()
+    return count / (perf_counter() - start)
+
+
+def main():
+    """Spuštění ověření a benchmarku z příkazové řádky."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--games", type=int, default=500)
+    parser.add_argument("--players", type=int, default=3)
+    parser.add_argument("--length", type=int, default=40)
+    parser.add_argument("--count", type=int, default=5_000)
+    args = parser.parse_args()
+
+    lineup = [EntropyDrivenPlayerCZ() if seat % 2 else EntropyDrivenPlayerEN()
+              for seat in range(args.players)]
+    failed = 0
+    sample = None
+    for number, text in enumerate(synthetic_phrases(args.games,
+                                                    args.length)):
+        factory = FastSecretPhrase if number % 2 else SecretPhrase
+        wheel = default_wheel()
+        wheel.seed(number)
+        game = MultiplayerGame(factory(text), wheel, lineup)
+        for _ in range(len(text) // 3):
+            if game.phrase.is_finished:
+                break
+            play_turn(game)
+
+        snapshot = game.snapshot()
+        data = snapshot.to_bytes()
+        restored = MultiplayerGame.from_snapshot(
+            GameSnapshot.from_bytes(data), default_wheel(), lineup,
+            phrase_factory=factory)
+        expected = finish(game)
+        failed += finish(restored) != expected
+        game.restore(snapshot)
+        failed += finish(game) != expected
+        if number == 0:
+            sample = (game, snapshot, data)
+
+    if failed:
+        sys.exit(f"Obnovené hry se neshodují s původními: {failed}")
+    print(f"{args.games} obnovených her se shoduje s původními")
+
+    game, snapshot, data = sample
+    game.restore(snapshot)
+    without_random = game.snapshot(with_random_state=False)
+    print(f"velikost snímku {len(data)} B, bez stavu generátoru "
+          f"{len(without_random.to_bytes())} B")
+    print(f"snapshot                {rate(game.snapshot, args.count):>9.0f}/s")
+    print(f"snapshot bez generátoru "
+          f"{rate(lambda: game.snapshot(False), args.count):>9.0f}/s")
+    print(f"restore                 "
+          f"{rate(lambda: game.restore(snapshot), args.count):>9.0f}/s")
+    print(f"to_bytes                "
+          f"{rate(snapshot.to_bytes, args.count):>9.0f}/s")
+
+    def load():
+        return MultiplayerGame.from_snapshot(
+            GameSnapshot.from_bytes(data), game.wheel, lineup)
+
+    def roundtrip():
+        return pickle.loads(pickle.dumps(game))
+
+    print(f"from_bytes + from_snapshot {rate(load, args.count):>6.0f}/s")
+    print(f"deepcopy                "
+          f"{rate(lambda: copy.deepcopy(game), args.count // 10):>9.0f}/s")
+    print(f"pickle + unpickle       "
+          f"{rate(roundtrip, args.count // 10):>9.0f}/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""Benchmark přesného řešitele hry pro jediného hráče.
+
+Pro syntetické tajenky s rostoucím počtem různých písmen měří dobu výpočtu
+nejlepšího očekávaného skóre (`ExpectedValueSolver`) a počet spočítaných
+stavů oproti počtu stavů bez využití symetrie (`2 ** počet písmen`).
+"""
+
+import argparse
+from time import perf_counter
+
+from benchmarks import synthetic_phrases
+from src.game import default_wheel
+from src.game.solver import ExpectedValueSolver
+
+
+def main():
+    """Spuštění benchmarku z příkazové řádky."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--length", type=int, nargs="+",
+                        default=[20, 40, 80, 160])
+    args = parser.parse_args()
+
+    wheel = default_wheel()
+    for length in args.length:
+        phrase = synthetic_phrases(1, length)[0]
+        start = perf_counter()
+        solver = ExpectedValueSolver(phrase, wheel)
+        score = solver.expected_score
+        duration = perf_counter() - start
+
+        letters = solver.analytics.distinct_letters
+        print(f"délka {len(phrase):>4}, písmen {letters:>2}: "
+              f"skóre {score:>10.1f}, stavů {solver.states:>7} "
+              f"(bez symetrie {2 ** letters:>9}), {duration * 1000:>8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,310 @@
+"""Sada benchmarků hádání v tajence, točení kolem, rozhodování hráčů a celých
+her s porovnáním výsledků mezi běhy.
+
+Benchmarky jsou registrovány dekorátorem `benchmark` spolu s hodnotami
+parametrů (délky tajenek, počty hráčů, implementace); měří se každá
+kombinace. Funkce benchmarku připraví data (do měření se nezapočítává) a
+vrací funkci, jejíž volání se měří. Všechna data i kola jsou inicializována
+pevnými semínky, takže každý běh měří přesně tutéž práci.
+
+Použití:
+
+- `python -m benchmarks.suite run --output vysledky.json` změří všechny
+  benchmarky (případně jen ty, jejichž název obsahuje `--filter`) a uloží
+  výsledky do JSON,
+- `python -m benchmarks.suite compare zaklad.json novy.json --threshold 0.1`
+  porovná nejkratší doby (volbou `--statistic` mediány) dvou běhů a skončí
+  s nenulovým kódem, pokud je některý benchmark pomalejší o více než danou
+  relativní mez.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import statistics
+import sys
+from datetime import datetime, timezone
+from itertools import product
+from time import perf_counter
+from typing import Callable
+
+from benchmarks import ALPHABET, synthetic_phrases, synthetic_words
+from src.game import default_wheel
+from src.game.game import MultiplayerGame
+from src.game.instrumentation import Instrumentation
+from src.game.kernel import ACCELERATED
+from src.game.moderator import Moderator
+from src.game.phrase import CompactSecretPhrase, SecretPhrase
+from src.game.simulation import Simulator
+from src.game.wheel import Wedge, Wheel
+from src.player.dictionary_player import DictionaryPlayer
+from src.player.entropy_driven_player import (
+    EntropyDrivenPlayerCZ, EntropyDrivenPlayerEN)
+from src.player.word_index import WordIndex
+
+# Verze formátu souboru s výsledky
+FORMAT_VERSION = 1
+
+# Registrované benchmarky: název -> (funkce, hodnoty parametrů)
+BENCHMARKS: dict[str, tuple[Callable, dict[str, list]]] = {}
+
+# Implementace tajenky podle názvu
+PHRASES = {"SecretPhrase": SecretPhrase,
+           "CompactSecretPhrase": CompactSecretPhrase}
+
+# Pořadí, ve kterém se v přípravě dat hádají písmena
+RANKING = "OENATVSILKRDPMUZJYCBHFGXWQ"
+
+
+def benchmark(**params: list) -> Callable:
+    """Dekorátor, který zaregistruje benchmark s dodanými hodnotami
+    parametrů (klíčové argumenty funkce benchmarku)."""
+    def register(function: Callable) -> Callable:
+        BENCHMARKS[function.__name__] = (function, params)
+        return function
+    return register
+
+
+def lineup(players: int) -> list:
+    """Funkce vrací sestavu `players` hráčů."""
+    return [EntropyDrivenPlayerCZ() if seat % 2 else EntropyDrivenPlayerEN()
+            for seat in range(players)]
+
+
+def weighted_wheel() -> Wheel:
+    """Funkce vrací výchozí kolo s různými vahami klínů."""
+    return Wheel([Wedge(wedge.name, wedge.multiplier, 1 + position % 3)
+                  for position, wedge in enumerate(default_wheel().wedges)])
+
+
+def decision_states(phrases: list[str]) -> list[tuple[tuple, str]]:
+    """Funkce vrací stavy her (zkoušená písmena, aktuální podoba tajenky),
+    ve kterých se hráč rozhoduje, když se písmena hádají podle četnosti."""
+    states = []
+    for text in phrases:
+        phrase = CompactSecretPhrase(text)
+        guessed = []
+        for letter in RANKING:
+            if phrase.is_finished:
+                break
+            states.append((tuple(guessed), phrase.current_phrase))
+            phrase.guess(letter)
+            guessed.append(letter)
+    return states
+
+
+@benchmark(length=[20, 80, 320], implementation=list(PHRASES))
+def phrase_guess(length: int, implementation: str) -> Callable:
+    """Vybudování tajenek a hádání všech písmen abecedy."""
+    factory = PHRASES[implementation]
+    phrases = synthetic_phrases(50, length)
+
+    def run():
+        for text in phrases:
+            phrase = factory(text)
+            for letter in ALPHABET:
+                phrase.guess(letter)
+                phrase.current_phrase
+    return run
+
+
+@benchmark(weights=["uniform", "weighted"])
+def wheel_rotate(weights: str) -> Callable:
+    """Jednotlivá zatočení kolem."""
+    wheel = default_wheel() if weights == "uniform" else weighted_wheel()
+
+    def run():
+        wheel.seed(0)
+        rotate = wheel.rotate
+        for _ in range(20_000):
+            rotate()
+    return run
+
+
+@benchmark(weights=["uniform", "weighted"])
+def wheel_rotate_many(weights: str) -> Callable:
+    """Dávkové generování zatočení kolem."""
+    wheel = default_wheel() if weights == "uniform" else weighted_wheel()
+
+    def run():
+        wheel.seed(0)
+        wheel.rotate_many(100_000)
+    return run
+
+
+@benchmark(player=["entropy", "dictionary"], length=[20, 80])
+def player_guess(player: str, length: int) -> Callable:
+    """Rozhodnutí hráče v rozehraných hrách (`guess_letter`)."""
+    phrases = synthetic_phrases(20, length)
+    if player == "entropy":
+        guesser = EntropyDrivenPlayerCZ()
+    else:
+        index = WordIndex(synthetic_words(20_000) + [
+            word for phrase in phrases for word in phrase[:-1].split()])
+        guesser = DictionaryPlayer("Slovník", index)
+    states = decision_states(phrases)
+
+    def run():
+        for guessed, current in states:
+            guesser.guess_letter(guessed, current)
+    return run
+
+
+@benchmark(players=[1, 2, 4], length=[20, 80])
+def simulator_games(players: int, length: int) -> Callable:
+    """Celé hry odehrané bezhlavým simulátorem."""
+    phrases = synthetic_phrases(50, length)
+    wheel = default_wheel()
+    simulator = Simulator(wheel, lineup(players))
+
+    def run():
+        wheel.seed(0)
+        simulator.run(phrases)
+    return run
+
+
+@benchmark(players=[1, 2, 4], length=[20, 80], instrumented=[False, True])
+def moderator_games(players: int, length: int, instrumented: bool
+                    ) -> Callable:
+    """Celé hry řízené umlčeným moderátorem (`Moderator.run_game`), volitelně
+    s instrumentací."""
+    phrases = synthetic_phrases(20, length)
+    wheel = default_wheel()
+    seats = lineup(players)
+    instrumentation = Instrumentation() if instrumented else None
+
+    def run():
+        wheel.seed(0)
+        # Moderátor i umlčený vypisuje tajenku a skóre
+        with contextlib.redirect_stdout(io.StringIO()):
+            for text in phrases:
+                Moderator(MultiplayerGame(text, wheel, seats), quiet=True,
+                          instrumentation=instrumentation).run_game()
+    return run
+
+
+def cases(pattern: str = "") -> list[tuple[str, Callable, dict]]:
+    """Funkce vrací všechny kombinace parametrů registrovaných benchmarků
+    jako trojice (klíč, funkce, parametry), jejichž klíč obsahuje
+    `pattern`."""
+    selected = []
+    for name, (function, params) in BENCHMARKS.items():
+        for values in product(*params.values()):
+            arguments = dict(zip(params, values))
+            key = name + "[" + ",".join(
+                f"{param}={value}" for param, value in arguments.items()) + "]"
+            if pattern in key:
+                selected.append((key, function, arguments))
+    return selected
+
+
+def measure(run: Callable, repeat: int) -> dict:
+    """Funkce změří `repeat` volání dodané funkce (po jednom zahřívacím) a
+    vrací souhrn naměřených dob v sekundách."""
+    run()
+    timings = []
+    for _ in range(repeat):
+        start = perf_counter()
+        run()
+        timings.append(perf_counter() - start)
+    return {"min": min(timings), "median": statistics.median(timings),
+            "mean": statistics.fmean(timings), "repeat": repeat}
+
+
+def run_suite(pattern: str = "", repeat: int = 5, report=print) -> dict:
+    """Funkce změří vybrané benchmarky a vrací výsledky ve formátu souboru
+    s výsledky."""
+    results = {}
+    for key, function, arguments in cases(pattern):
+        results[key] = measure(function(**arguments), repeat)
+        report(f"{key:<60} {results[key]['median'] * 1000:>10.2f} ms")
+    return {
+        "version": FORMAT_VERSION,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "accelerated": ACCELERATED,
+        "results": results,
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float,
+            statistic: str = "min"
+            ) -> tuple[list[str], list[tuple[str, float]]]:
+    """Funkce porovná dodanou statistiku doby (`min` nebo `median`) dvou
+    běhů a vrací dvojici (řádky zprávy, benchmarky pomalejší o více než
+    `threshold` spolu s poměrem dob)."""
+    lines = []
+    regressions = []
+    for key, result in current["results"].items():
+        before = baseline["results"].get(key)
+        if before is None:
+            lines.append(f"{key:<60} {'nový':>10}")
+            continue
+        ratio = result[statistic] / before[statistic]
+        if ratio > 1 + threshold:
+            status = "POMALEJŠÍ"
+            regressions.append((key, ratio))
+        elif ratio < 1 - threshold:
+            status = "rychlejší"
+        else:
+            status = ""
+        lines.append(f"{key:<60} {ratio:>9.2f}× {status}")
+    for key in sorted(baseline["results"].keys() - current["results"].keys()):
+        lines.append(f"{key:<60} {'chybí':>10}")
+    return lines, regressions
+
+
+def load(path: str) -> dict:
+    """Funkce načte soubor s výsledky a ověří jeho verzi."""
+    with open(path, encoding="utf-8") as file:
+        data = json.load(file)
+    if data.get("version") != FORMAT_VERSION:
+        raise ValueError(f"Nepodporovaná verze výsledků: {path}")
+    return data
+
+
+def main():
+    """Spuštění sady benchmarků z příkazové řádky."""
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawTextHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="změří benchmarky")
+    run_parser.add_argument("--output", help="soubor JSON pro výsledky")
+    run_parser.add_argument("--filter", default="",
+                            help="měří jen benchmarky obsahující text")
+    run_parser.add_argument("--repeat", type=int, default=5)
+
+    compare_parser = commands.add_parser("compare", help="porovná dva běhy")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.1,
+                                help="relativní mez zpomalení (0.1 = 10 %%)")
+    compare_parser.add_argument("--statistic", choices=("min", "median"),
+                                default="min")
+
+    commands.add_parser("list", help="vypíše benchmarky")
+    args = parser.parse_args()
+
+    if args.command == "list":
+        for key, _, _ in cases():
+            print(key)
+    elif args.command == "run":
+        data = run_suite(args.filter, args.repeat)
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as file:
+                json.dump(data, file, indent=2)
+    else:
+        lines, regressions = compare(load(args.baseline), load(args.current),
+                                     args.threshold, args.statistic)
+        print("\n".join(lines))
+        if regressions:
+            sys.exit(f"Zpomalení nad {args.threshold:.0%}: "
+                     f"{len(regressions)} benchmarků")
+
+
+if __name__ == "__main__":
+    main()
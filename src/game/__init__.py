@@ -4,15 +4,16 @@ hodnoty."""
 from src.game.wheel import Wedge, Wheel
 
 
-def create_wedge(multiplier: int) -> Wedge:
-    """Pomocná funkce, která vygeneruje výherní klín pro dodaný multiplikátor.
+def create_wedge(multiplier: int, weight: float = 1) -> Wedge:
+    """Pomocná funkce, která vygeneruje výherní klín pro dodaný multiplikátor
+    a volitelně i relativní šířku klínu na kole.
     """
-    return Wedge(f"${multiplier}", multiplier)
+    return Wedge(f"${multiplier}", multiplier, weight)
 
 
-def create_bankrupt_wedge() -> Wedge:
+def create_bankrupt_wedge(weight: float = 1) -> Wedge:
     """Pomocná funkce, která vygeneruje klín bankrotu."""
-    return Wedge(Wedge.BANKRUPT_NAME, 0)
+    return Wedge(Wedge.BANKRUPT_NAME, 0, weight)
 
 
 def default_wheel() -> Wheel:
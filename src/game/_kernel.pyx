@@ -0,0 +1,265 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""Zkompilované jádro hry (Cython).
+
+Obsahuje zkompilované varianty funkce `src.game.turn.play_turn` a hádání
+v tajence `CompactSecretPhrase.guess` se shodnými výsledky. Modul se
+nepoužívá přímo, implementaci vybírá `src.game.kernel`.
+
+Pro hry, kola, klíny a tajenky přesně standardních tříd (ne jejich potomků)
+čte `play_turn` jejich stav přímo, bez volání metod a vlastností; jinak
+postupuje obecně přes jejich veřejné rozhraní. Výsledky, včetně pořadí
+spotřebovaných náhodných čísel, jsou v obou případech shodné.
+
+Sestavení: `cythonize -i src/game/_kernel.pyx`"""
+
+from random import Random
+
+from src.game.game import MultiplayerGame, SinglePlayerGame
+from src.game.phrase import (
+    FOLDED_RANGE, CompactSecretPhrase, GuessError, Letter)
+from src.game.turn import BANKRUPT, GIVE_UP, HIT, MAX_INVALID_GUESSES, MISS
+from src.game.wheel import Wedge, Wheel
+
+
+# Předpočítané porovnávací tvary (`Letter.process`) znaků z rozsahu
+# `FOLDED_RANGE`
+cdef dict _PROCESSED = {chr(code_point): Letter.process(chr(code_point))
+                        for code_point in FOLDED_RANGE}
+
+
+cdef Py_ssize_t _guess(phrase, str key):
+    """Odkryje v úsporné tajence pozice jednoznakového porovnávacího tvaru
+    `key` a vrací jejich počet."""
+    cdef str keys = phrase._keys
+    cdef Py_UCS4 wanted = key[0]
+    cdef Py_ssize_t position, count
+    cdef Py_ssize_t length = len(keys)
+
+    revealed = phrase._revealed
+    positions = []
+    for position in range(length):
+        if keys[position] == wanted and not revealed >> position & 1:
+            positions.append(position)
+
+    count = len(positions)
+    if count:
+        # Pozice jako objekty Pythonu, aby posun nepřetekl rozsah C typu
+        for offset in positions:
+            revealed |= 1 << offset
+        phrase._revealed = revealed
+        phrase._hidden -= count
+        phrase._current = _patch(phrase, positions)
+    return count
+
+
+cdef object _patch(phrase, list positions):
+    """Vrací aktuální podobu tajenky s nově odkrytými pozicemi (viz
+    `CompactSecretPhrase._patch`)."""
+    current = phrase._current
+    text = phrase._phrase
+    if current is None or len(current) != len(text):
+        return None
+
+    characters = list(current)
+    for position in positions:
+        characters[position] = text[position].upper()
+    return "".join(characters)
+
+
+cdef Py_ssize_t _randbelow(getrandbits, Py_ssize_t size):
+    """Vrací náhodný index menší než `size` se stejnou spotřebou náhodných
+    čísel jako `Random.choice`.
+
+    Jde o kopii soukromé metody `Random._randbelow` (varianty
+    `_randbelow_with_getrandbits`) standardní knihovny, jejíž implementace
+    není zaručena. Zda se s ní kopie shoduje, ověřuje při načtení modulu
+    `_choice_matches`; jinak se kolo točí metodou `Wheel.rotate`."""
+    cdef Py_ssize_t bits = size.bit_length()
+    cdef Py_ssize_t value = getrandbits(bits)
+    while value >= size:
+        value = getrandbits(bits)
+    return value
+
+
+def _choice_matches() -> bool:
+    """Funkce ověří, že `_randbelow` vrací tytéž indexy a spotřebuje tatáž
+    náhodná čísla jako `Random.choice` tohoto interpretu."""
+    for size in (1, 2, 3, 5, 7, 8, 13, 24, 100):
+        expected = Random(size)
+        actual = Random(size)
+        for _ in range(64):
+            if expected.choice(range(size)) != _randbelow(
+                    actual.getrandbits, size):
+                return False
+        if expected.getstate() != actual.getstate():
+            return False
+    return True
+
+
+# Shoduje-li se `_randbelow` s `Random.choice`, tedy smí-li ji `_rotate`
+# použít místo volání `Wheel.rotate`
+cdef bint _INLINE_CHOICE = _choice_matches()
+
+
+cdef object _rotate(wheel):
+    """Zatočí kolem; pro kolo třídy `Wheel` bez volání `Wheel.rotate`, ale
+    se stejnou spotřebou náhodných čísel (kolo se stejnými vahami klínů jen
+    shoduje-li se `_randbelow` s `Random.choice`)."""
+    cdef Py_ssize_t index
+    cdef double scaled
+    if type(wheel) is not Wheel or type(wheel._random) is not Random:
+        return wheel.rotate()
+
+    wedges = wheel._wedges
+    if wheel._is_uniform:
+        if not _INLINE_CHOICE:
+            return wheel.rotate()
+        return wedges[_randbelow(wheel._random.getrandbits, len(wedges))]
+
+    scaled = wheel._random.random() * len(wedges)
+    index = <Py_ssize_t>scaled
+    if scaled - index >= wheel._probabilities[index]:
+        index = wheel._aliases[index]
+    return wedges[index]
+
+
+class FastSecretPhrase(CompactSecretPhrase):
+    """Varianta `CompactSecretPhrase`, jejíž hádání prochází porovnávací
+    tvary znaků ve zkompilované smyčce."""
+
+    __slots__ = ()
+
+    def guess(self, letter):
+        """Funkce, která vrací počet nalezených výskytů daného písmene v
+        tajence. Pokud dodaný počet znaků odhadovaného řetězce není roven 1,
+        je vyhozena výjimka.
+        """
+        if len(letter) != 1:
+            raise GuessError(f"Povolen je právě jeden znak: '{letter}'!")
+
+        key = Letter.process(letter) or self.EMPTY_KEY
+        if len(key) != 1:
+            # Víceznakový tvar (např. 'ß' -> 'SS') hledá předek
+            return CompactSecretPhrase.guess(self, letter)
+
+        return _guess(self, key)
+
+    def _patch(self, positions):
+        """Metoda vrací aktuální podobu tajenky, ve které jsou oproti
+        předchozí podobě odkryty dodané pozice (viz
+        `CompactSecretPhrase._patch`)."""
+        return _patch(self, list(positions))
+
+
+def play_turn(game):
+    """Funkce odehraje jeden tah hráče, který je ve hře na tahu, a vrací
+    jeho výsledek (viz `src.game.turn.play_turn`)."""
+    if type(game) is MultiplayerGame or type(game) is SinglePlayerGame:
+        return _play_stock_turn(game)
+    return _play_turn(game)
+
+
+cdef object _play_stock_turn(game):
+    """Tah ve hře standardní třídy, jejíž stav se čte přímo."""
+    cdef int attempt
+    cdef Py_ssize_t occurrences = 0, index = 0, players
+    cdef bint multiplayer = type(game) is MultiplayerGame
+    cdef bint fast
+
+    players_list = game._players
+    players = len(players_list)
+    if multiplayer:
+        index = game._MultiplayerGame__current_player_idx
+    player = players_list[index]
+    wedge = _rotate(game._wheel)
+    scores = game._scores
+    slot = game._slots[id(player)]
+
+    if (wedge._is_bankrupt if type(wedge) is Wedge else wedge.is_bankrupt):
+        scores[slot] = 0
+        if multiplayer:
+            game._MultiplayerGame__current_player_idx = (
+                0 if index == players - 1 else index + 1)
+        return BANKRUPT
+
+    phrase = game._phrase
+    fast = type(phrase) is FastSecretPhrase
+    guessed = game._AbstractGame__guessed_letters
+    view = guessed._view
+    guess = None
+    for attempt in range(MAX_INVALID_GUESSES):
+        if fast:
+            current = phrase._current
+            if current is None:
+                current = phrase.current_phrase
+        else:
+            current = phrase.current_phrase
+        guess = player.guess_letter(view, current)
+        if guess is None:
+            return GIVE_UP
+        if guess in guessed:
+            continue
+        try:
+            if fast and len(guess) == 1:
+                key = _PROCESSED.get(guess)
+                if key is None:
+                    key = Letter.process(guess)
+                key = key or phrase.EMPTY_KEY
+                if len(key) == 1:
+                    occurrences = _guess(phrase, key)
+                    break
+            occurrences = phrase.guess(guess)
+            break
+        except GuessError:
+            continue
+    else:
+        return GIVE_UP
+
+    guessed.add(guess)
+    if occurrences > 0:
+        multiplier = (wedge._multiplier if type(wedge) is Wedge
+                      else wedge.multiplier)
+        scores[slot] += multiplier * occurrences
+        return HIT
+
+    if multiplayer:
+        game._MultiplayerGame__current_player_idx = (
+            0 if index == players - 1 else index + 1)
+    return MISS
+
+
+cdef object _play_turn(game):
+    """Obecný tah přes veřejné rozhraní hry."""
+    cdef int attempt
+    cdef Py_ssize_t occurrences = 0
+
+    player = game.current_player
+    wedge = game.turn_the_wheel()
+
+    if wedge.is_bankrupt:
+        game.bankrupt_player(player)
+        game.set_next_player()
+        return BANKRUPT
+
+    phrase = game.phrase
+    guess = None
+    for attempt in range(MAX_INVALID_GUESSES):
+        guess = player.guess_letter(
+            game.guessed_letters, phrase.current_phrase)
+        if guess is None:
+            return GIVE_UP
+        try:
+            occurrences = game.check_guess(guess)
+            break
+        except GuessError:
+            continue
+    else:
+        return GIVE_UP
+
+    game.save_guess(guess)
+    if occurrences > 0:
+        game.increase_player_score(player, wedge.multiplier * occurrences)
+        return HIT
+
+    game.set_next_player()
+    return MISS
@@ -0,0 +1,294 @@
+"""Tento modul obsahuje předpočítané analýzy tajenek a jejich mezipaměť.
+
+Analýza tajenky (`PhraseAnalytics`) shrnuje fakta, která se při každé hře
+nad touž tajenkou počítají znovu: porovnávací tvary znaků (tedy výsledek
+odstranění diakritiky), histogram hádatelných písmen, počet různých písmen
+a horní mez počtu pokusů nutných k vyluštění. Z analýzy lze také
+rovnou vytvořit `CompactSecretPhrase`, aniž by se diakritika odstraňovala
+znovu.
+
+Mezipaměť analýz (`AnalyticsCache`) je klíčována otiskem tajenky (BLAKE2b).
+V paměti drží omezený počet naposledy použitých analýz (LRU) a volitelně
+je ukládá do souboru, odkud je čte při dalších spuštěních.
+
+Soubor mezipaměti začíná hlavičkou (`HEADER`), za níž následují záznamy
+přidávané na konec souboru. Každý záznam tvoří hlavička záznamu (`RECORD`:
+otisk tajenky a délky jednotlivých částí), text tajenky a porovnávací tvary
+v UTF-8, maska speciálních znaků a položky histogramu (`ENTRY`: kódový bod
+písmene a počet výskytů)."""
+
+import hashlib
+import string
+import struct
+from collections import OrderedDict
+from typing import NamedTuple, Optional
+
+from src.game.kernel import FastSecretPhrase
+from src.game.phrase import CompactSecretPhrase
+
+# Hlavička souboru mezipaměti: magické číslo, verze a rezerva
+HEADER = struct.Struct("<4sHH")
+
+# Magické číslo, kterým začíná každý soubor mezipaměti
+MAGIC = b"WOFA"
+
+# Verze formátu souboru
+VERSION = 2
+
+# Hlavička jednoho záznamu: otisk tajenky, délka textu tajenky, délka
+# porovnávacích tvarů (obojí v bajtech), délka masky v bajtech a počet
+# položek histogramu
+RECORD = struct.Struct("<16sIIII")
+
+# Jedna položka histogramu: kódový bod písmene a počet výskytů
+ENTRY = struct.Struct("<II")
+
+# Písmena, která lze hádat v každé tajence (po odstranění diakritiky)
+ALPHABET = string.ascii_uppercase
+
+# Porovnávací tvar, kterému žádné hádané písmeno neodpovídá
+_NEVER_KEY = CompactSecretPhrase.NEVER_KEY
+
+
+class PhraseAnalytics(NamedTuple):
+    """Předpočítaná fakta o jedné tajence."""
+
+    # Text tajenky
+    phrase: str
+
+    # Porovnávací tvary znaků tajenky (viz `CompactSecretPhrase.keys`)
+    keys: str
+
+    # Maska pozic, které jsou odkryté již na začátku hry (speciální znaky)
+    revealed: int
+
+    # Počet skrytých pozic pro každé hádatelné písmeno; znaky, které po
+    # odstranění diakritiky zmizí, se počítají pod porovnávacím tvarem
+    # `CompactSecretPhrase.EMPTY_KEY` (odkryje je hádání kteréhokoli
+    # takového znaku, viz `CompactSecretPhrase.guess`)
+    histogram: dict[str, int]
+
+    @property
+    def guessable(self) -> int:
+        """Počet skrytých pozic, které lze odkrýt hádáním písmen."""
+        return sum(self.histogram.values())
+
+    @property
+    def distinct_letters(self) -> int:
+        """Počet různých hádatelných písmen tajenky."""
+        return len(self.histogram)
+
+    @property
+    def frequencies(self) -> dict[str, float]:
+        """Normalizovaný histogram, tedy podíl skrytých pozic připadající
+        na jednotlivá písmena."""
+        guessable = self.guessable
+        return {letter: count / guessable
+                for letter, count in self.histogram.items()}
+
+    @property
+    def max_guesses(self) -> int:
+        """Největší počet pokusů nutný k vyluštění tajenky, pokud se hádají
+        pouze dosud nezkoušená písmena abecedy (`ALPHABET`) a písmena
+        tajenky."""
+        return len(self.histogram.keys() | set(ALPHABET))
+
+    @property
+    def is_solvable(self) -> bool:
+        """Lze-li hádáním písmen odkrýt všechny skryté pozice tajenky."""
+        hidden = len(self.phrase) - bin(self.revealed).count("1")
+        return self.guessable == hidden
+
+    def create_phrase(self) -> CompactSecretPhrase:
+        """Metoda vytvoří novou, zcela zakrytou tajenku (se zkompilovaným
+        hádáním, je-li k dispozici, viz `src.game.kernel`)."""
+        return FastSecretPhrase.from_keys(
+            self.phrase, self.keys, self.revealed)
+
+
+def analyze(phrase: str) -> PhraseAnalytics:
+    """Funkce spočítá analýzu dodané tajenky."""
+    compact = CompactSecretPhrase(phrase)
+    keys = compact.keys
+    revealed = compact.revealed_mask
+
+    histogram: dict[str, int] = {}
+    for position, key in enumerate(keys):
+        if not revealed >> position & 1 and key != _NEVER_KEY:
+            histogram[key] = histogram.get(key, 0) + 1
+    return PhraseAnalytics(phrase, keys, revealed, histogram)
+
+
+def phrase_digest(phrase: str) -> bytes:
+    """Funkce vrací otisk tajenky, kterým je klíčována mezipaměť."""
+    return hashlib.blake2b(phrase.encode("utf-8"), digest_size=16).digest()
+
+
+class AnalyticsCache:
+    """Instance této třídy jsou mezipamětí analýz tajenek.
+
+    V paměti se drží nejvýše `capacity` naposledy použitých analýz. Je-li
+    zadán soubor, každá nově spočítaná analýza se do něj připíše a analýzy
+    uložené dříve se z něj čtou; v paměti se pak navíc drží pouze pozice
+    záznamů podle otisků."""
+
+    # Výchozí počet analýz držených v paměti
+    DEFAULT_CAPACITY = 4096
+
+    def __init__(self, path: Optional[str] = None,
+                 capacity: int = DEFAULT_CAPACITY):
+        """Initor, který přijímá volitelnou cestu k souboru mezipaměti
+        (bez ní se analýzy drží pouze v paměti) a počet analýz držených
+        v paměti."""
+        if capacity < 1:
+            raise ValueError(f"Kapacita mezipaměti musí být kladná: "
+                             f"{capacity}")
+
+        self._capacity = capacity
+        self._memory: OrderedDict[bytes, PhraseAnalytics] = OrderedDict()
+        self._offsets: dict[bytes, int] = {}
+        self._hits = 0
+        self._misses = 0
+        self._file = None
+        if path is not None:
+            self._open(path)
+
+    @property
+    def capacity(self) -> int:
+        """Počet analýz držených v paměti."""
+        return self._capacity
+
+    @property
+    def hits(self) -> int:
+        """Počet dotazů zodpovězených z paměti nebo ze souboru."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Počet dotazů, pro které bylo nutné analýzu spočítat."""
+        return self._misses
+
+    def __len__(self) -> int:
+        """Počet analýz, které mezipaměť zná (v souboru nebo v paměti)."""
+        if self._file is None:
+            return len(self._memory)
+        return len(self._offsets)
+
+    def __contains__(self, phrase: str) -> bool:
+        digest = phrase_digest(phrase)
+        return digest in self._memory or digest in self._offsets
+
+    def get(self, phrase: str) -> PhraseAnalytics:
+        """Metoda vrací analýzu dodané tajenky. Není-li v mezipaměti,
+        spočítá ji a uloží."""
+        digest = phrase_digest(phrase)
+        analytics = self._memory.get(digest)
+        if analytics is not None and analytics.phrase == phrase:
+            self._memory.move_to_end(digest)
+            self._hits += 1
+            return analytics
+
+        offset = self._offsets.get(digest)
+        analytics = None if offset is None else self._read(offset)
+        if analytics is not None and analytics.phrase == phrase:
+            self._hits += 1
+        else:
+            # Tajenka v mezipaměti není (nebo má s uloženou shodný otisk)
+            self._misses += 1
+            analytics = analyze(phrase)
+            if self._file is not None and offset is None:
+                self._append(digest, analytics)
+
+        self._memory[digest] = analytics
+        self._memory.move_to_end(digest)
+        if len(self._memory) > self._capacity:
+            self._memory.popitem(last=False)
+        return analytics
+
+    def create_phrase(self, phrase: str) -> CompactSecretPhrase:
+        """Metoda vytvoří novou tajenku s využitím její analýzy."""
+        return self.get(phrase).create_phrase()
+
+    def _open(self, path: str):
+        """Metoda otevře (případně založí) soubor mezipaměti a načte pozice
+        jeho záznamů. Neúplný záznam na konci souboru (např. po přerušeném
+        zápisu) odstraní."""
+        try:
+            self._file = open(path, "r+b")
+        except FileNotFoundError:
+            self._file = open(path, "w+b")
+            self._file.write(HEADER.pack(MAGIC, VERSION, 0))
+
+        file = self._file
+        file.seek(0)
+        magic, version, _ = HEADER.unpack(file.read(HEADER.size))
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"Soubor '{path}' není mezipaměť analýz verze "
+                             f"{VERSION}")
+
+        offset = HEADER.size
+        end = file.seek(0, 2)
+        while offset + RECORD.size <= end:
+            file.seek(offset)
+            digest, *lengths = RECORD.unpack(file.read(RECORD.size))
+            size = (RECORD.size + sum(lengths[:3])
+                    + lengths[3] * ENTRY.size)
+            if offset + size > end:
+                break
+            self._offsets[digest] = offset
+            offset += size
+        if offset != end:
+            file.truncate(offset)
+
+    def _read(self, offset: int) -> PhraseAnalytics:
+        """Metoda přečte ze souboru záznam na dodané pozici."""
+        file = self._file
+        file.seek(offset)
+        _, phrase_size, keys_size, mask_size, entries = RECORD.unpack(
+            file.read(RECORD.size))
+        data = file.read(phrase_size + keys_size + mask_size
+                         + entries * ENTRY.size)
+
+        phrase = data[:phrase_size].decode("utf-8")
+        position = phrase_size + keys_size
+        keys = data[phrase_size:position].decode("utf-8")
+        revealed = int.from_bytes(
+            data[position:position + mask_size], "little")
+        histogram = {chr(code_point): count for code_point, count
+                     in ENTRY.iter_unpack(data[position + mask_size:])}
+        return PhraseAnalytics(phrase, keys, revealed, histogram)
+
+    def _append(self, digest: bytes, analytics: PhraseAnalytics):
+        """Metoda připíše analýzu na konec souboru."""
+        phrase = analytics.phrase.encode("utf-8")
+        keys = analytics.keys.encode("utf-8")
+        mask = analytics.revealed.to_bytes(
+            (analytics.revealed.bit_length() + 7) // 8, "little")
+        entries = b"".join(ENTRY.pack(ord(letter), count) for letter, count
+                           in analytics.histogram.items())
+
+        file = self._file
+        offset = file.seek(0, 2)
+        file.write(RECORD.pack(digest, len(phrase), len(keys), len(mask),
+                               len(analytics.histogram)))
+        file.write(phrase + keys + mask + entries)
+        self._offsets[digest] = offset
+
+    def flush(self):
+        """Metoda zapíše rozepsané záznamy do souboru."""
+        if self._file is not None:
+            self._file.flush()
+
+    def close(self):
+        """Metoda uzavře soubor mezipaměti."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._offsets.clear()
+
+    def __enter__(self) -> "AnalyticsCache":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
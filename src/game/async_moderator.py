@@ -0,0 +1,200 @@
+"""Tento modul obsahuje asynchronní variantu moderátora.
+
+Asynchronní moderátor řídí hru podle stejných pravidel jako `Moderator`,
+hráče se však dotazuje pomocí korutin (viz
+`src.player.async_player.AbstractAsyncPlayer`). Díky tomu může jediná smyčka
+událostí řídit stovky her najednou a pomalý hráč nezdrží ostatní hry.
+
+Na každý dotaz má hráč omezený čas (`turn_timeout`). Nestihne-li odpovědět,
+použije se tip záložního hráče (`timeout_player`), nebo, není-li zadán,
+hráč o svůj tah přichází. Hra končí vyluštěním tajenky, dosažením
+maximálního počtu tahů (`max_turns`), nebo když se od posledního platného
+tipu tahu vzdali všichni hráči (např. tajenku s číslicemi nelze vyluštit a
+hráčům dojdou písmena). Po každém tahu hra předá řízení smyčce událostí,
+aby se hry střídaly i s hráči, kteří odpovídají okamžitě.
+
+Tipy se ověřují a výhry připisují metodami `check_guess` a `award_prize`
+předka, takže asynchronní hry lze stejně jako synchronní měřit
+instrumentací a zaznamenávat do záznamu her."""
+
+import asyncio
+from typing import Iterable, Optional
+
+from src.game import Wedge
+from src.game.event_log import EventLog
+from src.game.game import AbstractGame
+from src.game.instrumentation import Instrumentation
+from src.game.moderator import Moderator
+from src.game.phrase import GuessError
+from src.game.simulation import Simulator
+from src.game.turn import MAX_INVALID_GUESSES
+from src.player.abstract_player import AbstractPlayer
+from src.player.async_player import AbstractAsyncPlayer
+
+
+class AsyncModerator(Moderator):
+    """Instance této třídy řídí hru, jejímiž hráči jsou asynchronní hráči
+    (`AbstractAsyncPlayer`), např. synchronní hráči obalení pomocí
+    `SyncPlayerAdapter`.
+
+    Metody, které se dotazují hráčů, jsou oproti předkovi korutinami.
+    V tichém režimu moderátor nevypisuje ani uvítání a rozloučení."""
+
+    # Metody, které instrumentace a záznam her nahrazují obaly (viz
+    # `Moderator.HOOKS`), včetně tahu bez tipu
+    HOOKS = Moderator.HOOKS + ("skip_turn",)
+
+    def __init__(self, game: AbstractGame, quiet: bool = False,
+                 turn_timeout: Optional[float] = None,
+                 timeout_player: Optional[AbstractPlayer] = None,
+                 instrumentation: Optional[Instrumentation] = None,
+                 event_log: Optional[EventLog] = None,
+                 max_turns: int = Simulator.DEFAULT_MAX_TURNS):
+        """Initor, který kromě hry a tichého režimu přijímá časový limit
+        jednoho dotazu na hráče v sekundách (`None` znamená bez limitu),
+        záložního hráče, jehož tip se použije při vypršení limitu, stejně
+        jako `Moderator` volitelnou instrumentaci a záznam her a maximální
+        počet tahů hry."""
+        if max_turns < 1:
+            raise ValueError(f"Maximální počet tahů musí být kladný: "
+                             f"{max_turns}")
+
+        super().__init__(game, quiet, instrumentation, event_log)
+        self._turn_timeout = turn_timeout
+        self._timeout_player = timeout_player
+        self._max_turns = max_turns
+        self._timeouts = 0
+        self._timed_out = False
+        self._turns = 0
+
+        # Místa hráčů, kteří se od posledního platného tipu vzdali tahu
+        self._given_up: set[int] = set()
+
+    @property
+    def turn_timeout(self) -> Optional[float]:
+        """Časový limit jednoho dotazu na hráče v sekundách."""
+        return self._turn_timeout
+
+    @property
+    def max_turns(self) -> int:
+        """Maximální počet tahů hry."""
+        return self._max_turns
+
+    @property
+    def turns(self) -> int:
+        """Počet dosud odehraných tahů."""
+        return self._turns
+
+    @property
+    def timeouts(self) -> int:
+        """Počet dotazů, na které hráči nestihli odpovědět."""
+        return self._timeouts
+
+    async def ask_for_letter(self, player: AbstractAsyncPlayer
+                             ) -> Optional[str]:
+        """Korutina vyzve hráče k jeho dalšímu tipu. Nestihne-li hráč
+        odpovědět v časovém limitu, vrací tip záložního hráče, nebo `None`,
+        pokud záložní hráč není."""
+        self.say(f"Tak jaké zkusíme písmenko?")
+        self._timed_out = False
+        guessed = self.game.guessed_letters
+        phrase = self.game.phrase.current_phrase
+        try:
+            return await asyncio.wait_for(
+                player.guess_letter(guessed, phrase), self._turn_timeout)
+        except asyncio.TimeoutError:
+            self._timeouts += 1
+            self._timed_out = True
+            self.say(f"Hráč {player.player_name} nestihl odpovědět.")
+            if self._timeout_player is None:
+                return None
+            return self._timeout_player.guess_letter(guessed, phrase)
+
+    async def player_guess(self, wedge: Wedge,
+                           player: AbstractAsyncPlayer) -> bool:
+        """Korutina řídí průběh tahu jednoho hráče. Pokud hráč uhodne
+        písmeno v tajence, vrací True (hraje znovu), jinak False. Bez
+        odpovědi (vypršení limitu bez záložního hráče, nebo nemá-li hráč
+        co hádat) nebo po příliš mnoha neplatných pokusech (viz
+        `MAX_INVALID_GUESSES`) hráč přichází o tah; mimo vypršení limitu
+        se tím tahu vzdává (viz `is_over`)."""
+        occurrences = -1
+        guess = ""
+        for _ in range(MAX_INVALID_GUESSES):
+            guess = await self.ask_for_letter(player)
+            if guess is None:
+                break
+            try:
+                occurrences = self.check_guess(guess)
+                break
+            except GuessError as ge:
+                self.say(f"Pokus {ge.problem_letter} nelze použít... "
+                         f"Zkuste to znovu!")
+
+        if occurrences == -1:
+            if not self._timed_out:
+                self._given_up.add(self.game.player_slot(player))
+            self.skip_turn(player)
+            return False
+
+        self._given_up.clear()
+        self.game.save_guess(guess)
+
+        if occurrences > 0:
+            prize = self.award_prize(player, wedge, occurrences)
+            self.say(f"Uhodl jste {occurrences} znaků v tajence a dostáváte "
+                     f"{prize} bodů!")
+            return True
+
+        self.say(f"Bohužel písmeno '{guess}' v tajence není...")
+        return False
+
+    def skip_turn(self, player: AbstractAsyncPlayer):
+        """Metoda ukončí tah hráče, který nic netipoval (nestihl odpovědět
+        a záložní hráč není, nebo se tahu vzdal)."""
+        self.say(f"Hráč {player.player_name} přichází o tah.")
+
+    async def do_the_turn(self):
+        """Korutina řídí jeden tah stejně jako `Moderator.do_the_turn`."""
+        player = self.game.current_player
+        self.say(f"Na tahu je hráč '{player.player_name}'.")
+        wedge = self.turn_wheel()
+
+        if wedge.is_bankrupt:
+            self.handle_bankrupt(player)
+            return
+
+        self.say(f"Vytočil jste si políčko {wedge.name}.")
+        if not await self.player_guess(wedge, player):
+            self.game.set_next_player()
+
+    def is_over(self) -> bool:
+        """Metoda vrací, zda-li hra skončila: tajenka je vyluštěna, bylo
+        dosaženo maximálního počtu tahů, nebo se od posledního platného
+        tipu tahu vzdali všichni hráči (hráč, kterému vypršel časový limit,
+        se tahu nevzdává)."""
+        return (self.game.phrase.is_finished
+                or self._turns >= self._max_turns
+                or len(self._given_up) >= self.game.number_of_players)
+
+    async def run_game(self):
+        """Korutina řídí celý průběh hry, dokud hra neskončí (viz
+        `is_over`). Po každém tahu předá řízení smyčce událostí."""
+        if not self.quiet:
+            self.introduce_game()
+
+        while not self.is_over():
+            self.say(80*"-")
+            self._turns += 1
+            await self.do_the_turn()
+            await asyncio.sleep(0)
+
+        if not self.quiet:
+            print(80*"-")
+            self.end_game()
+
+
+async def run_games(moderators: Iterable[AsyncModerator]):
+    """Korutina odehraje všechny hry dodaných moderátorů souběžně v rámci
+    jediné smyčky událostí."""
+    await asyncio.gather(*(moderator.run_game() for moderator in moderators))
@@ -0,0 +1,213 @@
+"""Tento modul obsahuje korpus tajenek uložený v binárním souboru.
+
+Soubor korpusu má tři části:
+
+- hlavičku (`HEADER`): magické číslo, verzi formátu, počet tajenek a pozici
+  tabulky posunů,
+- data: tajenky v kódování UTF-8 uložené bezprostředně za sebou,
+- tabulku posunů: pro každou tajenku pozici jejího začátku v souboru
+  a nakonec pozici konce dat (celá čísla o 8 bajtech, little-endian).
+
+Korpus se čte přes `mmap`, takže ani korpus s miliony tajenek se nenačítá do
+paměti celý: otevření je okamžité a tajenka se dekóduje (a `SecretPhrase` se
+z ní vybuduje) až ve chvíli, kdy je skutečně potřeba.
+
+Korpus se vytváří jednorázově z textového souboru (tajenka na řádek) nebo
+CSV souboru příkazem `python -m src.game.corpus <vstup> <výstup>`."""
+
+import argparse
+import csv
+import mmap
+import random
+import struct
+import sys
+from array import array
+from typing import Callable, Iterable, Iterator, Optional
+
+from src.game.phrase import AbstractSecretPhrase, SecretPhrase
+
+# Hlavička souboru: magické číslo, verze, rezerva, počet tajenek a pozice
+# tabulky posunů
+HEADER = struct.Struct("<4sHHQQ")
+
+# Magické číslo, kterým začíná každý soubor korpusu
+MAGIC = b"WOFC"
+
+# Verze formátu souboru
+VERSION = 1
+
+# Jedna položka tabulky posunů
+OFFSET = struct.Struct("<Q")
+
+
+class PhraseCorpus:
+    """Instance této třídy zpřístupňují korpus tajenek uložený v binárním
+    souboru (viz `write_corpus`).
+
+    Iterace i výběry vrací tajenky jako objekty vytvořené dodanou továrnou
+    (výchozí je `SecretPhrase`), a to až ve chvíli, kdy si o ně volající
+    řekne. Textovou podobu tajenky vrací indexace (`corpus[i]`)."""
+
+    def __init__(self, path: str,
+                 phrase_factory: Callable[[str], AbstractSecretPhrase] =
+                 SecretPhrase):
+        """Initor, který přijímá cestu k souboru korpusu a továrnu, která
+        z textu tajenky vybuduje její objekt."""
+        self._path = path
+        self._phrase_factory = phrase_factory
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._mmap) < HEADER.size:
+            self.close()
+            raise ValueError(f"Soubor '{path}' není korpus tajenek")
+        magic, version, _, count, table = HEADER.unpack_from(self._mmap)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"Soubor '{path}' není korpus tajenek verze "
+                             f"{VERSION}")
+
+        self._count = count
+        self._table = table
+
+    @property
+    def path(self) -> str:
+        """Cesta k souboru korpusu."""
+        return self._path
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> str:
+        """Metoda vrací text tajenky s daným pořadím."""
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError(f"Korpus nemá tajenku s pořadím {index}")
+
+        start, end = struct.unpack_from(
+            "<QQ", self._mmap, self._table + index * OFFSET.size)
+        return self._mmap[start:end].decode("utf-8")
+
+    def phrase(self, index: int) -> AbstractSecretPhrase:
+        """Metoda vrací objekt tajenky s daným pořadím."""
+        return self._phrase_factory(self[index])
+
+    def __iter__(self) -> Iterator[AbstractSecretPhrase]:
+        """Metoda postupně vrací objekty všech tajenek korpusu."""
+        return self._phrases(range(self._count))
+
+    def texts(self) -> Iterator[str]:
+        """Metoda postupně vrací texty všech tajenek korpusu."""
+        return (self[index] for index in range(self._count))
+
+    def sample(self, count: int,
+               seed: Optional[int] = None) -> Iterator[AbstractSecretPhrase]:
+        """Metoda vrací `count` náhodně vybraných různých tajenek. Se
+        stejným semínkem je výběr vždy stejný."""
+        if count > self._count:
+            raise ValueError(f"Korpus má jen {self._count} tajenek: {count}")
+        return self._phrases(random.Random(seed).sample(
+            range(self._count), count))
+
+    def shard(self, worker_id: int,
+              workers: int) -> Iterator[AbstractSecretPhrase]:
+        """Metoda vrací tajenky připadající jednomu z `workers` procesů
+        (každou `workers`-tou tajenku počínaje pořadím `worker_id`), takže
+        se procesy o korpus dělí bez překryvu."""
+        if not 0 <= worker_id < workers:
+            raise ValueError(f"Neplatné číslo procesu: {worker_id} "
+                             f"z {workers}")
+        return self._phrases(range(worker_id, self._count, workers))
+
+    def _phrases(self, indices: Iterable[int]
+                 ) -> Iterator[AbstractSecretPhrase]:
+        """Metoda postupně vrací objekty tajenek s dodanými pořadími."""
+        for index in indices:
+            yield self.phrase(index)
+
+    def close(self):
+        """Metoda uzavře mapování souboru."""
+        self._mmap.close()
+
+    def __enter__(self) -> "PhraseCorpus":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def write_corpus(path: str, phrases: Iterable[str]) -> int:
+    """Funkce zapíše dodané tajenky do souboru korpusu a vrací jejich počet.
+    Tajenky se zapisují průběžně, v paměti se drží pouze tabulka posunů.
+    Prázdná tajenka (nebo tajenka pouze z bílých znaků) vyhodí výjimku
+    `ValueError`; soubor pak obsahuje prázdný korpus."""
+    offsets = array("Q")
+    with open(path, "wb") as file:
+        file.write(HEADER.pack(MAGIC, VERSION, 0, 0, 0))
+        position = HEADER.size
+        for phrase in phrases:
+            if not phrase.strip():
+                raise ValueError(f"Tajenka č. {len(offsets)} je prázdná: "
+                                 f"'{phrase}'")
+            offsets.append(position)
+            position += file.write(phrase.encode("utf-8"))
+        offsets.append(position)
+
+        if sys.byteorder != "little":
+            offsets.byteswap()
+        file.write(offsets.tobytes())
+
+        count = len(offsets) - 1
+        file.seek(0)
+        file.write(HEADER.pack(MAGIC, VERSION, 0, count, position))
+    return count
+
+
+def read_text_phrases(path: str, column: Optional[str] = None,
+                      delimiter: str = ",") -> Iterator[str]:
+    """Funkce postupně čte tajenky z textového souboru (tajenka na řádek).
+    Je-li zadán sloupec (název v záhlaví, nebo číslo od 0), čte soubor jako
+    CSV a tajenky bere z tohoto sloupce. Prázdné tajenky přeskakuje."""
+    with open(path, encoding="utf-8", newline="") as file:
+        if column is None:
+            rows = ([line] for line in file)
+            position = 0
+        else:
+            rows = csv.reader(file, delimiter=delimiter)
+            if column.isdigit():
+                position = int(column)
+            else:
+                header = next(rows, [])
+                if column not in header:
+                    raise ValueError(f"Soubor '{path}' nemá sloupec "
+                                     f"'{column}'")
+                position = header.index(column)
+
+        for row in rows:
+            if position < len(row) and (phrase := row[position].strip()):
+                yield phrase
+
+
+def convert(source: str, target: str, column: Optional[str] = None,
+            delimiter: str = ",") -> int:
+    """Funkce převede textový nebo CSV soubor s tajenkami na soubor korpusu
+    a vrací počet převedených tajenek."""
+    return write_corpus(target, read_text_phrases(source, column, delimiter))
+
+
+def main():
+    """Převod textového nebo CSV souboru na korpus z příkazové řádky."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("source", help="textový nebo CSV soubor s tajenkami")
+    parser.add_argument("target", help="výstupní soubor korpusu")
+    parser.add_argument("--column", help="název nebo číslo sloupce CSV")
+    parser.add_argument("--delimiter", default=",")
+    args = parser.parse_args()
+
+    count = convert(args.source, args.target, args.column, args.delimiter)
+    print(f"Převedeno {count} tajenek do '{args.target}'")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,449 @@
+"""Tento modul obsahuje binární záznam průběhu her a jeho přehrávání.
+
+Záznam hry obsahuje vše, z čeho lze její stav kdykoliv zpětně odvodit, aniž
+by bylo potřeba volat hráče: tajenku, jména hráčů, multiplikátory klínů kola
+a posloupnost tahů. Každý tah je zaznamenán jako index vytočeného klínu;
+nepadl-li bankrot, následuje hádané písmeno (v kódování UTF-8) a počet jeho
+výskytů v tajence; tah, ve kterém hráč nic netipoval (např. nestihl-li
+odpovědět asynchronnímu moderátorovi), má místo písmene bajt 0 a počet
+výskytů 0. Změna skóre (multiplikátor krát počet výskytů, resp.
+propadnutí skóre při bankrotu) i hráč na tahu z toho jednoznačně plynou,
+typický tah tak zabírá 3 bajty.
+
+Soubor záznamu začíná hlavičkou (`HEADER`), za níž následují záznamy her.
+Každý záznam hry tvoří hlavička (`GAME`: velikost zbytku záznamu, délka
+tajenky v bajtech, počet hráčů a počet klínů), tajenka, jména hráčů (každé
+s délkou v jednom bajtu), multiplikátory klínů (bankrot je označen hodnotou
+-1) a tahy.
+
+Během hry se tahy připojují do bajtového pole (`GameRecorder`) a do souboru
+(`EventLog`) se zapisuje celý záznam hry najednou. Záznamy se čtou funkcí
+`read_log`; přehrát je do libovolného tahu lze metodou `GameRecord.replay`
+(vrací `AbstractGame`), samotná skóre spočítá rychleji `GameRecord.scores`.
+"""
+
+import mmap
+import struct
+from functools import lru_cache
+from inspect import iscoroutinefunction
+from typing import BinaryIO, Iterator, NamedTuple, Optional, Union
+
+from src.game import create_bankrupt_wedge, create_wedge
+from src.game.game import AbstractGame, MultiplayerGame, SinglePlayerGame
+from src.game.kernel import FastSecretPhrase
+from src.game.phrase import GuessError
+from src.game.wheel import Wedge, Wheel
+from src.player.abstract_player import AbstractPlayer
+
+# Hlavička souboru: magické číslo, verze a rezerva
+HEADER = struct.Struct("<4sHH")
+
+# Magické číslo, kterým začíná každý soubor záznamu
+MAGIC = b"WOFE"
+
+# Verze formátu souboru
+VERSION = 1
+
+# Hlavička záznamu hry: velikost zbytku záznamu v bajtech, délka tajenky
+# v bajtech, počet hráčů a počet klínů
+GAME = struct.Struct("<IHHB")
+
+# Nejvyšší počet klínů, jejichž index se vejde do jednoho bajtu
+MAX_WEDGES = 255
+
+# Nejvyšší délka tajenky v bajtech (UTF-8), která se vejde do hlavičky
+# záznamu hry
+MAX_PHRASE_SIZE = 0xFFFF
+
+# Multiplikátor, kterým je v záznamu označen bankrot
+BANKRUPT_VALUE = -1
+
+# Znak, kterým je v záznamu označen tah bez tipu
+SKIPPED_LETTER = "\0"
+
+
+class ReplayedPlayer(AbstractPlayer):
+    """Hráč přehrané hry, který zná jen své jméno. Na tip se jej přehrávání
+    nikdy neptá; kdyby se jej zeptal někdo jiný, vzdává se tahu."""
+
+    def guess_letter(self, already_guessed, phrase) -> None:
+        """Přehraný hráč nehádá."""
+        return None
+
+
+@lru_cache(maxsize=64)
+def replay_wheel(wedges: tuple[int, ...]) -> Wheel:
+    """Funkce vrací kolo s klíny o dodaných multiplikátorech (bankrot je
+    označen hodnotou `BANKRUPT_VALUE`); pro stejné klíny vrací totéž kolo.
+    Váhy klínů se nezaznamenávají, všechny klíny mají váhu 1."""
+    return Wheel([create_bankrupt_wedge() if value == BANKRUPT_VALUE
+                  else create_wedge(value) for value in wedges])
+
+
+class GameRecord(NamedTuple):
+    """Záznam jedné hry načtený ze souboru (viz `read_log`).
+
+    Multiplikátory klínů jsou ve stejném pořadí jako klíny kola, bankrot je
+    označen hodnotou `BANKRUPT_VALUE`; `events` jsou zakódované tahy."""
+
+    phrase: str
+    players: tuple[str, ...]
+    wedges: tuple[int, ...]
+    events: bytes
+
+    @property
+    def turn_count(self) -> int:
+        """Počet zaznamenaných tahů."""
+        return sum(1 for _ in self.turns())
+
+    def turns(self) -> Iterator[tuple[int, Optional[str], int]]:
+        """Generátor vrací jednotlivé tahy jako trojice (index klínu, hádané
+        písmeno, počet výskytů); při bankrotu je písmeno `None` a počet 0,
+        v tahu bez tipu je písmeno prázdný řetězec a počet 0."""
+        events = self.events
+        wedges = self.wedges
+        position = 0
+        end = len(events)
+        while position < end:
+            index = events[position]
+            position += 1
+            if wedges[index] == BANKRUPT_VALUE:
+                yield index, None, 0
+                continue
+            size = _utf8_size(events[position])
+            letter = events[position:position + size].decode()
+            occurrences, position = _read_varint(events, position + size)
+            if letter == SKIPPED_LETTER:
+                letter = ""
+            yield index, letter, occurrences
+
+    def scores(self, turns: Optional[int] = None) -> tuple[int, ...]:
+        """Metoda vrací skóre hráčů po dodaném počtu tahů (bez zadání na
+        konci hry). Počítá je přímo ze záznamu, tajenku nebuduje."""
+        events = self.events
+        wedges = self.wedges
+        scores = [0] * len(self.players)
+        players = len(scores)
+        seat = 0
+        remaining = -1 if turns is None else turns
+        position = 0
+        end = len(events)
+        while position < end and remaining:
+            remaining -= 1
+            value = wedges[events[position]]
+            position += 1
+            if value == BANKRUPT_VALUE:
+                scores[seat] = 0
+                seat = (seat + 1) % players
+                continue
+            position += _utf8_size(events[position])
+            occurrences = events[position]
+            if occurrences < 0x80:
+                position += 1
+            else:
+                occurrences, position = _read_varint(events, position)
+            if occurrences:
+                scores[seat] += value * occurrences
+            else:
+                seat = (seat + 1) % players
+        return tuple(scores)
+
+    def replay(self, turns: Optional[int] = None) -> AbstractGame:
+        """Metoda přehraje dodaný počet tahů (bez zadání celou hru) a vrací
+        výslednou hru. Hráči se na tipy neptají; nesouhlasí-li zaznamenaný
+        počet výskytů s tajenkou, je vyhozena výjimka `ValueError`."""
+        game = self.create_game()
+        phrase = game.phrase
+        wedges = game.wheel.wedges
+        for number, (index, letter, occurrences) in enumerate(self.turns()):
+            if number == turns:
+                break
+            player = game.current_player
+            if letter is None:
+                game.bankrupt_player(player)
+                game.set_next_player()
+                continue
+            if not letter:
+                game.set_next_player()
+                continue
+
+            try:
+                found = phrase.guess(letter)
+            except GuessError:
+                found = None
+            if found != occurrences:
+                raise ValueError(f"Záznam neodpovídá tajence v tahu "
+                                 f"{number + 1}: '{letter}'")
+            game.save_guess(letter)
+            if occurrences:
+                game.increase_player_score(
+                    player, wedges[index].multiplier * occurrences)
+            else:
+                game.set_next_player()
+        return game
+
+    def create_game(self) -> AbstractGame:
+        """Metoda vrací hru ve výchozím stavu se stejnou tajenkou, hráči
+        (`ReplayedPlayer`) a klíny kola jako zaznamenaná hra. Kolo je
+        sdílené všemi přehranými hrami se stejnými klíny (viz
+        `replay_wheel`)."""
+        wheel = replay_wheel(self.wedges)
+        players = [ReplayedPlayer(name) for name in self.players]
+        phrase = FastSecretPhrase(self.phrase)
+        if len(players) == 1:
+            return SinglePlayerGame(phrase, wheel, players[0])
+        return MultiplayerGame(phrase, wheel, players, max_players=None)
+
+
+class WedgeTable:
+    """Zakódované klíny jednoho kola a jejich indexy podle identity klínu,
+    sestavené jednou pro všechny hry hrané s tímto kolem."""
+
+    __slots__ = ("wheel", "indices", "encoded", "count")
+
+    def __init__(self, wheel: Wheel):
+        """Initor, který přijímá kolo štěstí."""
+        wedges = wheel.wedges
+        if len(wedges) > MAX_WEDGES:
+            raise ValueError(f"Záznam podporuje nejvýše {MAX_WEDGES} klínů: "
+                             f"{len(wedges)}")
+
+        self.wheel = wheel
+        self.count = len(wedges)
+        # Index klínu podle identity (u opakovaného klínu první výskyt)
+        self.indices: dict[int, int] = {}
+        for index, wedge in enumerate(wedges):
+            self.indices.setdefault(id(wedge), index)
+        self.encoded = struct.pack(f"<{len(wedges)}i", *(
+            BANKRUPT_VALUE if wedge.is_bankrupt else wedge.multiplier
+            for wedge in wedges))
+
+
+class GameRecorder:
+    """Instance této třídy zaznamenávají průběh jedné hry do bajtového pole.
+    """
+
+    def __init__(self, game: AbstractGame,
+                 wedge_table: Optional["WedgeTable"] = None):
+        """Initor, který přijímá zaznamenávanou hru (ve výchozím stavu) a
+        volitelně již sestavenou tabulku klínů jejího kola. Tajenka delší
+        než `MAX_PHRASE_SIZE` bajtů vyhodí výjimku `ValueError`."""
+        phrase = game.phrase.text.encode()
+        if len(phrase) > MAX_PHRASE_SIZE:
+            raise ValueError(f"Záznam podporuje tajenky o nejvýše "
+                             f"{MAX_PHRASE_SIZE} bajtech: {len(phrase)}")
+
+        if wedge_table is None:
+            wedge_table = WedgeTable(game.wheel)
+        self._indices = wedge_table.indices
+
+        names = [player.player_name.encode()[:255] for player in game.players]
+        self._header = b"".join([
+            phrase, *(bytes((len(name),)) + name for name in names),
+            wedge_table.encoded])
+        self._counts = (len(phrase), len(names), wedge_table.count)
+        self._events = bytearray()
+
+    @property
+    def size(self) -> int:
+        """Velikost dosud zaznamenaných tahů v bajtech."""
+        return len(self._events)
+
+    def spin(self, wedge: Wedge):
+        """Metoda zaznamená vytočený klín."""
+        self._events.append(self._indices[id(wedge)])
+
+    def guess(self, letter: str, occurrences: int):
+        """Metoda zaznamená přijaté písmeno a počet jeho výskytů; volá se po
+        zatočení, které neskončilo bankrotem."""
+        events = self._events
+        events += letter.encode()
+        while occurrences >= 0x80:
+            events.append(occurrences & 0x7F | 0x80)
+            occurrences >>= 7
+        events.append(occurrences)
+
+    def skip(self):
+        """Metoda zaznamená tah bez tipu; volá se po zatočení, které
+        neskončilo bankrotem."""
+        self._events += SKIPPED_LETTER.encode() + b"\0"
+
+    def to_bytes(self) -> bytes:
+        """Metoda vrací zakódovaný záznam hry."""
+        size = len(self._header) + len(self._events)
+        return (GAME.pack(size, *self._counts) + self._header
+                + bytes(self._events))
+
+
+class EventLog:
+    """Instance této třídy zapisují záznamy her do binárního souboru.
+
+    Existuje-li soubor, záznamy se připojují na jeho konec. Zapisovat lze
+    záznamy z `GameRecorder` (`write`), nebo nechat zaznamenávat hry
+    moderátora (`attach`, resp. parametr `event_log` moderátora)."""
+
+    def __init__(self, target: Union[str, BinaryIO]):
+        """Initor, který přijímá cestu k souboru záznamu nebo otevřený
+        binární soubor (zapisovaný od začátku nebo na konec záznamu)."""
+        if isinstance(target, str):
+            self._file = open(target, "ab")
+            self._owned = True
+        else:
+            self._file = target
+            self._owned = False
+        if self._file.tell() == 0:
+            self._file.write(HEADER.pack(MAGIC, VERSION, 0))
+        self._games = 0
+        # Tabulky klínů podle identity kola (tabulka drží kolo naživu)
+        self._wedge_tables: dict[int, WedgeTable] = {}
+
+    @property
+    def games(self) -> int:
+        """Počet her zapsaných touto instancí."""
+        return self._games
+
+    def write(self, recorder: GameRecorder):
+        """Metoda zapíše záznam jedné hry."""
+        self._file.write(recorder.to_bytes())
+        self._games += 1
+
+    def attach(self, moderator) -> GameRecorder:
+        """Metoda začne zaznamenávat hru dodaného moderátora: nahradí jeho
+        metody `turn_wheel` a `check_guess` (a má-li ji, i `skip_turn`, viz
+        `AsyncModerator`; pouze u této instance) obaly, které tahy
+        zaznamenávají, a `run_game` obalem, který záznam po
+        skončení hry zapíše (a obaly odstraní); je-li `run_game` korutinou
+        (viz `AsyncModerator`), je obal také korutinou. Vrací záznamník
+        hry."""
+        wheel = moderator.game.wheel
+        wedge_table = self._wedge_tables.get(id(wheel))
+        if wedge_table is None:
+            wedge_table = self._wedge_tables[id(wheel)] = WedgeTable(wheel)
+        recorder = GameRecorder(moderator.game, wedge_table)
+        spin = recorder.spin
+        guess = recorder.guess
+        turn_wheel = moderator.turn_wheel
+        check_guess = moderator.check_guess
+        run_game = moderator.run_game
+        skip_turn = getattr(moderator, "skip_turn", None)
+
+        def recorded_turn_wheel():
+            wedge = turn_wheel()
+            spin(wedge)
+            return wedge
+
+        def recorded_check_guess(letter):
+            occurrences = check_guess(letter)
+            guess(letter, occurrences)
+            return occurrences
+
+        def recorded_skip_turn(player):
+            skip_turn(player)
+            recorder.skip()
+
+        def recorded_run_game():
+            try:
+                return run_game()
+            finally:
+                moderator.remove_hooks()
+                self.write(recorder)
+
+        async def recorded_async_run_game():
+            try:
+                return await run_game()
+            finally:
+                moderator.remove_hooks()
+                self.write(recorder)
+
+        moderator.turn_wheel = recorded_turn_wheel
+        moderator.check_guess = recorded_check_guess
+        if skip_turn is not None:
+            moderator.skip_turn = recorded_skip_turn
+        moderator.run_game = (recorded_async_run_game
+                              if iscoroutinefunction(run_game)
+                              else recorded_run_game)
+        return recorder
+
+    def flush(self):
+        """Metoda zapíše vyrovnávací paměť souboru na disk."""
+        self._file.flush()
+
+    def close(self):
+        """Metoda uzavře soubor záznamu, pokud jej otevřela."""
+        if self._owned:
+            self._file.close()
+        else:
+            self._file.flush()
+
+    def __enter__(self) -> "EventLog":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def read_log(path: str) -> Iterator[GameRecord]:
+    """Generátor vrací záznamy her ze souboru záznamu v pořadí, ve kterém
+    byly zapsány. Neúplný záznam na konci souboru (přerušený zápis) se
+    přeskočí."""
+    with open(path, "rb") as file:
+        if not file.seek(0, 2):
+            raise ValueError(f"Soubor '{path}' není záznam her")
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if (len(data) < HEADER.size
+                    or HEADER.unpack_from(data)[:2] != (MAGIC, VERSION)):
+                raise ValueError(f"Soubor '{path}' není záznam her verze "
+                                 f"{VERSION}")
+
+            position = HEADER.size
+            end = len(data)
+            while position + GAME.size <= end:
+                size, phrase_size, players, wedges = GAME.unpack_from(
+                    data, position)
+                position += GAME.size
+                if position + size > end:
+                    return
+                record = data[position:position + size]
+                position += size
+                yield _decode_game(record, phrase_size, players, wedges)
+
+
+def _decode_game(record: bytes, phrase_size: int, players: int,
+                 wedges: int) -> GameRecord:
+    """Funkce dekóduje záznam hry bez hlavičky `GAME`."""
+    phrase = record[:phrase_size].decode()
+    position = phrase_size
+    names = []
+    for _ in range(players):
+        size = record[position]
+        names.append(record[position + 1:position + 1 + size]
+                     .decode(errors="ignore"))
+        position += 1 + size
+    values = struct.unpack_from(f"<{wedges}i", record, position)
+    position += 4 * wedges
+    return GameRecord(phrase, tuple(names), values, record[position:])
+
+
+def _utf8_size(first: int) -> int:
+    """Funkce vrací počet bajtů znaku v kódování UTF-8 podle jeho prvního
+    bajtu."""
+    if first < 0x80:
+        return 1
+    if first < 0xE0:
+        return 2
+    if first < 0xF0:
+        return 3
+    return 4
+
+
+def _read_varint(data: bytes, position: int) -> tuple[int, int]:
+    """Funkce přečte číslo zakódované po 7 bitech (nejnižší první) a vrací
+    dvojici (číslo, pozice za ním)."""
+    value = shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, position
+        shift += 7
@@ -11,12 +11,19 @@ Obecně lze chápat v kontextu tohoto typu hry dva základní módy:
 
 Oba tyto módy mají mnoho společných znaků, které jsou sdruženy do společného
 abstraktního předka `AbstractGame`.
+
+Stav rozehrané hry lze zachytit do snímku a ze snímku obnovit (viz
+`src.game.snapshot`). Zkoušená písmena hra eviduje jako bitovou množinu a
+hráčům je předává pohledem jen pro čtení (viz `src.game.letters`).
 """
 
-from typing import Iterable
+from typing import Iterable, Optional, Union
 from abc import ABC, abstractmethod
 
-from src.game.phrase import SecretPhrase
+from src.game.letters import GuessedLetters, GuessedLettersView
+from src.game.phrase import (AbstractSecretPhrase, CompactSecretPhrase,
+                             GuessError, SecretPhrase)
+from src.game.snapshot import GameSnapshot
 from src.game.wheel import Wheel, Wedge
 from src.player.abstract_player import AbstractPlayer
 
@@ -30,19 +37,27 @@ class AbstractGame(ABC):
     celé hry.
     """
 
-    def __init__(self, phrase: str, wheel: Wheel, players: Iterable[AbstractPlayer]):
-        """Initor, který přijímá tajenku (v prostém textovém řetězci),
+    def __init__(self, phrase: Union[str, AbstractSecretPhrase], wheel: Wheel,
+                 players: Iterable[AbstractPlayer]):
+        """Initor, který přijímá tajenku (v prostém textovém řetězci nebo
+        jako již vybudovanou instanci tajenky, např. `CompactSecretPhrase`),
         vybudované kolo štěstí (pomocí kterého lze určovat ceny za uhodnutý
         znak tajenky) a sadu hráčů (kteří mohou tuto hru hrát a jsou dotazováni
         během svého tahu na svůj pokus o uhodnutí dalšího písmene hádanky).
         """
         self._wheel = wheel
-        self._phrase = SecretPhrase(phrase)
-        self.__guessed_letters: list[str] = []
+        self._phrase = (phrase if isinstance(phrase, AbstractSecretPhrase)
+                        else SecretPhrase(phrase))
+        self.__guessed_letters = GuessedLetters()
 
-        # Pro každého hráče ulož hráče jako n-tici (hráč, skóre),
+        # Hráči jsou uloženi v neměnné n-tici a jejich skóre v seznamu na
+        # stejném indexu (slotu); slot hráče se dohledává podle identity,
         # přičemž skóre je na počátku pochopitelně 0
-        self._player_records = [(p, 0) for p in players]
+        self._players = tuple(players)
+        self._scores = [0] * len(self._players)
+        self._slots: dict[int, int] = {}
+        for slot, player in enumerate(self._players):
+            self._slots.setdefault(id(player), slot)
 
     @property
     def wheel(self) -> Wheel:
@@ -52,47 +67,62 @@ class AbstractGame(ABC):
     @property
     def players(self) -> tuple[AbstractPlayer]:
         """N-tice hráčů, kteří se této hry účastní."""
-        return tuple([p[0] for p in self._player_records])
+        return self._players
 
     @property
     def number_of_players(self) -> int:
         """Počet hráčů v této hře."""
-        return len(self.players)
+        return len(self._players)
+
+    @property
+    def scores(self) -> tuple[int]:
+        """Skóre všech hráčů ve stejném pořadí jako `players`."""
+        return tuple(self._scores)
 
     @property
-    def phrase(self) -> SecretPhrase:
+    def phrase(self) -> AbstractSecretPhrase:
         """Tajenka, se kterou je v této hře cílem uhodnout."""
         return self._phrase
 
     @property
-    def guessed_letters(self) -> tuple[str]:
-        """N-tice již zkoušených písmen."""
-        return tuple(self.__guessed_letters)
+    def guessed_letters(self) -> GuessedLettersView:
+        """Pohled jen pro čtení na již zkoušená písmena (v pořadí, ve kterém
+        byla zkoušena); test `in` na něm stojí konstantní čas."""
+        return self.__guessed_letters.view
 
     @property
     @abstractmethod
     def current_player(self) -> AbstractPlayer:
         """Abstraktní vlastnost, která vrací dalšího hráče v pořadí."""
 
+    def check_guess(self, guess: str) -> int:
+        """Metoda ověří tip v tajence (odkryje uhodnutá písmena) a vrací
+        počet jeho výskytů. Již zkoušené písmeno (i v jiné velikosti či
+        s diakritikou) odmítne v konstantním čase výjimkou `GuessError`,
+        stejně jako tip, který nepřijme tajenka."""
+        if guess in self.__guessed_letters:
+            raise GuessError(f"Písmeno již bylo zkoušeno: '{guess}'!", guess)
+        return self._phrase.guess(guess)
+
     def save_guess(self, guessed_letter: str):
-        """Metoda, která uloží další pokus o uhodnutí znaku."""
-        self.__guessed_letters.append(guessed_letter)
+        """Metoda, která uloží další pokus o uhodnutí znaku. Již zkoušené
+        písmeno se znovu neukládá."""
+        self.__guessed_letters.add(guessed_letter)
+
+    def player_slot(self, player: AbstractPlayer) -> int:
+        """Metoda, která vrací index (slot) daného hráče ve hře."""
+        slot = self._slots.get(id(player))
+        if slot is None:
+            raise Exception(f"Ve hře není hráč '{player}'")
+        return slot
 
     def players_score(self, player: AbstractPlayer) -> int:
         """Metoda, která vrací skóre daného hráče."""
-        for player_record in self._player_records:
-            if player_record[0] == player:
-                return player_record[1]
-        raise Exception(f"Ve hře není hráč '{player}'")
+        return self._scores[self.player_slot(player)]
 
     def set_player_score(self, player: AbstractPlayer, score: int):
         """Metoda, která nastavuje skóre daného hráče."""
-        for index, player_record in enumerate(self._player_records):
-            if player_record[0] == player:
-                self._player_records[index] = (player, score)
-                break
-        else:
-            raise Exception(f"Ve hře není hráč '{player}'")
+        self._scores[self.player_slot(player)] = score
 
     def bankrupt_player(self, player: AbstractPlayer):
         """Metoda, která anuluje hráčovo skóre."""
@@ -100,7 +130,7 @@ class AbstractGame(ABC):
 
     def increase_player_score(self, player: AbstractPlayer, increment: int):
         """Metoda zvyšuje skóre daného hráče o dodaný přírustek."""
-        self.set_player_score(player, self.players_score(player) + increment)
+        self._scores[self.player_slot(player)] += increment
 
     @abstractmethod
     def set_next_player(self):
@@ -112,16 +142,81 @@ class AbstractGame(ABC):
         klín je vrácen jako návratová hodnota."""
         return self.wheel.rotate()
 
+    @property
+    @abstractmethod
+    def current_player_index(self) -> int:
+        """Index (slot) hráče, který je právě na tahu."""
+
+    @abstractmethod
+    def _set_current_player_index(self, index: int):
+        """Abstraktní metoda, která nastaví hráče na tahu podle indexu."""
+
+    def snapshot(self, with_random_state: bool = True) -> GameSnapshot:
+        """Metoda vrací snímek aktuálního stavu hry: masku odkrytých pozic
+        tajenky, zkoušená písmena, skóre, index hráče na tahu a (volitelně)
+        stav generátoru náhodných čísel kola."""
+        return GameSnapshot(
+            self._phrase.text, self._phrase.revealed_mask,
+            tuple(self.__guessed_letters), tuple(self._scores),
+            self.current_player_index,
+            self._wheel.getstate() if with_random_state else None)
+
+    def restore(self, snapshot: GameSnapshot,
+                restore_random_state: bool = True):
+        """Metoda vrátí hru do stavu dodaného snímku (pořízeného v této nebo
+        jiné hře se stejnou tajenkou a stejným počtem hráčů). Obsahuje-li
+        snímek stav generátoru kola a je-li `restore_random_state` True,
+        obnoví i ten (sdílí-li kolo více her, ovlivní tím i ostatní hry)."""
+        if snapshot.phrase != self._phrase.text:
+            raise ValueError(f"Snímek patří k jiné tajence: "
+                             f"'{snapshot.phrase}'")
+        if len(snapshot.scores) != len(self._scores):
+            raise ValueError(f"Snímek je pro {len(snapshot.scores)} hráčů, "
+                             f"hra pro {len(self._scores)}")
+
+        self._set_current_player_index(snapshot.current)
+        self._phrase.restore_revealed(snapshot.revealed)
+        self.__guessed_letters.replace(snapshot.guessed)
+        self._scores[:] = snapshot.scores
+        if restore_random_state and snapshot.random_state is not None:
+            self._wheel.setstate(snapshot.random_state)
+
+    @classmethod
+    def from_snapshot(cls, snapshot: GameSnapshot, wheel: Wheel,
+                      players: Iterable[AbstractPlayer],
+                      phrase_factory=CompactSecretPhrase,
+                      restore_random_state: bool = True) -> "AbstractGame":
+        """Vybuduje novou hru z dodaného snímku, kola a hráčů (ve stejném
+        pořadí jako v původní hře); tajenku vytvoří dodaná továrna."""
+        game = cls._create(phrase_factory(snapshot.phrase), wheel,
+                           list(players))
+        game.restore(snapshot, restore_random_state)
+        return game
+
+    @classmethod
+    def _create(cls, phrase: AbstractSecretPhrase, wheel: Wheel,
+                players: list[AbstractPlayer]) -> "AbstractGame":
+        """Vytvoří hru této třídy z tajenky, kola a seznamu hráčů."""
+        return cls(phrase, wheel, players)
+
 
 class MultiplayerGame(AbstractGame):
     """Instance hry, která je určena pro více hráčů."""
 
-    def __init__(self, phrase: str, wheel: Wheel, players: Iterable[AbstractPlayer]):
-        """"""
+    # Výchozí maximální počet hráčů jedné hry
+    MAX_PLAYERS = 5
+
+    def __init__(self, phrase: Union[str, AbstractSecretPhrase], wheel: Wheel,
+                 players: Iterable[AbstractPlayer],
+                 max_players: Optional[int] = MAX_PLAYERS):
+        """Initor, který kromě tajenky, kola štěstí a hráčů přijímá
+        volitelně maximální počet hráčů; hodnota `None` počet hráčů
+        neomezuje (např. pro simulace velkých lobby)."""
         super().__init__(phrase, wheel, players)
 
-        if len(self.players) > 5:
-            raise ValueError(f"Počet hráčů < 2: {len(self.players)}")
+        if max_players is not None and self.number_of_players > max_players:
+            raise ValueError(f"Počet hráčů > {max_players}: "
+                             f"{self.number_of_players}")
 
         # Index prvního hráče - ve výchozí pozici nastaveno na 0
         self.__current_player_idx = 0
@@ -129,7 +224,18 @@ class MultiplayerGame(AbstractGame):
     @property
     def current_player(self) -> AbstractPlayer:
         """Aktuální hráč, který je právě na tahu."""
-        return self.players[self.__current_player_idx]
+        return self._players[self.__current_player_idx]
+
+    @property
+    def current_player_index(self) -> int:
+        """Index (slot) hráče, který je právě na tahu."""
+        return self.__current_player_idx
+
+    def _set_current_player_index(self, index: int):
+        """Metoda nastaví hráče na tahu podle indexu."""
+        if not 0 <= index < self.number_of_players:
+            raise ValueError(f"Neplatný index hráče: {index}")
+        self.__current_player_idx = index
 
     def set_next_player(self):
         """Metoda, která se postará o nastavení dalšího hráče na tahu.
@@ -148,7 +254,8 @@ class MultiplayerGame(AbstractGame):
 class SinglePlayerGame(AbstractGame):
     """Instance hry, která je určena pro jediného hráče."""
 
-    def __init__(self, phrase: str, wheel: Wheel, player: AbstractPlayer):
+    def __init__(self, phrase: Union[str, AbstractSecretPhrase], wheel: Wheel,
+                 player: AbstractPlayer):
         """"""
         super().__init__(phrase, wheel, [player])
 
@@ -156,9 +263,28 @@ class SinglePlayerGame(AbstractGame):
     def current_player(self) -> AbstractPlayer:
         """Aktuální hráč, který je právě na tahu. V případě hry pro jediného
         hráče pouze vrací právě toho."""
-        return self.players[0]
+        return self._players[0]
 
     def set_next_player(self):
         """Pro hru jediného hráče je tato metoda redundantní."""
         ...
 
+    @property
+    def current_player_index(self) -> int:
+        """Index hráče na tahu, ve hře jediného hráče vždy 0."""
+        return 0
+
+    def _set_current_player_index(self, index: int):
+        """Ve hře jediného hráče je na tahu vždy hráč s indexem 0."""
+        if index != 0:
+            raise ValueError(f"Neplatný index hráče: {index}")
+
+    @classmethod
+    def _create(cls, phrase: AbstractSecretPhrase, wheel: Wheel,
+                players: list[AbstractPlayer]) -> "SinglePlayerGame":
+        """Vytvoří hru jediného hráče z tajenky, kola a seznamu hráčů."""
+        if len(players) != 1:
+            raise ValueError(f"Hra jediného hráče nemůže mít "
+                             f"{len(players)} hráčů")
+        return cls(phrase, wheel, players[0])
+
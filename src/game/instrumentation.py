@@ -0,0 +1,343 @@
+"""Tento modul obsahuje volitelnou instrumentaci moderátora.
+
+Instrumentace (`Instrumentation`) zaznamenává doby jednotlivých fází tahů
+her řízených moderátorem (viz `src.game.moderator.Moderator`):
+
+- `spin`: zatočení kolem,
+- `player`: čekání na tip hráče,
+- `phrase`: ověření tipu v tajence (odkrytí písmen),
+- `scoring`: připsání výhry, resp. bankrot,
+- `turn`: celý tah včetně replik moderátora,
+
+a čítače zatočení, bankrotů, tipů, neplatných (opakovaných) tipů, tahů a
+her. Doby se ukládají do histogramů s pevnými hranicemi přihrádek; záznam
+jedné doby ji jen připojí k seznamu, do přihrádek se doby rozřadí až po
+dávkách nebo při čtení histogramu.
+
+Moderátor bez instrumentace neplatí nic: instrumentace při připojení
+(`attach`) nahradí měřené metody konkrétního moderátora měřícími obaly,
+samotná třída `Moderator` žádné měření neobsahuje. Metody, které jsou
+korutinami (viz `src.game.async_moderator.AsyncModerator`), nahradí obaly,
+které jsou také korutinami.
+
+Výsledky lze vypsat jako slovník (`summary`) nebo v textovém formátu
+Prometheus (`prometheus`). Pro zvolené hry (podle pořadí) lze navíc
+zachytit profil `cProfile` a alokace `tracemalloc` (`capture`)."""
+
+import cProfile
+import pstats
+import tracemalloc
+from bisect import bisect_left
+from contextlib import contextmanager
+from inspect import iscoroutinefunction
+from time import perf_counter
+from typing import Callable, Iterator, NamedTuple, Optional
+
+from src.game.phrase import GuessError
+
+# Měřené fáze tahu
+PHASES = ("spin", "player", "phrase", "scoring", "turn")
+
+# Čítače událostí
+COUNTERS = ("spins", "bankrupts", "guesses", "invalid_guesses", "turns",
+            "games")
+
+# Výchozí horní hranice přihrádek histogramů v sekundách (1 µs až 10 s)
+DEFAULT_BOUNDS = tuple(float(f"{base}e{exponent}")
+                       for exponent in range(-6, 1)
+                       for base in (1, 2.5, 5)) + (10.0,)
+
+
+class Histogram:
+    """Histogram dob s pevnými horními hranicemi přihrádek.
+
+    Každá zaznamenaná hodnota se započítá do první přihrádky, jejíž hranice
+    není menší než hodnota; hodnoty nad nejvyšší hranicí do přihrádky
+    navíc (`+Inf`). Hodnoty se do přihrádek rozřazují po dávkách."""
+
+    __slots__ = ("_bounds", "_counts", "_count", "_sum", "_pending")
+
+    # Počet hodnot, po kterém se čekající hodnoty rozřadí do přihrádek
+    FLUSH_EVERY = 1024
+
+    def __init__(self, bounds: tuple[float, ...] = DEFAULT_BOUNDS):
+        """Initor, který přijímá vzestupně seřazené horní hranice
+        přihrádek."""
+        if not bounds or list(bounds) != sorted(set(bounds)):
+            raise ValueError(f"Hranice přihrádek musí být vzestupné: "
+                             f"{bounds}")
+
+        self._bounds = tuple(bounds)
+        self._counts = [0] * (len(bounds) + 1)
+        self._count = 0
+        self._sum = 0.0
+        self._pending: list[float] = []
+
+    @property
+    def bounds(self) -> tuple[float, ...]:
+        """Horní hranice přihrádek."""
+        return self._bounds
+
+    @property
+    def counts(self) -> tuple[int, ...]:
+        """Počty hodnot v jednotlivých přihrádkách (poslední je `+Inf`)."""
+        self.flush()
+        return tuple(self._counts)
+
+    @property
+    def count(self) -> int:
+        """Počet zaznamenaných hodnot."""
+        return self._count + len(self._pending)
+
+    @property
+    def sum(self) -> float:
+        """Součet zaznamenaných hodnot."""
+        self.flush()
+        return self._sum
+
+    def observe(self, value: float):
+        """Metoda zaznamená jednu hodnotu."""
+        pending = self._pending
+        pending.append(value)
+        if len(pending) >= self.FLUSH_EVERY:
+            self.flush()
+
+    def flush(self):
+        """Metoda rozřadí čekající hodnoty do přihrádek."""
+        pending = self._pending
+        if not pending:
+            return
+        counts = self._counts
+        bounds = self._bounds
+        for value in pending:
+            counts[bisect_left(bounds, value)] += 1
+        self._count += len(pending)
+        self._sum += sum(pending)
+        pending.clear()
+
+    def quantile(self, fraction: float) -> Optional[float]:
+        """Metoda vrací odhad kvantilu (horní hranici přihrádky, ve které
+        kvantil leží), nebo `None`, není-li zaznamenána žádná hodnota."""
+        if not 0 <= fraction <= 1:
+            raise ValueError(f"Kvantil musí ležet mezi 0 a 1: {fraction}")
+        self.flush()
+        if not self._count:
+            return None
+
+        rank = fraction * self._count
+        seen = 0
+        for bound, count in zip(self._bounds, self._counts):
+            seen += count
+            if seen >= rank and seen:
+                return bound
+        return float("inf")
+
+    def summary(self) -> dict:
+        """Metoda vrací souhrn histogramu jako slovník."""
+        self.flush()
+        return {
+            "count": self._count,
+            "sum": self._sum,
+            "mean": self._sum / self._count if self._count else None,
+            "p50": self.quantile(0.5),
+            "p90": self.quantile(0.9),
+            "p99": self.quantile(0.99),
+        }
+
+
+class Capture(NamedTuple):
+    """Zachycený profil jedné hry: statistiky `cProfile` (nebo `None`),
+    snímek alokací `tracemalloc` a špička alokované paměti v bajtech
+    (nebo `None`, nebyly-li alokace sledovány)."""
+
+    profile: Optional[pstats.Stats]
+    snapshot: Optional[tracemalloc.Snapshot]
+    peak_memory: Optional[int]
+
+
+class Instrumentation:
+    """Instance této třídy sbírají doby fází tahů a čítače událostí her
+    řízených připojenými moderátory. Jednu instanci lze sdílet mezi
+    libovolným počtem moderátorů; hry se číslují od 1 v pořadí, ve kterém
+    začaly."""
+
+    def __init__(self, bounds: tuple[float, ...] = DEFAULT_BOUNDS):
+        """Initor, který volitelně přijímá horní hranice přihrádek
+        histogramů v sekundách."""
+        self._histograms = {phase: Histogram(bounds) for phase in PHASES}
+        self._counters = dict.fromkeys(COUNTERS, 0)
+        self._requested: dict[int, tuple[bool, bool]] = {}
+        self._captures: dict[int, Capture] = {}
+
+    @property
+    def histograms(self) -> dict[str, Histogram]:
+        """Histogramy dob jednotlivých fází tahu."""
+        return self._histograms
+
+    @property
+    def counters(self) -> dict[str, int]:
+        """Kopie čítačů událostí."""
+        return dict(self._counters)
+
+    @property
+    def captures(self) -> dict[int, Capture]:
+        """Zachycené profily her podle pořadí hry."""
+        return self._captures
+
+    def capture(self, game_number: int, profile: bool = True,
+                memory: bool = False):
+        """Metoda vyžádá zachycení profilu (`cProfile`) a/nebo alokací
+        (`tracemalloc`) hry s dodaným pořadím (číslováno od 1)."""
+        if game_number < 1:
+            raise ValueError(f"Pořadí hry musí být kladné: {game_number}")
+        if not (profile or memory):
+            raise ValueError("Není co zachytit!")
+        self._requested[game_number] = (profile, memory)
+
+    def attach(self, moderator) -> "Instrumentation":
+        """Metoda připojí instrumentaci k dodanému moderátorovi: jeho
+        měřené metody nahradí měřícími obaly (pouze u této instance).
+        Vrací sama sebe."""
+        histograms = self._histograms
+        counters = self._counters
+
+        def timed(method: Callable, phase: str,
+                  counter: Optional[str] = None) -> Callable:
+            observe = histograms[phase].observe
+
+            if iscoroutinefunction(method):
+                async def async_wrapper(*args):
+                    start = perf_counter()
+                    try:
+                        return await method(*args)
+                    finally:
+                        observe(perf_counter() - start)
+                        if counter is not None:
+                            counters[counter] += 1
+                return async_wrapper
+
+            def wrapper(*args):
+                start = perf_counter()
+                try:
+                    return method(*args)
+                finally:
+                    observe(perf_counter() - start)
+                    if counter is not None:
+                        counters[counter] += 1
+            return wrapper
+
+        check_guess = moderator.check_guess
+        observe_phrase = histograms["phrase"].observe
+
+        def timed_check_guess(guess):
+            start = perf_counter()
+            try:
+                occurrences = check_guess(guess)
+            except GuessError:
+                counters["invalid_guesses"] += 1
+                raise
+            finally:
+                observe_phrase(perf_counter() - start)
+            counters["guesses"] += 1
+            return occurrences
+
+        moderator.turn_wheel = timed(moderator.turn_wheel, "spin", "spins")
+        moderator.ask_for_letter = timed(moderator.ask_for_letter, "player")
+        moderator.check_guess = timed_check_guess
+        moderator.award_prize = timed(moderator.award_prize, "scoring")
+        moderator.handle_bankrupt = timed(moderator.handle_bankrupt,
+                                          "scoring", "bankrupts")
+        moderator.do_the_turn = timed(moderator.do_the_turn, "turn", "turns")
+        moderator.run_game = self._captured(moderator)
+        return self
+
+    def summary(self) -> dict:
+        """Metoda vrací souhrn čítačů a histogramů jako slovník."""
+        return {
+            "counters": dict(self._counters),
+            "phases": {phase: histogram.summary()
+                       for phase, histogram in self._histograms.items()},
+        }
+
+    def prometheus(self, prefix: str = "wheel_of_fortune") -> str:
+        """Metoda vrací čítače a histogramy v textovém formátu Prometheus.
+        """
+        lines = []
+        for counter, value in self._counters.items():
+            name = f"{prefix}_{counter}_total"
+            lines.append(f"# TYPE {name} counter")
+            lines.append(f"{name} {value}")
+
+        name = f"{prefix}_phase_seconds"
+        lines.append(f"# HELP {name} Doba fáze tahu v sekundách.")
+        lines.append(f"# TYPE {name} histogram")
+        for phase, histogram in self._histograms.items():
+            cumulative = 0
+            for bound, count in zip(histogram.bounds + (float("inf"),),
+                                    histogram.counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f'{name}_bucket{{phase="{phase}",le="{le}"}} '
+                             f'{cumulative}')
+            lines.append(f'{name}_sum{{phase="{phase}"}} {histogram.sum!r}')
+            lines.append(f'{name}_count{{phase="{phase}"}} {histogram.count}')
+        return "\n".join(lines) + "\n"
+
+    def _captured(self, moderator) -> Callable:
+        """Metoda vrací obal metody `run_game` dodaného moderátora, který
+        hru započítá, a je-li pro ni vyžádáno zachycení, zachytí její profil
+        a alokace. Po skončení hry obaly metod moderátora odstraní. Je-li
+        `run_game` korutinou (viz `AsyncModerator`), je obal také
+        korutinou."""
+        run_game = moderator.run_game
+
+        if iscoroutinefunction(run_game):
+            async def async_wrapper():
+                try:
+                    with self._game():
+                        return await run_game()
+                finally:
+                    moderator.remove_hooks()
+            return async_wrapper
+
+        def wrapper():
+            try:
+                with self._game():
+                    return run_game()
+            finally:
+                moderator.remove_hooks()
+        return wrapper
+
+    @contextmanager
+    def _game(self) -> Iterator[None]:
+        """Metoda vrací kontext, ve kterém se odehraje jedna hra: hru
+        započítá, a je-li pro ni vyžádáno zachycení, zachytí její profil
+        a alokace."""
+        self._counters["games"] += 1
+        number = self._counters["games"]
+        request = self._requested.pop(number, None)
+        if request is None:
+            yield
+            return
+
+        profile, memory = request
+        profiler = cProfile.Profile() if profile else None
+        tracing = memory and not tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.start()
+        if memory:
+            tracemalloc.reset_peak()
+        if profiler is not None:
+            profiler.enable()
+        try:
+            yield
+        finally:
+            if profiler is not None:
+                profiler.disable()
+            snapshot = tracemalloc.take_snapshot() if memory else None
+            peak = tracemalloc.get_traced_memory()[1] if memory else None
+            if tracing:
+                tracemalloc.stop()
+            self._captures[number] = Capture(
+                pstats.Stats(profiler) if profiler is not None else None,
+                snapshot, peak)
@@ -0,0 +1,25 @@
+"""Tento modul vybírá implementaci jádra hry, tedy jednoho tahu
+(`play_turn`) a hádání v úsporné tajence (`FastSecretPhrase`).
+
+Je-li sestaveno zkompilované jádro `src.game._kernel` (Cython, příkazem
+`cythonize -i src/game/_kernel.pyx`), použije se jeho implementace; jinak
+referenční implementace v čistém Pythonu (`src.game.turn.play_turn` a
+`CompactSecretPhrase`). Obě dávají shodné výsledky, což ověřuje
+`python -m benchmarks.kernel` a testy `tests/test_kernel.py`.
+
+Referenční implementace jsou vždy dostupné pod jmény `python_play_turn` a
+`PythonSecretPhrase`; zda je jádro zkompilované, udává `ACCELERATED`."""
+
+from src.game.phrase import CompactSecretPhrase
+from src.game.turn import play_turn as python_play_turn
+
+# Referenční implementace úsporné tajenky
+PythonSecretPhrase = CompactSecretPhrase
+
+try:
+    from src.game._kernel import FastSecretPhrase, play_turn
+    ACCELERATED = True
+except ImportError:
+    FastSecretPhrase = CompactSecretPhrase
+    play_turn = python_play_turn
+    ACCELERATED = False
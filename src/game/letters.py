@@ -0,0 +1,234 @@
+"""Tento modul obsahuje evidenci již zkoušených písmen hry.
+
+Zkoušená písmena (`GuessedLetters`) si hra eviduje jako bitovou množinu
+normalizovaných písmen (bez diakritiky a velkými písmeny, viz
+`Letter.process`): každé písmeno abecedy (`ALPHABET`) má svůj bit, takže
+dotaz, zda-li již bylo písmeno zkoušeno (třeba i s diakritikou či malým
+písmenem), stojí jediné vyhledání ve slovníku a bitový součin. Znaky mimo
+abecedu (číslice, cizí písma) se evidují v doplňkové množině.
+
+Hráči dostávají místo kopie seznamu pohled jen pro čtení
+(`GuessedLettersView`), který se chová jako n-tice zkoušených písmen
+v pořadí, ve kterém byla zkoušena, a navíc zpřístupňuje bitovou masku.
+Pořadí písmen hráče (`LetterRanking`) z masky určí první dosud nezkoušené
+písmeno několika bitovými operacemi."""
+
+from functools import lru_cache
+from typing import Iterable, Iterator, Optional, Union
+
+from src.game.phrase import FOLDED_RANGE, Letter
+
+# Abeceda normalizovaných písmen, která mají v bitové množině svůj bit
+ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+# Bit každého normalizovaného písmena abecedy
+_KEY_BITS: dict[str, int] = {
+    letter: 1 << position for position, letter in enumerate(ALPHABET)}
+
+# Předpočítané bity znaků z rozsahu `FOLDED_RANGE` (tedy včetně malých
+# písmen a české diakritiky), jejichž normalizovaná podoba leží v abecedě
+_LETTER_BITS: dict[str, int] = {
+    chr(code_point): _KEY_BITS[Letter.process(chr(code_point))]
+    for code_point in FOLDED_RANGE
+    if Letter.process(chr(code_point)) in _KEY_BITS}
+
+# Počet bitů abecedy, které pokrývá jedna převodní tabulka pořadí písmen
+# (abeceda se tak vejde do čtyř tabulek, viz `LetterRanking`)
+_CHUNK = 8
+
+
+def letter_bit(letter: str) -> int:
+    """Funkce vrací bit normalizované podoby dodaného znaku v bitové
+    množině zkoušených písmen, nebo 0, leží-li mimo abecedu."""
+    bit = _LETTER_BITS.get(letter)
+    if bit is None:
+        return _KEY_BITS.get(Letter.process(letter), 0)
+    return bit
+
+
+def guessed_mask(already_guessed: Iterable[str]) -> int:
+    """Funkce vrací bitovou masku dodaných zkoušených písmen. Pohled
+    `GuessedLettersView` (i samotná evidence `GuessedLetters`) masku již
+    má, pro jiné kolekce písmen se sestaví."""
+    if isinstance(already_guessed, (GuessedLettersView, GuessedLetters)):
+        return already_guessed.mask
+
+    mask = 0
+    for letter in already_guessed:
+        mask |= letter_bit(letter)
+    return mask
+
+
+class GuessedLetters:
+    """Instance této třídy evidují písmena zkoušená v jedné hře: v pořadí,
+    ve kterém byla zkoušena, a jako bitovou množinu jejich normalizovaných
+    podob. Opakované písmeno (i v jiné velikosti či s diakritikou) lze
+    odhalit v konstantním čase."""
+
+    __slots__ = ("_letters", "_mask", "_others", "_view")
+
+    def __init__(self, letters: Iterable[str] = ()):
+        """Initor, který volitelně přijímá již zkoušená písmena."""
+        self._letters: list[str] = []
+        self._mask = 0
+        self._others: set[str] = set()
+        self._view = GuessedLettersView(self)
+        for letter in letters:
+            self.add(letter)
+
+    @property
+    def mask(self) -> int:
+        """Bitová maska zkoušených písmen abecedy (viz `letter_bit`)."""
+        return self._mask
+
+    @property
+    def view(self) -> "GuessedLettersView":
+        """Pohled jen pro čtení, který se předává hráčům."""
+        return self._view
+
+    def __len__(self) -> int:
+        return len(self._letters)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._letters)
+
+    def __contains__(self, letter: str) -> bool:
+        """Zda-li již byl dodaný znak (po normalizaci) zkoušen."""
+        bit = _LETTER_BITS.get(letter)
+        if bit is None:
+            key = Letter.process(letter)
+            bit = _KEY_BITS.get(key)
+            if bit is None:
+                return key in self._others
+        return self._mask & bit != 0
+
+    def add(self, letter: str) -> bool:
+        """Metoda zaeviduje zkoušené písmeno. Vrací False (a nic
+        neeviduje), pokud již bylo písmeno zkoušeno, jinak True."""
+        bit = letter_bit(letter)
+        if bit:
+            if self._mask & bit:
+                return False
+            self._mask |= bit
+        else:
+            key = Letter.process(letter)
+            if key in self._others:
+                return False
+            self._others.add(key)
+        self._letters.append(letter)
+        return True
+
+    def replace(self, letters: Iterable[str]):
+        """Metoda nahradí evidovaná písmena dodanými (např. při obnově hry
+        ze snímku)."""
+        self._letters.clear()
+        self._mask = 0
+        self._others.clear()
+        for letter in letters:
+            self.add(letter)
+
+
+class GuessedLettersView:
+    """Pohled jen pro čtení na zkoušená písmena hry. Chová se jako n-tice
+    zkoušených písmen (délka, iterace, indexování), test `in` však
+    porovnává normalizované podoby a stojí konstantní čas. Pohled je živý:
+    odráží i písmena zkoušená po jeho předání."""
+
+    __slots__ = ("_guessed",)
+
+    def __init__(self, guessed: GuessedLetters):
+        """Initor, který přijímá evidenci zkoušených písmen."""
+        self._guessed = guessed
+
+    @property
+    def mask(self) -> int:
+        """Bitová maska zkoušených písmen abecedy (viz `letter_bit`)."""
+        return self._guessed._mask
+
+    def __len__(self) -> int:
+        return len(self._guessed._letters)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._guessed._letters)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, tuple]:
+        if isinstance(index, slice):
+            return tuple(self._guessed._letters[index])
+        return self._guessed._letters[index]
+
+    def __contains__(self, letter: str) -> bool:
+        return letter in self._guessed
+
+    def __repr__(self):
+        return f"{type(self).__name__}({tuple(self._guessed._letters)})"
+
+
+class LetterRanking:
+    """Pořadí písmen (např. podle četnosti v jazyce), ve kterém hráč
+    hádá. První dosud nezkoušené písmeno pořadí určí z bitové masky
+    zkoušených písmen v konstantním čase: maska se po bajtech převede
+    předpočítanými tabulkami na masku pořadí (bit i odpovídá i-tému písmenu
+    pořadí) a hledané písmeno odpovídá nejnižšímu nenastavenému bitu.
+
+    Tabulky jsou pro stejná pořadí sdílené, při kopírování a serializaci se
+    nepřenášejí (pořadí se vybuduje znovu ze svých písmen)."""
+
+    __slots__ = ("_letters", "_full", "_tables")
+
+    def __init__(self, letters: Iterable[str]):
+        """Initor, který přijímá písmena v pořadí, ve kterém se mají hádat.
+        Písmena se normalizují stejně jako písmena hry (bez diakritiky
+        a velkými písmeny, viz `Letter.process`) a opakovaná písmena (např.
+        „A“ a „Á“) se vynechají, rozhoduje jejich první výskyt. Znak, jehož
+        normalizovaná podoba leží mimo abecedu (`ALPHABET`), např. číslice,
+        vyhodí výjimku `ValueError`."""
+        self._letters = tuple(dict.fromkeys(
+            Letter.process(letter) for letter in letters))
+        self._full = (1 << len(self._letters)) - 1
+        self._tables = _ranking_tables(self._letters)
+
+    def __reduce__(self):
+        return type(self), (self._letters,)
+
+    @property
+    def letters(self) -> tuple[str, ...]:
+        """Písmena v pořadí, ve kterém se hádají."""
+        return self._letters
+
+    def first_unguessed(self, mask: int) -> Optional[str]:
+        """Metoda vrací první písmeno pořadí, které není v dodané masce
+        zkoušených písmen (viz `guessed_mask`), nebo `None`, byla-li
+        zkoušena všechna."""
+        first, second, third, fourth = self._tables
+        used = (first[mask & 0xFF] | second[mask >> 8 & 0xFF]
+                | third[mask >> 16 & 0xFF] | fourth[mask >> 24 & 0xFF])
+        free = self._full & ~used
+        if not free:
+            return None
+        return self._letters[(free & -free).bit_length() - 1]
+
+
+@lru_cache(maxsize=64)
+def _ranking_tables(letters: tuple[str, ...]) -> tuple[tuple[int, ...], ...]:
+    """Funkce vrací převodní tabulky pořadí normalizovaných písmen bez
+    opakování (viz `LetterRanking`): pro každý bajt masky abecedy tabulku
+    jeho hodnot na masky pořadí."""
+    bits = []
+    for letter in letters:
+        bit = letter_bit(letter)
+        if not bit:
+            raise ValueError(f"Písmeno mimo abecedu: '{letter}'")
+        bits.append(bit)
+
+    tables = []
+    for offset in range(0, len(ALPHABET), _CHUNK):
+        ranks = [bits.index(1 << position) if 1 << position in bits else None
+                 for position in range(offset, offset + _CHUNK)]
+        table = [0] * (1 << _CHUNK)
+        for value in range(1, 1 << _CHUNK):
+            low = value & -value
+            rank = ranks[low.bit_length() - 1]
+            table[value] = table[value ^ low] | (
+                0 if rank is None else 1 << rank)
+        tables.append(tuple(table))
+    return tuple(tables)
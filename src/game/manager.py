@@ -0,0 +1,137 @@
+"""Tento modul obsahuje správce mnoha souběžně běžících her.
+
+Správce hostí v jednom procesu tisíce her najednou. Hry jsou uloženy
+v kompaktní podobě (tajenka jako `CompactSecretPhrase`, hráči sdílení mezi
+hrami) a posouvají se po dávkách: jedno tiknutí (`tick`) odehraje jeden tah
+v každé aktivní hře. Dohrané hry jsou ze správce odstraněny a jejich
+výsledky (`GameResult`) předány volajícímu.
+
+Tahy se řídí stejnými pravidly jako u simulátoru (viz funkce
+`src.game.turn.play_turn`). Hráči sdílení více hrami najednou proto
+nesmí mezi tahy uchovávat stav konkrétní hry.
+
+Výchozí továrna her (`unlimited_game`) počet hráčů jedné hry neomezuje;
+limit `MultiplayerGame.MAX_PLAYERS` platí jen s továrnou `MultiplayerGame`."""
+
+from typing import Callable, Iterable, Optional, Union
+
+from src.game.analytics import AnalyticsCache
+from src.game.game import AbstractGame, MultiplayerGame
+from src.game.kernel import FastSecretPhrase
+from src.game.phrase import AbstractSecretPhrase
+from src.game.simulation import (
+    BANKRUPT, GIVE_UP, GameResult, Simulator, game_result, play_turn)
+from src.game.wheel import Wheel
+from src.player.abstract_player import AbstractPlayer
+
+
+def unlimited_game(phrase: AbstractSecretPhrase, wheel: Wheel,
+                   players: Iterable[AbstractPlayer]) -> MultiplayerGame:
+    """Výchozí továrna her správce: hra pro více hráčů bez omezení jejich
+    počtu."""
+    return MultiplayerGame(phrase, wheel, players, max_players=None)
+
+
+class _ManagedGame:
+    """Záznam o jedné spravované hře a jejích průběžných počítadlech."""
+
+    __slots__ = ("game", "turns", "bankrupts", "guesses")
+
+    def __init__(self, game: AbstractGame):
+        """Initor, který přijímá spravovanou hru."""
+        self.game = game
+        self.turns = 0
+        self.bankrupts = 0
+        self.guesses = 0
+
+
+class GameManager:
+    """Instance této třídy spravují mnoho souběžných her a posouvají je po
+    dávkách, vždy o jeden tah v každé aktivní hře."""
+
+    def __init__(self, wheel: Wheel,
+                 max_turns: int = Simulator.DEFAULT_MAX_TURNS,
+                 game_factory: Callable[..., AbstractGame] = unlimited_game,
+                 analytics: Optional[AnalyticsCache] = None):
+        """Initor, který přijímá kolo štěstí sdílené všemi hrami, maximální
+        počet tahů jedné hry, továrnu, která ze trojice (tajenka, kolo,
+        hráči) vybuduje hru (výchozí `unlimited_game` počet hráčů
+        neomezuje), a volitelně mezipaměť analýz tajenek."""
+        if max_turns < 1:
+            raise ValueError(f"Maximální počet tahů musí být kladný: "
+                             f"{max_turns}")
+
+        self._wheel = wheel
+        self._max_turns = max_turns
+        self._game_factory = game_factory
+        self._analytics = analytics
+        self._active: dict[int, _ManagedGame] = {}
+        self._next_id = 0
+
+    @property
+    def wheel(self) -> Wheel:
+        """Kolo štěstí sdílené všemi hrami."""
+        return self._wheel
+
+    @property
+    def active_games(self) -> int:
+        """Počet dosud nedohraných her."""
+        return len(self._active)
+
+    def game(self, game_id: int) -> Optional[AbstractGame]:
+        """Metoda vrací aktivní hru s daným identifikátorem, nebo `None`,
+        pokud taková hra není (např. již byla dohrána)."""
+        record = self._active.get(game_id)
+        return record.game if record is not None else None
+
+    def add_game(self, phrase: Union[str, AbstractSecretPhrase],
+                 players: Iterable[AbstractPlayer]) -> int:
+        """Metoda přidá novou hru a vrací její identifikátor. Tajenka
+        zadaná textovým řetězcem je uložena jako `CompactSecretPhrase`
+        (se zkompilovaným hádáním, je-li k dispozici, a vytvořená
+        z mezipaměti analýz, má-li ji správce k dispozici)."""
+        if isinstance(phrase, str):
+            phrase = (FastSecretPhrase(phrase) if self._analytics is None
+                      else self._analytics.create_phrase(phrase))
+
+        game_id = self._next_id
+        self._next_id += 1
+        self._active[game_id] = _ManagedGame(
+            self._game_factory(phrase, self._wheel, players))
+        return game_id
+
+    def tick(self) -> list[tuple[int, GameResult]]:
+        """Metoda odehraje jeden tah v každé aktivní hře. Hry, které tímto
+        tahem skončily, odstraní a vrací seznam dvojic (identifikátor hry,
+        výsledek)."""
+        max_turns = self._max_turns
+        finished: list[tuple[int, GameResult]] = []
+
+        for game_id, record in self._active.items():
+            game = record.game
+            outcome = None
+            if not game.phrase.is_finished:
+                record.turns += 1
+                outcome = play_turn(game)
+                if outcome == BANKRUPT:
+                    record.bankrupts += 1
+                elif outcome != GIVE_UP:
+                    record.guesses += 1
+
+            solved = game.phrase.is_finished
+            if solved or outcome == GIVE_UP or record.turns >= max_turns:
+                finished.append((game_id, game_result(
+                    game, solved, record.turns, record.bankrupts,
+                    record.guesses)))
+
+        for game_id, _ in finished:
+            del self._active[game_id]
+        return finished
+
+    def run(self) -> dict[int, GameResult]:
+        """Metoda tiká, dokud nejsou všechny hry dohrány, a vrací výsledky
+        her podle jejich identifikátorů."""
+        results: dict[int, GameResult] = {}
+        while self._active:
+            results.update(self.tick())
+        return results
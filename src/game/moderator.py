@@ -2,10 +2,18 @@
 v rámci této hry.
 
 Moderátor je odpovědný za řízení celé hry v kontextu dotazování se
-jednotlivých hráčů na jejich tipy, stejně jako na přiřazování pořadí."""
+jednotlivých hráčů na jejich tipy, stejně jako na přiřazování pořadí.
+
+Průběh her lze volitelně měřit instrumentací (viz
+`src.game.instrumentation`) a zaznamenávat do záznamu her (viz
+`src.game.event_log`)."""
+
+from typing import Optional
 
 from src.game import Wedge
+from src.game.event_log import EventLog
 from src.game.game import AbstractGame
+from src.game.instrumentation import Instrumentation
 from src.game.phrase import GuessError
 from src.player.abstract_player import AbstractPlayer
 
@@ -15,13 +23,27 @@ class Moderator:
     a celkově interagují s hráčem.
     """
 
-    def __init__(self, game: AbstractGame, quiet: bool = False):
+    # Metody, které instrumentace a záznam her nahrazují obaly u konkrétní
+    # instance moderátora (viz `remove_hooks`)
+    HOOKS = ("turn_wheel", "ask_for_letter", "check_guess", "award_prize",
+             "handle_bankrupt", "do_the_turn", "run_game")
+
+    def __init__(self, game: AbstractGame, quiet: bool = False,
+                 instrumentation: Optional[Instrumentation] = None,
+                 event_log: Optional[EventLog] = None):
         """Initor, který přijímá instanci třídy `AbstractGame`, o kterou
         se má za úkol starat. Dále volitelný parametr `quiet`, který umožňuje
-        moderátora 'umlčet', aby nevypisoval do konzole všechny repliky.
+        moderátora 'umlčet', aby nevypisoval do konzole všechny repliky,
+        volitelnou instrumentaci, která měří průběh hry, a volitelný záznam
+        her, do kterého se hra po skončení zapíše.
         """
         self._game = game
         self._quiet = quiet
+        self._instrumentation = instrumentation
+        if instrumentation is not None:
+            instrumentation.attach(self)
+        if event_log is not None:
+            event_log.attach(self)
 
     @property
     def game(self) -> AbstractGame:
@@ -33,6 +55,21 @@ class Moderator:
         """Vrací, zda-li by měl moderátor mlčet či vypisovat do konzole."""
         return self._quiet
 
+    @property
+    def instrumentation(self) -> Optional[Instrumentation]:
+        """Vrací instrumentaci, která měří průběh hry, nebo `None`."""
+        return self._instrumentation
+
+    def remove_hooks(self):
+        """Metoda odstraní obaly metod (viz `HOOKS`), které instanci připojila
+        instrumentace či záznam her. Volají ji obaly metody `run_game` po
+        skončení hry, neboť obaly odkazují na moderátora, a dokud existují,
+        tvoří s ním cyklus referencí, který by hru udržoval v paměti až do
+        běhu garbage collectoru."""
+        attributes = vars(self)
+        for name in self.HOOKS:
+            attributes.pop(name, None)
+
     def say(self, *replicas):
         """Metoda, pomocí které je možné řídít výřečnost moderátora. Pokud je
         nastavena instanční proměnná `quiet` na True, nebude zahlcovat konzoli
@@ -72,6 +109,20 @@ class Moderator:
         """Metoda, která zatočí kolem štěstí. Vytočené políčko pak vrací."""
         return self.game.turn_the_wheel()
 
+    def check_guess(self, guess: str) -> int:
+        """Metoda ověří tip hráče v tajence (odkryje uhodnutá písmena) a
+        vrací počet jeho výskytů. Tip, který tajenka nepřijme, nebo již
+        zkoušené písmeno vyhodí výjimku `GuessError`."""
+        return self.game.check_guess(guess)
+
+    def award_prize(self, player: AbstractPlayer, wedge: Wedge,
+                    occurrences: int) -> int:
+        """Metoda připíše hráči výhru za dodaný počet uhodnutých výskytů
+        na vytočeném klínu a vrací ji."""
+        prize = wedge.multiplier * occurrences
+        self.game.increase_player_score(player, prize)
+        return prize
+
     def handle_bankrupt(self, player: AbstractPlayer):
         """Metoda, která má za cíl řídit průběh situace, kdy je hráči vytočeno
         políčko bankrotu. Pokud se tak stane, nemá nárok na žádné body (naopak
@@ -104,7 +155,7 @@ class Moderator:
             """Vyzkoušej, zda-li uživatelův vstup není chybný (tedy který by
             tajenka nepřijala). Typicky jde o vstupy, které jsou víceznaké."""
             try:
-                occurrences = self.game.phrase.guess(guess)
+                occurrences = self.check_guess(guess)
             except GuessError as ge:
                 self.say(f"Pokus {ge.problem_letter} nelze použít... "
                          f"Zkuste to znovu!")
@@ -116,8 +167,7 @@ class Moderator:
         počítané jako násobek multiplikátoru políčka a počtu výskytů daného
         písmene v tajence. Zároveň má hráč nárok na další tah (vrací True)."""
         if occurrences > 0:
-            prize = wedge.multiplier * occurrences
-            self.game.increase_player_score(player, prize)
+            prize = self.award_prize(player, wedge, occurrences)
             self.say(f"Uhodl jste {occurrences} znaků v tajence a dostáváte "
                      f"{prize} bodů!")
             return True
@@ -10,6 +10,8 @@ odkryt."""
 
 # Import knihovny pro práci se znaky s diakritikou
 import unicodedata
+from abc import ABC, abstractmethod
+from typing import Optional
 
 
 class Letter:
@@ -80,22 +82,112 @@ class Letter:
         if len(letter) != 1:
             raise GuessError(f"Povolen je právě jeden znak: '{letter}'!")
 
-        letter = self.process(letter)
-
-        if letter == self.process(self.__letter) and not self.is_revealed:
-            self._is_revealed = True
-            return True
+        if self.process(letter) == self.key:
+            return self.reveal()
         return False
 
+    @property
+    def key(self) -> str:
+        """Znak ve tvaru, ve kterém se porovnává s hádanými písmeny (tedy
+        bez diakritiky a velkými písmeny)."""
+        return self.process(self.__letter)
+
+    def reveal(self) -> bool:
+        """Metoda odkryje znak bez ohledu na hádané písmeno. Vrací True,
+        pokud byl znak doposud skrytý, jinak False."""
+        if self._is_revealed:
+            return False
+        self._is_revealed = True
+        return True
+
+    def hide(self) -> bool:
+        """Metoda znovu skryje znak (speciální znaky zůstávají odkryté).
+        Vrací True, pokud byl znak doposud odkrytý, jinak False."""
+        if not self._is_revealed or self._is_special:
+            return False
+        self._is_revealed = False
+        return True
+
     @staticmethod
     def process(letter: str) -> str:
         """Upraví textový řetězec tak, aby se dal porovnat nezávisle na
         velikosti písmen ani na diakritice.
         """
-        return remove_accents(letter).upper()
+        return fold_letter(letter).upper()
+
 
+class AbstractSecretPhrase(ABC):
+    """Abstraktní předek všech tajenek, který definuje společný protokol,
+    pomocí kterého s tajenkou pracuje hra, moderátor i hráči.
 
-class SecretPhrase:
+    Díky tomu jsou jednotlivé implementace tajenky (`SecretPhrase` a úsporná
+    `CompactSecretPhrase`) vzájemně zaměnitelné."""
+
+    # Předek nemá vlastní atributy, aby potomci se `__slots__` (úsporná
+    # tajenka) neměli slovník atributů
+    __slots__ = ()
+
+    # Speciální znaky, které se nehádají
+    SPECIAL_CHARACTERS = [" ", '"', "'", ",", "-", ".", "!", "?"]
+
+    @property
+    @abstractmethod
+    def current_phrase(self) -> str:
+        """Aktuální podoba hádánky se zakrytými neuhodnutými písmeny."""
+
+    @property
+    @abstractmethod
+    def phrase_len(self) -> int:
+        """Délka celé tajenky."""
+
+    @property
+    @abstractmethod
+    def text(self) -> str:
+        """Celé znění tajenky v původní podobě."""
+
+    @property
+    @abstractmethod
+    def revealed_mask(self) -> int:
+        """Maska odkrytých pozic tajenky (bit `i` odpovídá pozici `i`)."""
+
+    @abstractmethod
+    def restore_revealed(self, mask: int):
+        """Abstraktní metoda, která odkryje právě pozice dodané masky (viz
+        `revealed_mask`) a ostatní skryje; speciální znaky zůstávají vždy
+        odkryté. Slouží k obnovení stavu tajenky ze snímku hry."""
+
+    @property
+    @abstractmethod
+    def revealed_characters(self) -> tuple[Letter]:
+        """Všechny odkryté znaky."""
+
+    @property
+    @abstractmethod
+    def hidden_characters(self) -> tuple[Letter]:
+        """Všechny doposud neodkryté znaky."""
+
+    @property
+    @abstractmethod
+    def special_characters(self) -> tuple[Letter]:
+        """Všechny speciální znaky tajenky."""
+
+    @property
+    @abstractmethod
+    def is_finished(self) -> bool:
+        """Je-li tajenka rozluštěna, tedy není-li žádný znak skrytý."""
+
+    @abstractmethod
+    def guess(self, letter: str) -> int:
+        """Abstraktní metoda, která vrací počet nově odkrytých výskytů daného
+        písmene v tajenke. Pokud dodaný počet znaků odhadovaného řetězce není
+        roven 1, je vyhozena výjimka `GuessError`."""
+
+    def __repr__(self):
+        """Vrací textovou reprezentaci akutální podoby tajenky."""
+        return self.current_phrase
+
+
+class SecretPhrase(AbstractSecretPhrase):
     """Instance této třídy reprezentují tajenku, která má být uhodnuta.
     Samotná tajenka se sestává z písmen, která jsou obalena instancemi třídy
     Letter.
@@ -112,9 +204,6 @@ class SecretPhrase:
     smysl skrývat, celý seznam takovýchto znaků lze vidět v třídní proměnné
     `SPECIAL_CHARACTERS`."""
 
-    # Speciální znaky, které se nehádají
-    SPECIAL_CHARACTERS = [" ", '"', "'", ",", "-", ".", "!", "?"]
-
     def __init__(self, phrase: str):
         """Initor, který přijímá tajnou frázi (tajenku) k uhodnutí.
         Ta musí být neprázdná, jinak je vyhozena výjimka.
@@ -131,24 +220,63 @@ class SecretPhrase:
         self.__phrase = phrase
         self.__letters = []
 
+        # Index pozic znaků podle jejich porovnávacího tvaru; hádání pak
+        # prochází jen pozice odpovídající hádanému písmenu
+        self.__positions: dict[str, list[int]] = {}
+
         # Pro každé jedno písmeno v dodané tajence
-        for letter in list(phrase):
-            self.__letters.append(
-                Letter(letter, letter in self.SPECIAL_CHARACTERS))
+        for position, letter in enumerate(phrase):
+            wrapped = Letter(letter, letter in self.SPECIAL_CHARACTERS)
+            self.__letters.append(wrapped)
+            if not wrapped.is_special:
+                self.__positions.setdefault(wrapped.key, []).append(position)
+
+        # Průběžně udržovaná podoba tajenky a počet skrytých znaků; obojí se
+        # mění pouze tehdy, když hádání nějaký znak odkryje
+        self.__rendered = [ltr.letter for ltr in self.__letters]
+        self.__current = "".join(self.__rendered)
+        self.__hidden = sum([not ltr.is_revealed for ltr in self.__letters])
 
     @property
     def current_phrase(self) -> str:
         """Aktuální podoba hádánky se zakrytými neuhodnutými písmeny."""
-        phrase = ""
-        for letter in self.__letters:
-            phrase += letter.letter
-        return phrase
+        if self.__current is None:
+            self.__current = "".join(self.__rendered)
+        return self.__current
 
     @property
     def phrase_len(self) -> int:
         """Délka celé tajenky."""
         return len(self.__phrase)
 
+    @property
+    def text(self) -> str:
+        """Celé znění tajenky v původní podobě."""
+        return self.__phrase
+
+    @property
+    def revealed_mask(self) -> int:
+        """Maska odkrytých pozic tajenky (bit `i` odpovídá pozici `i`)."""
+        mask = 0
+        for position, letter in enumerate(self.__letters):
+            if letter.is_revealed:
+                mask |= 1 << position
+        return mask
+
+    def restore_revealed(self, mask: int):
+        """Metoda odkryje právě pozice dodané masky a ostatní skryje."""
+        if mask >> len(self.__letters):
+            raise ValueError(f"Maska přesahuje délku tajenky: {mask:#x}")
+
+        for position, letter in enumerate(self.__letters):
+            if mask >> position & 1:
+                letter.reveal()
+            else:
+                letter.hide()
+        self.__rendered = [ltr.letter for ltr in self.__letters]
+        self.__current = None
+        self.__hidden = sum([not ltr.is_revealed for ltr in self.__letters])
+
     @property
     def revealed_characters(self) -> tuple[Letter]:
         """Všechny odkryté znaky."""
@@ -167,7 +295,7 @@ class SecretPhrase:
     @property
     def is_finished(self) -> bool:
         """Je-li tajenka rozluštěna, tedy není-li žádný znak skrytý."""
-        return len(self.hidden_characters) == 0
+        return self.__hidden == 0
 
     def guess(self, letter: str) -> int:
         """Funkce, která vrací počet nalezených výskytů daného písmene v
@@ -177,11 +305,218 @@ class SecretPhrase:
         if len(letter) != 1:
             raise GuessError(f"Povolen je právě jeden znak: '{letter}'!")
 
-        return len([ltr for ltr in self.__letters if ltr.guess(letter)])
+        positions = self.__positions.get(Letter.process(letter), ())
+        letters = self.__letters
+        rendered = self.__rendered
 
-    def __repr__(self):
-        """Vrací textovou reprezentaci akutální podoby tajenky."""
-        return self.current_phrase
+        occurrences = 0
+        for position in positions:
+            wrapped = letters[position]
+            if wrapped.reveal():
+                rendered[position] = wrapped.letter
+                occurrences += 1
+
+        # Podoba tajenky se přestaví až při dalším dotazu
+        if occurrences:
+            self.__hidden -= occurrences
+            self.__current = None
+        return occurrences
+
+
+class CompactSecretPhrase(AbstractSecretPhrase):
+    """Úsporná varianta tajenky, která je zaměnitelná se `SecretPhrase`.
+
+    Místo jedné instance `Letter` pro každý znak si uchovává pouze původní
+    text, řetězec porovnávacích tvarů znaků (jeden znak na pozici) a masku
+    odkrytých pozic v podobě celého čísla (bitová množina). Instance třídy
+    `Letter` vytváří až na požádání jako pohledy na aktuální stav.
+
+    Hodí se tam, kde je v paměti najednou velké množství tajenek."""
+
+    __slots__ = ("_phrase", "_keys", "_revealed", "_hidden", "_current")
+
+    # Porovnávací tvar speciálních znaků a znaků, jejichž tvar bez
+    # diakritiky má více znaků; hádané písmeno mu nikdy neodpovídá
+    NEVER_KEY = "\x80"
+
+    # Porovnávací tvar znaků, které po odstranění diakritiky zmizí
+    EMPTY_KEY = "\x81"
+
+    def __init__(self, phrase: str):
+        """Initor, který přijímá tajnou frázi (tajenku) k uhodnutí.
+        Ta musí být neprázdná, jinak je vyhozena výjimka."""
+
+        if len(phrase) == 0:
+            raise ValueError(f"Tajenka musí být neprázdná!")
+
+        # Tajenky ze znaků rozsahu `FOLDED_RANGE` převedou na porovnávací
+        # tvary, masku speciálních znaků i výchozí podobu předpočítané
+        # tabulky
+        current = None
+        if max(phrase) < _FOLDED_END:
+            keys = phrase.translate(_KEY_TABLE)
+            revealed = int(phrase.translate(_SPECIAL_TABLE)[::-1], 2)
+            current = phrase.translate(_CURRENT_TABLE)
+        else:
+            characters = []
+            revealed = 0
+            for position, letter in enumerate(phrase):
+                if letter in self.SPECIAL_CHARACTERS:
+                    characters.append(self.NEVER_KEY)
+                    revealed |= 1 << position
+                else:
+                    characters.append(self._key(letter.upper()))
+            keys = "".join(characters)
+
+        self._phrase = phrase
+        self._keys = keys
+        self._revealed = revealed
+        self._hidden = len(phrase) - bin(revealed).count("1")
+        self._current: Optional[str] = current
+
+    @classmethod
+    def from_keys(cls, phrase: str, keys: str,
+                  revealed: int) -> "CompactSecretPhrase":
+        """Vytvoří tajenku z předpočítaných porovnávacích tvarů znaků
+        (viz `keys`) a masky odkrytých pozic, bez odstraňování diakritiky.
+        Slouží např. k vytvoření tajenky z mezipaměti analýz tajenek."""
+        if len(phrase) == 0 or len(keys) != len(phrase):
+            raise ValueError(f"Porovnávací tvary neodpovídají tajence: "
+                             f"'{phrase}'")
+
+        instance = cls.__new__(cls)
+        instance._phrase = phrase
+        instance._keys = keys
+        instance._revealed = revealed
+        instance._hidden = len(phrase) - bin(revealed).count("1")
+        instance._current = None
+        return instance
+
+    @property
+    def keys(self) -> str:
+        """Porovnávací tvary znaků tajenky, jeden znak na pozici."""
+        return self._keys
+
+    @property
+    def revealed_mask(self) -> int:
+        """Maska odkrytých pozic tajenky (bit `i` odpovídá pozici `i`)."""
+        return self._revealed
+
+    def restore_revealed(self, mask: int):
+        """Metoda odkryje právě pozice dodané masky a ostatní skryje."""
+        if mask >> len(self._phrase):
+            raise ValueError(f"Maska přesahuje délku tajenky: {mask:#x}")
+
+        for position, letter in enumerate(self._phrase):
+            if letter in self.SPECIAL_CHARACTERS:
+                mask |= 1 << position
+        self._revealed = mask
+        self._hidden = len(self._phrase) - bin(mask).count("1")
+        self._current = None
+
+    @classmethod
+    def _key(cls, letter: str) -> str:
+        """Vrací jednoznakový porovnávací tvar dodaného (velkého) písmene,
+        tedy stejný tvar, jaký má `Letter.key`, nebo jeho zástupný znak."""
+        key = Letter.process(letter)
+        if len(key) == 1:
+            return key
+        return cls.EMPTY_KEY if len(key) == 0 else cls.NEVER_KEY
+
+    @property
+    def current_phrase(self) -> str:
+        """Aktuální podoba hádánky se zakrytými neuhodnutými písmeny."""
+        if self._current is None:
+            revealed = self._revealed
+            wildcard = Letter.WILDCARD
+            self._current = "".join([
+                letter.upper() if revealed >> position & 1 else wildcard
+                for position, letter in enumerate(self._phrase)])
+        return self._current
+
+    @property
+    def phrase_len(self) -> int:
+        """Délka celé tajenky."""
+        return len(self._phrase)
+
+    @property
+    def text(self) -> str:
+        """Celé znění tajenky v původní podobě."""
+        return self._phrase
+
+    @property
+    def letters(self) -> tuple[Letter]:
+        """Všechny znaky tajenky jako nově vytvořené pohledy `Letter`."""
+        revealed = self._revealed
+        letters = []
+        for position, letter in enumerate(self._phrase):
+            wrapped = Letter(letter, letter in self.SPECIAL_CHARACTERS)
+            if revealed >> position & 1:
+                wrapped.reveal()
+            letters.append(wrapped)
+        return tuple(letters)
+
+    @property
+    def revealed_characters(self) -> tuple[Letter]:
+        """Všechny odkryté znaky."""
+        return tuple(filter(lambda ltr: ltr.is_revealed, self.letters))
+
+    @property
+    def hidden_characters(self) -> tuple[Letter]:
+        """Všechny doposud neodkryté znaky."""
+        return tuple(filter(lambda ltr: not ltr.is_revealed, self.letters))
+
+    @property
+    def special_characters(self) -> tuple[Letter]:
+        """Všechny speciální znaky tajenky."""
+        return tuple(filter(lambda ltr: ltr.is_special, self.letters))
+
+    @property
+    def is_finished(self) -> bool:
+        """Je-li tajenka rozluštěna, tedy není-li žádný znak skrytý."""
+        return self._hidden == 0
+
+    def guess(self, letter: str) -> int:
+        """Funkce, která vrací počet nalezených výskytů daného písmene v
+        tajence. Pokud dodaný počet znaků odhadovaného řetězce není roven 1,
+        je vyhozena výjimka.
+        """
+        if len(letter) != 1:
+            raise GuessError(f"Povolen je právě jeden znak: '{letter}'!")
+
+        key = Letter.process(letter) or self.EMPTY_KEY
+        find = self._keys.find
+        revealed = self._revealed
+
+        positions = []
+        position = find(key)
+        while position != -1:
+            bit = 1 << position
+            if not revealed & bit:
+                revealed |= bit
+                positions.append(position)
+            position = find(key, position + 1)
+
+        if positions:
+            self._revealed = revealed
+            self._hidden -= len(positions)
+            self._current = self._patch(positions)
+        return len(positions)
+
+    def _patch(self, positions: list[int]) -> Optional[str]:
+        """Metoda vrací aktuální podobu tajenky, ve které jsou oproti
+        předchozí podobě odkryty dodané pozice. Nelze-li předchozí podobu
+        takto upravit (nebyla dosud sestavena nebo se v ní znaky nekryjí
+        s pozicemi), vrací `None` a podoba se sestaví při dalším dotazu."""
+        current = self._current
+        phrase = self._phrase
+        if current is None or len(current) != len(phrase):
+            return None
+
+        characters = list(current)
+        for position in positions:
+            characters[position] = phrase[position].upper()
+        return "".join(characters)
 
 
 def remove_accents(string_with_accents: str) -> str:
@@ -198,6 +533,61 @@ def remove_accents(string_with_accents: str) -> str:
         .decode("utf-8"))
 
 
+# Rozsah kódových bodů (ASCII, Latin-1 a Latin Extended-A, tedy včetně
+# veškeré české diakritiky), pro které je odstranění diakritiky předpočítáno
+FOLDED_RANGE = range(0x0000, 0x0180)
+
+# Předpočítané odstranění diakritiky pro jednotlivé znaky
+_FOLDED_LETTERS: dict[str, str] = {
+    chr(code_point): remove_accents(chr(code_point))
+    for code_point in FOLDED_RANGE}
+
+# Překladová tabulka pro `str.translate` vybudovaná z téhož předpočtu;
+# indexuje se přímo kódovým bodem, znaky mimo rozsah zůstanou beze změny
+_FOLD_TABLE = tuple(_FOLDED_LETTERS[chr(code_point)]
+                    for code_point in FOLDED_RANGE)
+
+
+def fold_letter(letter: str) -> str:
+    """Funkce odstraní diakritiku z jediného znaku pomocí předpočítané
+    tabulky. Pro znaky mimo rozsah `FOLDED_RANGE` (a pro delší řetězce)
+    se použije funkce `remove_accents`, výsledek je tedy vždy shodný."""
+    folded = _FOLDED_LETTERS.get(letter)
+    return remove_accents(letter) if folded is None else folded
+
+
+def fold_accents(string_with_accents: str) -> str:
+    """Funkce odstraní diakritiku z celého řetězce pomocí `str.translate`
+    a předpočítané tabulky. Obsahuje-li řetězec znaky mimo rozsah
+    `FOLDED_RANGE`, dokončí práci funkce `remove_accents`, výsledek je tedy
+    vždy shodný s jejím výsledkem."""
+    if string_with_accents.isascii():
+        return string_with_accents
+    folded = string_with_accents.translate(_FOLD_TABLE)
+    return folded if folded.isascii() else remove_accents(folded)
+
+
+# První znak za rozsahem `FOLDED_RANGE`
+_FOLDED_END = chr(FOLDED_RANGE.stop)
+
+# Překladové tabulky úsporné tajenky pro znaky z rozsahu `FOLDED_RANGE`:
+# porovnávací tvar znaku (viz `CompactSecretPhrase.keys`), příznak
+# speciálního znaku ("1"), resp. ostatního znaku ("0"), a znak výchozí
+# podoby tajenky (odkryté jsou jen speciální znaky)
+_KEY_TABLE = tuple(
+    CompactSecretPhrase.NEVER_KEY
+    if chr(code_point) in AbstractSecretPhrase.SPECIAL_CHARACTERS
+    else CompactSecretPhrase._key(chr(code_point).upper())
+    for code_point in FOLDED_RANGE)
+_SPECIAL_TABLE = tuple(
+    "1" if chr(code_point) in AbstractSecretPhrase.SPECIAL_CHARACTERS
+    else "0" for code_point in FOLDED_RANGE)
+_CURRENT_TABLE = tuple(
+    chr(code_point).upper()
+    if chr(code_point) in AbstractSecretPhrase.SPECIAL_CHARACTERS
+    else Letter.WILDCARD for code_point in FOLDED_RANGE)
+
+
 class GuessError(Exception):
     """Výjimka značící, že došlo k chybě při pokusu o uhodnutí dalšího písmene.
     Výjimky tohto typu mají možnost uchovat znak, v němž došlo k chybě tak,
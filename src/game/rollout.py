@@ -0,0 +1,211 @@
+"""Tento modul obsahuje engine pro rychlé dohrávání her (tzv. rollouty).
+
+Rollout dohraje hru z daného stavu do konce podle jednoduché pevné strategie
+všech hráčů (hádá se první dosud nezkoušené písmeno z pořadí podle
+četnosti). Slouží hráčům, kteří svůj tah volí podle výsledků mnoha
+náhodných pokračování hry (viz `src.player.monte_carlo_player`).
+
+Stav hry se proto neuchovává jako `AbstractGame` se `SecretPhrase`, ale jako
+lehký `RolloutState`: skryté pozice písmen (předpokládané) tajenky jako
+bitové masky, počet skrytých pozic, zkoušená písmena, skóre a hráč na tahu.
+Jeho kopie je levná, neboť masky pozic se mezi kopiemi sdílí. Zatočení kolem
+se generují po dávkách pomocí `Wheel.rotate_many`."""
+
+from typing import Optional
+
+from src.game.phrase import Letter
+from src.game.wheel import Wheel
+
+
+class RolloutState:
+    """Lehký stav hry, který lze levně kopírovat a dohrát do konce.
+
+    Pravidla odpovídají simulátoru: uhodne-li hráč písmeno, získá součin
+    multiplikátoru a počtu odkrytých pozic a hraje znovu; jinak, nebo padne-li
+    bankrot (s propadnutím skóre), hraje další hráč."""
+
+    __slots__ = ("positions", "hidden", "guessed", "scores", "seat")
+
+    def __init__(self, positions: dict[str, int], hidden: int,
+                 guessed: set[str], scores: list[int], seat: int):
+        """Initor, který přijímá masky skrytých pozic jednotlivých písmen
+        tajenky, počet skrytých pozic, zkoušená písmena, skóre hráčů a
+        index hráče na tahu. Masky pozic se nekopírují (jsou sdílené)."""
+        self.positions = positions
+        self.hidden = hidden
+        self.guessed = guessed
+        self.scores = scores
+        self.seat = seat
+
+    @classmethod
+    def from_phrase(cls, phrase: str, hidden: str, guessed: set[str],
+                    scores: list[int], seat: int) -> "RolloutState":
+        """Vytvoří stav z předpokládané podoby tajenky (písmena velká a bez
+        diakritiky) a z řetězce `hidden`, ve kterém jsou skryté pozice
+        označeny zástupným znakem (např. aktuální podoba tajenky)."""
+        positions: dict[str, int] = {}
+        count = 0
+        for position, (letter, shown) in enumerate(zip(phrase, hidden)):
+            if shown == Letter.WILDCARD:
+                positions[letter] = positions.get(letter, 0) | 1 << position
+                count += 1
+        return cls(positions, count, set(guessed), list(scores), seat)
+
+    def clone(self) -> "RolloutState":
+        """Metoda vrací nezávislou kopii stavu."""
+        return RolloutState(self.positions, self.hidden, set(self.guessed),
+                            list(self.scores), self.seat)
+
+    @property
+    def is_finished(self) -> bool:
+        """Je-li tajenka odkryta celá."""
+        return self.hidden == 0
+
+    def guess(self, letter: str, multiplier: int) -> int:
+        """Metoda odehraje pokus hráče na tahu o dodané písmeno při dodaném
+        multiplikátoru a vrací počet odkrytých pozic."""
+        self.guessed.add(letter)
+        mask = self.positions.get(letter, 0)
+        if mask:
+            count = mask.bit_count()
+            self.hidden -= count
+            self.scores[self.seat] += multiplier * count
+            return count
+        self.seat = (self.seat + 1) % len(self.scores)
+        return 0
+
+    def bankrupt(self):
+        """Metoda odehraje bankrot hráče na tahu."""
+        self.scores[self.seat] = 0
+        self.seat = (self.seat + 1) % len(self.scores)
+
+
+class RolloutEngine:
+    """Instance této třídy dohrávají stavy (`RolloutState`) do konce.
+
+    Zatočení kolem se berou z předgenerované dávky, která se doplňuje po
+    `batch_size` zatočeních najednou."""
+
+    def __init__(self, wheel: Wheel, ranking: str,
+                 max_turns: int = 1_000, batch_size: int = 4096):
+        """Initor, který přijímá kolo štěstí, pořadí písmen, podle kterého
+        v rolloutech hádají všichni hráči, maximální počet tahů jednoho
+        rolloutu a velikost dávky zatočení."""
+        if batch_size < 1:
+            raise ValueError(f"Velikost dávky musí být kladná: {batch_size}")
+
+        self._wheel = wheel
+        self._ranking = ranking
+        self._max_turns = max_turns
+        self._batch_size = batch_size
+
+        # Multiplikátor každého klínu; bankrot je označen hodnotou -1
+        self._values = tuple(-1 if wedge.is_bankrupt else wedge.multiplier
+                             for wedge in wheel.wedges)
+        if all(value == -1 for value in self._values):
+            raise ValueError("Kolo štěstí nemá žádný výherní klín!")
+        self._spins: list[int] = []
+        self._next = 0
+
+    @property
+    def wheel(self) -> Wheel:
+        """Kolo štěstí, jehož zatočení engine používá."""
+        return self._wheel
+
+    def seed(self, seed: Optional[int] = None):
+        """Metoda znovu inicializuje generátory kola dodaným semínkem a
+        zahodí doposud předgenerovaná zatočení."""
+        self._wheel.seed(seed)
+        self._spins = []
+        self._next = 0
+
+    def spin(self) -> int:
+        """Metoda vrací multiplikátor dalšího zatočení (-1 pro bankrot)."""
+        if self._next >= len(self._spins):
+            self._refill()
+        value = self._spins[self._next]
+        self._next += 1
+        return value
+
+    def winning_spin(self) -> int:
+        """Metoda vrací multiplikátor dalšího zatočení, které neskončilo
+        bankrotem (tedy zatočení, po kterém hráč hádá)."""
+        value = self.spin()
+        while value == -1:
+            value = self.spin()
+        return value
+
+    def next_letter(self, state: RolloutState) -> Optional[str]:
+        """Metoda vrací písmeno, které podle pevné strategie hádá hráč na
+        tahu, nebo `None`, pokud jsou zkoušena všechna písmena pořadí."""
+        guessed = state.guessed
+        for letter in self._ranking:
+            if letter not in guessed:
+                return letter
+        return None
+
+    def play_out(self, state: RolloutState, first_letter: Optional[str] = None
+                 ) -> RolloutState:
+        """Metoda dohraje dodaný stav (mění jej) a vrací jej. Je-li zadáno
+        písmeno `first_letter`, hráč na tahu jej hádá jako první, a to po
+        zatočení, které neskončilo bankrotem (tah už byl zahájen).
+
+        Tahy odpovídají metodám `RolloutState.guess` a `bankrupt` a
+        `next_letter`, kvůli rychlosti jsou však rozepsány přímo ve smyčce
+        nad lokálními proměnnými."""
+        if first_letter is not None:
+            state.guess(first_letter, self.winning_spin())
+
+        positions = state.positions
+        guessed = state.guessed
+        scores = state.scores
+        players = len(scores)
+        seat = state.seat
+        hidden = state.hidden
+        ranking = self._ranking
+        size = len(ranking)
+        rank = 0
+        spins = self._spins
+        current = self._next
+
+        for _ in range(self._max_turns):
+            if not hidden:
+                break
+            if current >= len(spins):
+                self._refill()
+                spins = self._spins
+                current = 0
+            value = spins[current]
+            current += 1
+
+            if value == -1:
+                scores[seat] = 0
+                seat = (seat + 1) % players
+                continue
+
+            # Zkoušená písmena přibývají, pořadí se tedy prochází jen jednou
+            while rank < size and ranking[rank] in guessed:
+                rank += 1
+            if rank == size:
+                break
+            letter = ranking[rank]
+            guessed.add(letter)
+            mask = positions.get(letter)
+            if mask:
+                count = mask.bit_count()
+                hidden -= count
+                scores[seat] += value * count
+            else:
+                seat = (seat + 1) % players
+
+        self._next = current
+        state.seat = seat
+        state.hidden = hidden
+        return state
+
+    def _refill(self):
+        """Metoda vygeneruje novou dávku zatočení."""
+        indices, _ = self._wheel.rotate_many(self._batch_size)
+        values = self._values
+        self._spins = [values[index] for index in indices.tolist()]
+        self._next = 0
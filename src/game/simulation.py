@@ -0,0 +1,157 @@
+"""Tento modul obsahuje bezhlavý (headless) simulátor hry.
+
+Na rozdíl od moderátora (viz `src.game.moderator.Moderator`), který je
+určen pro řízení jediné interaktivní hry, simulátor nic nevypisuje a
+neskládá žádné repliky. Řídí hru (instanci `AbstractGame`) podle stejných
+pravidel jako moderátor, tedy:
+
+- hráč na tahu zatočí kolem,
+- padne-li BANKROT, přichází o všechny body a hraje další hráč,
+- jinak hádá písmeno; uhodne-li, získává násobek multiplikátoru klínu a
+  počtu výskytů a hraje znovu, jinak hraje další hráč.
+
+Výsledkem každé hry je kompaktní záznam `GameResult`. Simulátor je určen
+především pro hromadné vyhodnocování strategií NPC hráčů.
+
+Jeden tah podle těchto pravidel odehraje funkce `play_turn` (viz
+`src.game.turn`), kterou sdílí simulátor i správce souběžných her (viz
+`src.game.manager`). Je-li sestaveno zkompilované jádro (viz
+`src.game.kernel`), použije se jeho varianta této funkce. Tajenky zadané
+textovým řetězcem simulátor vytváří jako `FastSecretPhrase`.
+
+Propustnost: s jediným hráčem `EntropyDrivenPlayerCZ`, tajenkami o délce
+kolem 35 znaků (asi 28 tahů na hru) a zkompilovaným jádrem odehraje
+simulátor na jednom jádře přibližně 5 tisíc her za sekundu, tedy asi 7 µs
+na tah (viz `python -m benchmarks.suite run --filter simulator`). Původně
+zamýšlených 100 tisíc her za sekundu (10 µs na celou hru, pod 0,4 µs na
+tah) s hráči v Pythonu dosažitelné není: jen volání strategie hráče
+(`guess_letter`) stojí kolem 1 µs na tah a každý tah dále prochází
+evidencí zkoušených písmen, tajenkou a kolem, jejichž stav žije
+v objektech Pythonu. Takovou propustnost by vyžadovalo přesunout do
+zkompilovaného kódu i strategie hráčů a celou smyčku hry."""
+
+from typing import Callable, Iterable, NamedTuple, Optional, Union
+
+from src.game.analytics import AnalyticsCache
+from src.game.game import AbstractGame, MultiplayerGame
+from src.game.kernel import FastSecretPhrase, play_turn
+from src.game.phrase import AbstractSecretPhrase
+# Výsledky tahu jsou zpřístupněny i zde, kde byly dříve definovány
+from src.game.turn import BANKRUPT, GIVE_UP, HIT, MISS, MAX_INVALID_GUESSES
+from src.game.wheel import Wheel
+from src.player.abstract_player import AbstractPlayer
+
+
+class GameResult(NamedTuple):
+    """Kompaktní záznam o výsledku jedné odsimulované hry.
+
+    Skóre jsou uložena ve stejném pořadí, v jakém jsou hráči ve hře.
+    Vítězem je index hráče s nejvyšším skóre (při shodě ten dřívější
+    v pořadí); pokud hra nebyla dohrána (viz `Simulator.max_turns`),
+    je vítěz `None`."""
+
+    winner: Optional[int]
+    scores: tuple[int, ...]
+    turns: int
+    bankrupts: int
+    guesses: int
+
+    @property
+    def is_finished(self) -> bool:
+        """Zda-li byla tajenka v této hře vyluštěna."""
+        return self.winner is not None
+
+
+class Simulator:
+    """Instance této třídy řídí hry bez jakéhokoliv výstupu do konzole.
+
+    Simulátor si drží kolo štěstí a sestavu hráčů, se kterými hraje
+    libovolné množství her nad různými tajenkami. Pro každou tajenku
+    vybuduje novou hru pomocí továrny `game_factory` (ve výchozím stavu
+    `MultiplayerGame`), případně lze odsimulovat i již existující hru
+    metodou `simulate`."""
+
+    # Výchozí maximální počet tahů jedné hry, po kterém je hra ukončena
+    # jako nedohraná (ochrana před hráči, kteří nemají co hádat)
+    DEFAULT_MAX_TURNS = 10_000
+
+    def __init__(self, wheel: Wheel, players: Iterable[AbstractPlayer],
+                 max_turns: int = DEFAULT_MAX_TURNS,
+                 game_factory: Callable[..., AbstractGame] = MultiplayerGame,
+                 analytics: Optional[AnalyticsCache] = None):
+        """Initor, který přijímá kolo štěstí, sadu hráčů a volitelně
+        maximální počet tahů jedné hry, továrnu, která ze trojice
+        (tajenka, kolo, hráči) vybuduje hru, a mezipaměť analýz tajenek,
+        ze které se budují tajenky zadané textovým řetězcem.
+        """
+        if max_turns < 1:
+            raise ValueError(f"Maximální počet tahů musí být kladný: "
+                             f"{max_turns}")
+
+        self._wheel = wheel
+        self._players = tuple(players)
+        self._max_turns = max_turns
+        self._game_factory = game_factory
+        self._analytics = analytics
+
+    @property
+    def wheel(self) -> Wheel:
+        """Kolo štěstí, se kterým simulátor hraje."""
+        return self._wheel
+
+    @property
+    def players(self) -> tuple[AbstractPlayer]:
+        """Hráči, kteří se simulovaných her účastní."""
+        return self._players
+
+    @property
+    def max_turns(self) -> int:
+        """Maximální počet tahů jedné hry."""
+        return self._max_turns
+
+    def play(self, phrase: Union[str, AbstractSecretPhrase]) -> GameResult:
+        """Metoda vybuduje novou hru pro dodanou tajenku (textový řetězec
+        nebo instanci tajenky) a odsimuluje ji."""
+        if isinstance(phrase, str):
+            phrase = (FastSecretPhrase(phrase) if self._analytics is None
+                      else self._analytics.create_phrase(phrase))
+        return self.simulate(
+            self._game_factory(phrase, self.wheel, self.players))
+
+    def run(self, phrases: Iterable[Union[str, AbstractSecretPhrase]]
+            ) -> list[GameResult]:
+        """Metoda odsimuluje jednu hru pro každou dodanou tajenku a vrací
+        seznam výsledků ve stejném pořadí."""
+        play = self.play
+        return [play(phrase) for phrase in phrases]
+
+    def simulate(self, game: AbstractGame) -> GameResult:
+        """Metoda odsimuluje dodanou hru až do jejího konce (nebo do
+        dosažení maximálního počtu tahů) a vrací záznam o jejím výsledku.
+
+        Vzdá-li se hráč tahu (viz `play_turn`), je hra ukončena jako
+        nedohraná."""
+        phrase = game.phrase
+        max_turns = self._max_turns
+
+        turns = bankrupts = guesses = 0
+        while not phrase.is_finished and turns < max_turns:
+            turns += 1
+            outcome = play_turn(game)
+            if outcome == BANKRUPT:
+                bankrupts += 1
+            elif outcome == GIVE_UP:
+                return game_result(game, False, turns, bankrupts, guesses)
+            else:
+                guesses += 1
+
+        finished = phrase.is_finished
+        return game_result(game, finished, turns, bankrupts, guesses)
+
+
+def game_result(game: AbstractGame, finished: bool, turns: int,
+                bankrupts: int, guesses: int) -> GameResult:
+    """Funkce sestaví záznam o výsledku dodané hry."""
+    scores = game.scores
+    winner = scores.index(max(scores)) if finished else None
+    return GameResult(winner, scores, turns, bankrupts, guesses)
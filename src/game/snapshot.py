@@ -0,0 +1,124 @@
+"""Tento modul obsahuje snímek stavu rozehrané hry.
+
+Snímek (`GameSnapshot`) zachycuje vše, co se během hry mění: masku odkrytých
+pozic tajenky, zkoušená písmena, skóre hráčů, index hráče na tahu a stav
+generátoru náhodných čísel kola (ten volitelně). Pořizuje se metodou
+`AbstractGame.snapshot` a do hry se vrací metodou `AbstractGame.restore`,
+případně se z něj vybuduje nová hra metodou `AbstractGame.from_snapshot`.
+Hráče ani klíny kola snímek neobsahuje, dodává je ten, kdo hru obnovuje.
+
+Pro přenos mezi procesy a uložení lze snímek převést do kompaktního
+binárního tvaru (`to_bytes`, `from_bytes`): hlavička (`HEADER`), tajenka
+v kódování UTF-8, maska odkrytých pozic, zkoušená písmena (každé s délkou
+v jednom bajtu), skóre (`<q`) a případně stav generátoru (`RANDOM_STATE`).
+"""
+
+import struct
+from typing import NamedTuple, Optional
+
+# Hlavička snímku: magické číslo, verze, příznaky, délka tajenky v bajtech,
+# počet hráčů, index hráče na tahu, počet zkoušených písmen a délka masky
+# odkrytých pozic v bajtech
+HEADER = struct.Struct("<4sHBxIHHHH")
+
+# Magické číslo, kterým začíná každý binární snímek
+MAGIC = b"WOFS"
+
+# Verze formátu snímku
+VERSION = 1
+
+# Příznak snímku, který obsahuje stav generátoru náhodných čísel kola
+WITH_RANDOM_STATE = 1
+
+# Stav generátoru `random.Random` (verze 3): 624 slov stavu, pozice ve stavu,
+# příznak a hodnota uložené normální náhodné veličiny
+RANDOM_STATE = struct.Struct("<625I?d")
+
+# Verze stavu generátoru `random.Random`, kterou formát podporuje
+RANDOM_VERSION = 3
+
+
+class GameSnapshot(NamedTuple):
+    """Snímek stavu rozehrané hry (viz `AbstractGame.snapshot`)."""
+
+    phrase: str
+    revealed: int
+    guessed: tuple[str, ...]
+    scores: tuple[int, ...]
+    current: int
+    random_state: Optional[tuple] = None
+
+    def to_bytes(self) -> bytes:
+        """Metoda vrací snímek v kompaktním binárním tvaru."""
+        phrase = self.phrase.encode()
+        mask = self.revealed.to_bytes((self.revealed.bit_length() + 7) // 8,
+                                      "little")
+        guessed = [letter.encode() for letter in self.guessed]
+        if any(len(letter) > 255 for letter in guessed):
+            raise ValueError("Zkoušené písmeno je příliš dlouhé!")
+
+        parts = [
+            HEADER.pack(MAGIC, VERSION,
+                        WITH_RANDOM_STATE if self.random_state else 0,
+                        len(phrase), len(self.scores), self.current,
+                        len(guessed), len(mask)),
+            phrase, mask,
+            *(bytes((len(letter),)) + letter for letter in guessed),
+            struct.pack(f"<{len(self.scores)}q", *self.scores)]
+
+        if self.random_state:
+            # Binární tvar zachycuje jen stav generátoru `random.Random`,
+            # ne např. stav proudu zatočení (viz `SpinStream.getstate`)
+            version = self.random_state[0]
+            if not isinstance(version, int):
+                raise ValueError("Stav generátoru kola nelze převést do "
+                                 "binárního tvaru!")
+            if version != RANDOM_VERSION:
+                raise ValueError(f"Nepodporovaná verze stavu generátoru: "
+                                 f"{version}")
+            _, words, gauss = self.random_state
+            parts.append(RANDOM_STATE.pack(*words, gauss is not None,
+                                           gauss or 0.0))
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "GameSnapshot":
+        """Vytvoří snímek z jeho binárního tvaru (viz `to_bytes`). Není-li
+        dodaná hodnota platným snímkem, je vyhozena výjimka `ValueError`."""
+        try:
+            (magic, version, flags, phrase_size, players, current, guessed,
+             mask_size) = HEADER.unpack_from(data)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"Nejde o snímek hry verze {VERSION}")
+
+            position = HEADER.size
+            phrase = bytes(data[position:position + phrase_size]).decode()
+            position += phrase_size
+            revealed = int.from_bytes(data[position:position + mask_size],
+                                      "little")
+            position += mask_size
+
+            letters = []
+            for _ in range(guessed):
+                size = data[position]
+                letters.append(
+                    bytes(data[position + 1:position + 1 + size]).decode())
+                position += 1 + size
+
+            scores = struct.unpack_from(f"<{players}q", data, position)
+            position += 8 * players
+
+            random_state = None
+            if flags & WITH_RANDOM_STATE:
+                *words, has_gauss, gauss = RANDOM_STATE.unpack_from(
+                    data, position)
+                position += RANDOM_STATE.size
+                random_state = (RANDOM_VERSION, tuple(words),
+                                gauss if has_gauss else None)
+        except (struct.error, IndexError, UnicodeDecodeError) as error:
+            raise ValueError(f"Poškozený snímek hry: {error}") from error
+
+        if position != len(data):
+            raise ValueError("Poškozený snímek hry: přebytečná data")
+        return cls(phrase, revealed, tuple(letters), scores, current,
+                   random_state)
@@ -0,0 +1,170 @@
+"""Tento modul obsahuje přesný výpočet nejlepšího očekávaného skóre hry pro
+jediného hráče (`SinglePlayerGame`).
+
+Řešitel počítá s hráčem, který tajenku zná a hádá pouze písmena, která v ní
+jsou (netrefuje se tedy nikdy vedle), a v každém tahu volí písmeno optimálně
+podle vytočeného klínu. Výsledek je měřítkem, se kterým lze porovnávat NPC
+hráče. Pravidla odpovídají hře pro jediného hráče: hráč zatočí kolem; padne-li
+bankrot, přichází o všechny body a točí znovu; jinak hádá písmeno a získá
+součin multiplikátoru klínu a počtu výskytů. Hra končí odkrytím tajenky.
+
+Nechť `q` je pravděpodobnost, že nepadne bankrot, a `n` počet zbývajících
+písmen. Skóre nashromážděné před tahem se do konce hry dochová, pouze pokud
+v žádném z `n` zbývajících zatočení nepadne bankrot, tedy s pravděpodobností
+`q ** n`. Hodnota stavu je proto `skóre * q ** n + W(S)`, kde `W(S)` závisí
+jen na množině zbývajících písmen `S`:
+
+    W(S) = 1/q * sum(p(m) * max(m * c(l) * q ** (n - 1) + W(S - {l})))
+
+(součet přes multiplikátory `m` výherních klínů, maximum přes písmena `l`
+z `S` s počtem výskytů `c(l)`). Hodnoty `W` se ukládají podle bitové masky
+zbývajících písmen. Písmena se stejným počtem výskytů jsou zaměnitelná,
+takže se z každé takové skupiny vždy odebírá to poslední a masky tvoří
+jediného zástupce všech symetrických stavů; stavů je pak jen součin
+(velikost skupiny + 1) přes skupiny."""
+
+from typing import Iterable, Optional, Union
+
+from src.game.analytics import PhraseAnalytics, analyze
+from src.game.phrase import CompactSecretPhrase, Letter
+from src.game.wheel import Wheel
+
+
+class ExpectedValueSolver:
+    """Instance této třídy počítají nejlepší očekávané skóre hry pro
+    jediného hráče nad danou tajenkou a kolem štěstí a optimální volbu
+    písmene v libovolném stavu hry."""
+
+    def __init__(self, phrase: Union[str, PhraseAnalytics], wheel: Wheel):
+        """Initor, který přijímá tajenku (text nebo její analýzu) a kolo
+        štěstí. Tajenka musí být vyluštitelná hádáním písmen a na kole musí
+        být alespoň jeden výherní klín."""
+        analytics = phrase if isinstance(phrase, PhraseAnalytics) \
+            else analyze(phrase)
+        if not analytics.is_solvable:
+            raise ValueError(f"Tajenku nelze vyluštit hádáním písmen: "
+                             f"'{analytics.phrase}'")
+
+        # Rozdělení multiplikátorů výherních klínů
+        distribution: dict[int, float] = {}
+        for wedge, probability in zip(wheel.wedges, wheel.probabilities):
+            if not wedge.is_bankrupt:
+                distribution[wedge.multiplier] = (
+                    distribution.get(wedge.multiplier, 0.0) + probability)
+        if not distribution:
+            raise ValueError("Kolo štěstí nemá žádný výherní klín!")
+
+        self._analytics = analytics
+        self._distribution = tuple(sorted(distribution.items()))
+        self._survival = sum(distribution.values())
+
+        # Písmena seřazená podle počtu výskytů; skupiny zaměnitelných písmen
+        # jako trojice (počet výskytů, první bit, maska skupiny)
+        self._letters = tuple(sorted(analytics.histogram,
+                                     key=lambda letter: (
+                                         -analytics.histogram[letter],
+                                         letter)))
+        self._groups: list[tuple[int, int, int]] = []
+        for bit, letter in enumerate(self._letters):
+            count = analytics.histogram[letter]
+            if self._groups and self._groups[-1][0] == count:
+                _, first, mask = self._groups[-1]
+                self._groups[-1] = (count, first, mask | 1 << bit)
+            else:
+                self._groups.append((count, bit, 1 << bit))
+
+        self._powers = tuple(self._survival ** n
+                             for n in range(len(self._letters) + 1))
+        self._values: dict[int, float] = {0: 0.0}
+
+    @property
+    def analytics(self) -> PhraseAnalytics:
+        """Analýza řešené tajenky."""
+        return self._analytics
+
+    @property
+    def states(self) -> int:
+        """Počet dosud spočítaných (navzájem nesymetrických) stavů."""
+        return len(self._values)
+
+    @property
+    def expected_score(self) -> float:
+        """Nejlepší očekávané skóre na konci hry."""
+        return self._value(self._full_mask())
+
+    def value(self, guessed: Iterable[str] = (), score: int = 0) -> float:
+        """Metoda vrací nejlepší očekávané skóre na konci hry ze stavu, kdy
+        jsou uhodnuta dodaná písmena a hráč má dodané skóre."""
+        remaining = self._remaining(guessed)
+        return (score * self._powers[remaining.bit_count()]
+                + self._value(remaining))
+
+    def best_letter(self, guessed: Iterable[str],
+                    multiplier: int) -> Optional[str]:
+        """Metoda vrací optimální písmeno pro stav, kdy jsou uhodnuta dodaná
+        písmena a byl vytočen klín s dodaným multiplikátorem, nebo `None`,
+        je-li tajenka vyluštěna."""
+        guessed = {_key(letter) for letter in guessed}
+        remaining = self._remaining(guessed)
+        if not remaining:
+            return None
+
+        best = max(self._choices(remaining),
+                   key=lambda choice: multiplier * choice[0]
+                   * self._powers[remaining.bit_count() - 1]
+                   + self._value(choice[1]))
+        count = best[0]
+        return next(letter for letter in self._letters
+                    if letter not in guessed
+                    and self._analytics.histogram[letter] == count)
+
+    def _full_mask(self) -> int:
+        """Maska všech písmen tajenky."""
+        return (1 << len(self._letters)) - 1
+
+    def _remaining(self, guessed: Iterable[str]) -> int:
+        """Metoda vrací zástupnou masku zbývajících písmen, tedy masku, ve
+        které z každé skupiny zbývá stejný počet písmen, ale vždy těch
+        prvních."""
+        guessed = {_key(letter) for letter in guessed}
+        remaining = 0
+        for count, first, mask in self._groups:
+            left = sum(1 for bit, letter in enumerate(self._letters)
+                       if mask >> bit & 1 and letter not in guessed)
+            remaining |= ((1 << left) - 1) << first
+        return remaining
+
+    def _choices(self, remaining: int) -> list[tuple[int, int]]:
+        """Metoda vrací pro každou skupinu, ve které zbývá nějaké písmeno,
+        dvojici (počet výskytů, zástupná maska po odebrání písmene)."""
+        choices = []
+        for count, first, mask in self._groups:
+            left = (remaining & mask) >> first
+            if left:
+                choices.append(
+                    (count, remaining & ~(1 << first + left.bit_length() - 1)))
+        return choices
+
+    def _value(self, remaining: int) -> float:
+        """Metoda vrací hodnotu `W` pro zástupnou masku zbývajících písmen.
+        """
+        value = self._values.get(remaining)
+        if value is not None:
+            return value
+
+        weight = self._powers[remaining.bit_count() - 1]
+        choices = [(count * weight, self._value(after))
+                   for count, after in self._choices(remaining)]
+        total = 0.0
+        for multiplier, probability in self._distribution:
+            total += probability * max(multiplier * gain + future
+                                       for gain, future in choices)
+
+        value = self._values[remaining] = total / self._survival
+        return value
+
+
+def _key(letter: str) -> str:
+    """Funkce vrací porovnávací tvar hádaného písmene, pod kterým jej vede
+    histogram analýzy tajenky (viz `CompactSecretPhrase.guess`)."""
+    return Letter.process(letter) or CompactSecretPhrase.EMPTY_KEY
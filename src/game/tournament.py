@@ -0,0 +1,245 @@
+"""Tento modul obsahuje definici turnaje, tedy hromadného vyhodnocení
+strategií hráčů.
+
+Turnaj je matice (tajenka × sestava hráčů × kolo štěstí × opakování), kde
+pro každou její buňku je odsimulována jedna hra pomocí `Simulator`. Matice
+je rozdělena na bloky, které jsou zpracovány paralelně v procesech
+(`ProcessPoolExecutor`), a jejich dílčí statistiky jsou nakonec sloučeny.
+
+Každá hra má svoje vlastní semínko náhody odvozené z hlavního semínka a
+z její pozice v matici. Výsledky jsou proto pro stejné hlavní semínko
+shodné bez ohledu na počet procesů či velikost bloků."""
+
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Optional, Sequence
+
+from src.game.analytics import AnalyticsCache
+from src.game.simulation import Simulator
+from src.game.wheel import Wheel
+from src.player.abstract_player import AbstractPlayer
+
+
+class PlayerStats:
+    """Instance této třídy shromažďují souhrnné statistiky jednoho hráče
+    napříč odehranými hrami.
+
+    Uchovávány jsou pouze celočíselné součty, díky čemuž je slučování
+    statistik z různých procesů přesné a nezávislé na pořadí."""
+
+    def __init__(self):
+        """Initor, který připraví prázdné statistiky."""
+        self._games = 0
+        self._wins = 0
+        self._score_sum = 0
+        self._score_sq_sum = 0
+        self._solved_games = 0
+        self._solved_turns = 0
+
+    @property
+    def games(self) -> int:
+        """Počet her, kterých se hráč účastnil."""
+        return self._games
+
+    @property
+    def wins(self) -> int:
+        """Počet vyhraných her."""
+        return self._wins
+
+    @property
+    def win_rate(self) -> float:
+        """Podíl vyhraných her ku všem odehraným."""
+        return self._wins / self._games if self._games else 0.0
+
+    @property
+    def mean_score(self) -> float:
+        """Průměrné skóre hráče na konci hry."""
+        return self._score_sum / self._games if self._games else 0.0
+
+    @property
+    def score_variance(self) -> float:
+        """Rozptyl skóre hráče na konci hry."""
+        if not self._games:
+            return 0.0
+        numerator = self._games * self._score_sq_sum - self._score_sum ** 2
+        return numerator / self._games ** 2
+
+    @property
+    def mean_turns_to_solve(self) -> float:
+        """Průměrný počet tahů vyluštěných her, kterých se hráč účastnil."""
+        if not self._solved_games:
+            return 0.0
+        return self._solved_turns / self._solved_games
+
+    def record(self, score: int, won: bool, turns: Optional[int]):
+        """Metoda zaznamená výsledek jedné hry. Počet tahů `turns` je
+        `None`, pokud hra nebyla dohrána."""
+        self._games += 1
+        self._wins += won
+        self._score_sum += score
+        self._score_sq_sum += score * score
+        if turns is not None:
+            self._solved_games += 1
+            self._solved_turns += turns
+
+    def merge(self, other: "PlayerStats"):
+        """Metoda přičte k těmto statistikám statistiky jiné instance."""
+        self._games += other._games
+        self._wins += other._wins
+        self._score_sum += other._score_sum
+        self._score_sq_sum += other._score_sq_sum
+        self._solved_games += other._solved_games
+        self._solved_turns += other._solved_turns
+
+    def as_dict(self) -> dict:
+        """Vrací souhrn statistik jako slovník."""
+        return {
+            "games": self.games,
+            "wins": self.wins,
+            "win_rate": self.win_rate,
+            "mean_score": self.mean_score,
+            "score_variance": self.score_variance,
+            "mean_turns_to_solve": self.mean_turns_to_solve,
+        }
+
+    def __repr__(self) -> str:
+        """Textová reprezentace statistik."""
+        return f"PlayerStats({self.as_dict()})"
+
+
+class Tournament:
+    """Instance této třídy reprezentují turnaj nad maticí tajenek, sestav
+    hráčů, kol štěstí a opakování (semínek).
+
+    Hráči a kola štěstí musí být serializovatelní (`pickle`), aby mohli být
+    předáni do jednotlivých procesů.
+
+    Statistiky se sčítají podle jmen hráčů: tentýž hráč (tatáž instance)
+    může být ve více sestavách, různí hráči však musí mít různá jména."""
+
+    def __init__(self, phrases: Iterable[str],
+                 lineups: Iterable[Sequence[AbstractPlayer]],
+                 wheels: Iterable[Wheel], repetitions: int = 1,
+                 master_seed: int = 0,
+                 max_turns: int = Simulator.DEFAULT_MAX_TURNS):
+        """Initor, který přijímá tajenky, sestavy hráčů, kola štěstí, počet
+        opakování každé kombinace a hlavní semínko náhody.
+        """
+        self._phrases = tuple(phrases)
+        self._lineups = tuple(tuple(lineup) for lineup in lineups)
+        self._wheels = tuple(wheels)
+        self._repetitions = repetitions
+        self._master_seed = master_seed
+        self._max_turns = max_turns
+
+        if not (self._phrases and self._lineups and self._wheels):
+            raise ValueError("Turnaj potřebuje alespoň jednu tajenku, "
+                             "sestavu hráčů a kolo štěstí!")
+        if repetitions < 1:
+            raise ValueError(f"Počet opakování musí být kladný: "
+                             f"{repetitions}")
+
+        # Statistiky různých hráčů se stejným jménem by se sloučily
+        players: dict[str, AbstractPlayer] = {}
+        for lineup in self._lineups:
+            for player in lineup:
+                if players.setdefault(player.player_name, player) \
+                        is not player:
+                    raise ValueError(f"Různí hráči turnaje mají stejné "
+                                     f"jméno: '{player.player_name}'")
+
+    @property
+    def number_of_games(self) -> int:
+        """Celkový počet her v matici turnaje."""
+        return (len(self._phrases) * len(self._lineups)
+                * len(self._wheels) * self._repetitions)
+
+    def run(self, workers: Optional[int] = None,
+            chunk_size: int = 1_000) -> dict[str, PlayerStats]:
+        """Metoda odehraje celý turnaj a vrací statistiky hráčů podle jejich
+        jmen.
+
+        Parametr `workers` určuje počet procesů (`None` odpovídá počtu
+        jader); při hodnotě 1 se turnaj odehraje v aktuálním procesu.
+        Parametr `chunk_size` určuje počet her v jednom bloku práce."""
+        if chunk_size < 1:
+            raise ValueError(f"Velikost bloku musí být kladná: {chunk_size}")
+
+        total = self.number_of_games
+        chunks = [(start, min(start + chunk_size, total))
+                  for start in range(0, total, chunk_size)]
+        config = (self._phrases, self._lineups, self._wheels,
+                  self._repetitions, self._master_seed, self._max_turns)
+
+        if workers == 1:
+            _init_worker(*config)
+            partials = [_play_chunk(chunk) for chunk in chunks]
+        else:
+            with ProcessPoolExecutor(workers, initializer=_init_worker,
+                                     initargs=config) as executor:
+                partials = list(executor.map(_play_chunk, chunks))
+
+        # Sloučení dílčích statistik v pořadí bloků
+        stats: dict[str, PlayerStats] = {}
+        for partial in partials:
+            for name, player_stats in partial.items():
+                stats.setdefault(name, PlayerStats()).merge(player_stats)
+        return stats
+
+
+# Konfigurace turnaje v rámci jednoho pracovního procesu
+_worker_config: tuple = ()
+_worker_simulators: dict[tuple[int, int], Simulator] = {}
+
+# Mezipaměť analýz tajenek sdílená simulátory pracovního procesu; každá
+# tajenka se hraje v po sobě jdoucích hrách, stačí tedy malá kapacita
+_worker_analytics = AnalyticsCache(capacity=64)
+
+
+def _init_worker(phrases, lineups, wheels, repetitions, master_seed,
+                 max_turns):
+    """Funkce, která připraví pracovní proces na zpracování bloků."""
+    global _worker_config, _worker_analytics
+    _worker_config = (phrases, lineups, wheels, repetitions, master_seed,
+                      max_turns)
+    _worker_simulators.clear()
+    _worker_analytics = AnalyticsCache(capacity=_worker_analytics.capacity)
+
+
+def _game_seed(master_seed: int, cell: tuple[int, ...]) -> int:
+    """Funkce odvodí semínko náhody jedné hry z hlavního semínka a z její
+    pozice v matici turnaje."""
+    key = f"{master_seed}:" + ":".join(map(str, cell))
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8)
+                          .digest(), "big")
+
+
+def _play_chunk(chunk: tuple[int, int]) -> dict[str, PlayerStats]:
+    """Funkce odehraje hry z dodaného rozsahu matice turnaje a vrací dílčí
+    statistiky hráčů."""
+    phrases, lineups, wheels, repetitions, master_seed, max_turns = \
+        _worker_config
+    stats: dict[str, PlayerStats] = {}
+
+    for index in range(*chunk):
+        # Rozklad lineárního indexu na pozici v matici
+        index, repetition = divmod(index, repetitions)
+        index, wheel_idx = divmod(index, len(wheels))
+        phrase_idx, lineup_idx = divmod(index, len(lineups))
+
+        simulator = _worker_simulators.get((lineup_idx, wheel_idx))
+        if simulator is None:
+            simulator = Simulator(
+                wheels[wheel_idx], lineups[lineup_idx], max_turns,
+                analytics=_worker_analytics)
+            _worker_simulators[(lineup_idx, wheel_idx)] = simulator
+
+        simulator.wheel.seed(_game_seed(
+            master_seed, (phrase_idx, lineup_idx, wheel_idx, repetition)))
+        result = simulator.play(phrases[phrase_idx])
+
+        turns = result.turns if result.is_finished else None
+        for seat, player in enumerate(simulator.players):
+            stats.setdefault(player.player_name, PlayerStats()).record(
+                result.scores[seat], result.winner == seat, turns)
+    return stats
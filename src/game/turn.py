@@ -0,0 +1,61 @@
+"""Tento modul obsahuje pravidla jednoho tahu hry v podobě funkce
+`play_turn`, kterou sdílí simulátor (viz `src.game.simulation`) i správce
+souběžných her (viz `src.game.manager`).
+
+Jde o referenční implementaci v čistém Pythonu; zkompilovaná varianta se
+shodnými výsledky je v `src.game._kernel` (viz `src.game.kernel`)."""
+
+from src.game.game import AbstractGame
+from src.game.phrase import GuessError
+
+
+# Možné výsledky jednoho tahu (viz funkce `play_turn`)
+BANKRUPT = 0
+HIT = 1
+MISS = 2
+GIVE_UP = 3
+
+# Maximální počet neplatných pokusů hráče v rámci jednoho tahu
+MAX_INVALID_GUESSES = 100
+
+
+def play_turn(game: AbstractGame) -> int:
+    """Funkce odehraje jeden tah hráče, který je ve hře na tahu, a vrací
+    jeho výsledek (`BANKRUPT`, `HIT`, `MISS` nebo `GIVE_UP`).
+
+    Neplatné pokusy hráče (které tajenka odmítne, i již zkoušená písmena)
+    jsou stejně jako u moderátora opakovány. Vrátí-li však hráč místo
+    písmene `None` (nemá již co hádat), nebo zkusí-li neplatný pokus
+    příliš mnohokrát (viz
+    `MAX_INVALID_GUESSES`), vrací funkce `GIVE_UP` a stav hry nemění."""
+    player = game.current_player
+    wedge = game.turn_the_wheel()
+
+    # Padl-li bankrot, hráč přichází o body a hraje další
+    if wedge.is_bankrupt:
+        game.bankrupt_player(player)
+        game.set_next_player()
+        return BANKRUPT
+
+    # Dokud hráč nedodá platný pokus, je dotazován znovu
+    phrase = game.phrase
+    for _ in range(MAX_INVALID_GUESSES):
+        guess = player.guess_letter(
+            game.guessed_letters, phrase.current_phrase)
+        if guess is None:
+            return GIVE_UP
+        try:
+            occurrences = game.check_guess(guess)
+            break
+        except GuessError:
+            continue
+    else:
+        return GIVE_UP
+
+    game.save_guess(guess)
+    if occurrences > 0:
+        game.increase_player_score(player, wedge.multiplier * occurrences)
+        return HIT
+
+    game.set_next_player()
+    return MISS
@@ -5,11 +5,33 @@ se setávají ze svého názvu a z multiplikátoru výhry. Mezi nimi může být
 klín BANKRUPT, který značí prohru.
 
 Kolo štěstí poskytuje službu náhodného výběru takového klínu (simulace točení).
+Klíny mohou mít různou váhu (šířku na kole); výběr klínu podle vah probíhá
+v konstantním čase pomocí předpočítané tabulky aliasů (Walkerova metoda).
+Kromě jednotlivých zatočení umí kolo vygenerovat i celou dávku zatočení
+najednou (metoda `rotate_many`) nebo předgenerovaný proud zatočení
+(`SpinStream`), který hra spotřebovává postupně.
+
+Každé kolo má svůj vlastní generátor náhodných čísel (`random.Random`),
+který lze inicializovat semínkem, díky čemuž jsou simulace
+reprodukovatelné. Z téhož generátoru čerpají i dávková zatočení: dávka
+spotřebuje 64 náhodných bitů na zatočení, které se na klíny převedou
+vždy stejně. Je-li nainstalována knihovna NumPy, převod proběhne
+vektorově, jinak ve smyčce; výsledky jsou v obou případech shodné, stejné
+semínko tedy dává stejná zatočení bez ohledu na to, zda je NumPy k
+dispozici.
 """
 
 
-from typing import Iterable
-from random import choice
+import sys
+from array import array
+from functools import cached_property
+from random import Random
+from typing import Iterable, Optional
+
+try:
+    import numpy
+except ImportError:  # NumPy je volitelnou závislostí
+    numpy = None
 
 
 class Wedge:
@@ -23,13 +45,20 @@ class Wedge:
 
     BANKRUPT_NAME = "BANKROT"
 
-    def __init__(self, name: str, multiplier: int):
+    def __init__(self, name: str, multiplier: int, weight: float = 1):
         """Initor, který přijímá název výherního klínu a násobek výhry.
         Pokud název odpovídá textovému řetězci v třídní proměnné
         `BANKRUPT_NAME`, je tento klín prohrou.
+
+        Volitelná kladná váha `weight` odpovídá relativní šířce klínu na kole,
+        tedy relativní pravděpodobnosti, že bude klín vytočen.
         """
+        if weight <= 0:
+            raise ValueError(f"Váha klínu musí být kladná: {weight}")
+
         self._name = name
         self._multiplier = multiplier
+        self._weight = weight
         self._is_bankrupt = name == self.BANKRUPT_NAME
 
     @property
@@ -42,6 +71,11 @@ class Wedge:
         """Multiplikátor, kterým se násobí výhra."""
         return self._multiplier
 
+    @property
+    def weight(self) -> float:
+        """Relativní šířka klínu na kole."""
+        return self._weight
+
     @property
     def is_bankrupt(self) -> bool:
         """Jestli je tento výherní klín bankrotem."""
@@ -57,18 +91,236 @@ class Wheel:
     výherních klínů. Kolo štěstí simuluje jeho zatočení a vrací náhodný
     výherní klín."""
 
-    def __init__(self, wedges: Iterable[Wedge]):
+    def __init__(self, wedges: Iterable[Wedge], seed: Optional[int] = None):
         """Initor, který přijímá sadu klínů, ze kterých se kolo sestává.
         Z nich pak umožňuje na požádání náhodně vybrat jeden výherní klín.
+
+        Volitelné semínko `seed` inicializuje generátor náhodných čísel
+        tohoto kola; bez něj je generátor inicializován náhodně.
         """
-        self._wedges = list(wedges)
+        self._wedges = tuple(wedges)
+        if not self._wedges:
+            raise ValueError("Kolo štěstí musí mít alespoň jeden klín!")
+
+        self._multipliers = tuple(wedge.multiplier for wedge in self._wedges)
+        self._is_uniform = len({wedge.weight for wedge in self._wedges}) == 1
+        self._probabilities, self._aliases = _alias_table(
+            [wedge.weight for wedge in self._wedges])
+        self._random = Random(seed)
+        self._choice = self._random.choice
 
     @property
     def wedges(self) -> tuple[Wedge]:
         """Všechny výherní klíny, které byly kolu dodány."""
-        return tuple(self._wedges)
+        return self._wedges
+
+    @cached_property
+    def probabilities(self) -> tuple[float]:
+        """Pravděpodobnosti vytočení jednotlivých klínů (ve stejném pořadí
+        jako `wedges`)."""
+        total = sum(wedge.weight for wedge in self._wedges)
+        return tuple(wedge.weight / total for wedge in self._wedges)
+
+    @cached_property
+    def expected_value(self) -> float:
+        """Střední hodnota multiplikátoru jednoho zatočení (bankrotové klíny
+        přispívají nulou)."""
+        return sum(probability * wedge.multiplier
+                   for probability, wedge in zip(self.probabilities,
+                                                 self._wedges)
+                   if not wedge.is_bankrupt)
+
+    @cached_property
+    def bankrupt_probability(self) -> float:
+        """Pravděpodobnost, že jedno zatočení skončí bankrotem."""
+        return sum(probability
+                   for probability, wedge in zip(self.probabilities,
+                                                 self._wedges)
+                   if wedge.is_bankrupt)
+
+    def seed(self, seed: Optional[int] = None):
+        """Metoda znovu inicializuje generátor náhodných čísel tohoto kola
+        dodaným semínkem."""
+        self._random.seed(seed)
+
+    def getstate(self) -> tuple:
+        """Metoda vrací stav generátoru náhodných čísel, kterým kolo točí
+        (viz `rotate` a `rotate_many`)."""
+        return self._random.getstate()
+
+    def setstate(self, state: tuple):
+        """Metoda nastaví stav generátoru náhodných čísel, kterým kolo točí,
+        na stav dříve vrácený metodou `getstate`."""
+        self._random.setstate(state)
 
     def rotate(self) -> Wedge:
         """Simulace točení kola štěstí. Metoda náhodně vybere jeden klín,
-        který vrací."""
-        return choice(self.wedges)
+        který vrací. Mají-li klíny různé váhy, vybírá se podle tabulky
+        aliasů jediným náhodným číslem."""
+        if self._is_uniform:
+            return self._choice(self._wedges)
+
+        scaled = self._random.random() * len(self._wedges)
+        index = int(scaled)
+        if scaled - index >= self._probabilities[index]:
+            index = self._aliases[index]
+        return self._wedges[index]
+
+    def rotate_many(self, count: int) -> tuple:
+        """Metoda najednou odsimuluje `count` zatočení kolem a vrací dvojici
+        polí (indexy vytočených klínů, jejich multiplikátory).
+
+        Každé zatočení spotřebuje 64 bitů generátoru kola: z horních 53
+        bitů vznikne číslo z intervalu [0, 1), které se stejně jako
+        v `rotate` převede na klín tabulkou aliasů. Je-li nainstalována
+        knihovna NumPy, jsou výsledkem pole `numpy.ndarray`, jinak pole
+        `array.array` ze standardní knihovny, se shodnými hodnotami.
+        Bankrotové klíny lze rozpoznat podle indexu, viz `wedges`."""
+        if count < 0:
+            raise ValueError(f"Počet zatočení nesmí být záporný: {count}")
+
+        size = len(self._wedges)
+        words = self._random.getrandbits(64 * count).to_bytes(
+            8 * count, "little")
+        if numpy is not None:
+            scaled = (numpy.frombuffer(words, "<u8") >> 11) * _UNIT * size
+            indices = scaled.astype(numpy.int64)
+            if not self._is_uniform:
+                indices = numpy.where(
+                    scaled - indices < numpy.asarray(
+                        self._probabilities)[indices],
+                    indices, numpy.asarray(self._aliases)[indices])
+            return indices, numpy.asarray(self._multipliers)[indices]
+
+        bits = array("Q")
+        bits.frombytes(words)
+        if sys.byteorder != "little":
+            bits.byteswap()
+        if self._is_uniform:
+            indices = array("l", [int((word >> 11) * _UNIT * size)
+                                  for word in bits])
+        else:
+            probabilities = self._probabilities
+            aliases = self._aliases
+            indices = array("l")
+            for word in bits:
+                scaled = (word >> 11) * _UNIT * size
+                index = int(scaled)
+                if scaled - index >= probabilities[index]:
+                    index = aliases[index]
+                indices.append(index)
+        multipliers = self._multipliers
+        return indices, array("l", [multipliers[i] for i in indices])
+
+    def stream(self, batch_size: int = 1024) -> "SpinStream":
+        """Metoda vrací proud zatočení tohoto kola, který je generován po
+        dávkách o velikosti `batch_size`."""
+        return SpinStream(self, batch_size)
+
+
+class SpinStream(Wheel):
+    """Instance této třídy reprezentují proud předgenerovaných zatočení
+    kolem štěstí.
+
+    Proud je sám kolem štěstí (se stejnými klíny jako kolo, ze kterého
+    vznikl), lze jej tedy předat hře místo původního kola. Každé zatočení
+    pak pouze vezme další předgenerovaný klín; jakmile dojdou, vygeneruje
+    se pomocí `Wheel.rotate_many` původního kola další dávka.
+
+    Proud sdílí generátor náhodných čísel s původním kolem. Stav proudu
+    (`getstate`) zahrnuje stav tohoto generátoru i dosud nespotřebovaná
+    předgenerovaná zatočení, takže hra s proudem po obnově ze snímku
+    pokračuje stejnými zatočeními."""
+
+    def __init__(self, wheel: Wheel, batch_size: int = 1024):
+        """Initor, který přijímá kolo, jehož zatočení má proud poskytovat,
+        a velikost jedné dávky předgenerovaných zatočení."""
+        if batch_size < 1:
+            raise ValueError(f"Velikost dávky musí být kladná: {batch_size}")
+
+        super().__init__(wheel.wedges)
+        self._wheel = wheel
+        self._batch_size = batch_size
+        self._random = wheel._random
+        self._choice = wheel._choice
+
+        # Indexy předgenerovaných klínů a index dalšího z nich
+        self._pending: list[int] = []
+        self._next = 0
+
+    @property
+    def wheel(self) -> Wheel:
+        """Kolo, ze kterého proud zatočení vzniká."""
+        return self._wheel
+
+    def seed(self, seed: Optional[int] = None):
+        """Metoda znovu inicializuje generátor původního kola a zahodí
+        doposud předgenerovaná zatočení."""
+        self._wheel.seed(seed)
+        self._pending = []
+        self._next = 0
+
+    def getstate(self) -> tuple:
+        """Metoda vrací stav proudu: dvojici (stav generátoru původního
+        kola, indexy dosud nespotřebovaných předgenerovaných klínů)."""
+        return (self._wheel.getstate(), tuple(self._pending[self._next:]))
+
+    def setstate(self, state: tuple):
+        """Metoda nastaví stav proudu na stav dříve vrácený metodou
+        `getstate`. Jiný stav vyhodí výjimku `ValueError`."""
+        if len(state) != 2 or not isinstance(state[1], tuple):
+            raise ValueError("Nejde o stav proudu zatočení!")
+        random_state, pending = state
+        self._wheel.setstate(random_state)
+        self._pending = list(pending)
+        self._next = 0
+
+    def rotate(self) -> Wedge:
+        """Metoda vrací další předgenerovaný klín proudu."""
+        if self._next == len(self._pending):
+            indices, _ = self._wheel.rotate_many(self._batch_size)
+            self._pending = indices.tolist()
+            self._next = 0
+        index = self._pending[self._next]
+        self._next += 1
+        return self._wedges[index]
+
+    def rotate_many(self, count: int) -> tuple:
+        """Dávková zatočení proud deleguje na původní kolo."""
+        return self._wheel.rotate_many(count)
+
+    def __iter__(self):
+        """Proud lze procházet jako nekonečný iterátor klínů."""
+        return self
+
+    def __next__(self) -> Wedge:
+        """Další klín proudu."""
+        return self.rotate()
+
+
+# Převod 53 bitů na číslo z intervalu [0, 1)
+_UNIT = 2.0 ** -53
+
+
+def _alias_table(weights: list[float]) -> tuple[tuple[float], tuple[int]]:
+    """Funkce sestaví tabulku aliasů (Walkerova metoda ve variantě podle
+    Vose) pro dodané váhy. Vrací dvojici (pravděpodobnosti, aliasy): pro
+    náhodně zvolený sloupec `i` se vybere klín `i` s pravděpodobností
+    `pravděpodobnosti[i]`, jinak klín `aliasy[i]`."""
+    size = len(weights)
+    total = sum(weights)
+    scaled = [weight * size / total for weight in weights]
+    probabilities = [1.0] * size
+    aliases = list(range(size))
+
+    small = [i for i, value in enumerate(scaled) if value < 1.0]
+    large = [i for i, value in enumerate(scaled) if value >= 1.0]
+    while small and large:
+        less, more = small.pop(), large.pop()
+        probabilities[less] = scaled[less]
+        aliases[less] = more
+        scaled[more] -= 1.0 - scaled[less]
+        (small if scaled[more] < 1.0 else large).append(more)
+
+    # Zbylé sloupce mají (až na zaokrouhlovací chyby) pravděpodobnost 1
+    return tuple(probabilities), tuple(aliases)
@@ -0,0 +1,136 @@
+"""Tento modul obsahuje asynchronní protokol hráče pro asynchronního
+moderátora (viz `src.game.async_moderator.AsyncModerator`).
+
+Asynchronní hráč nevrací svůj tip přímo, ale jako korutinu, díky čemuž může
+jediná smyčka událostí (asyncio) obsluhovat mnoho her najednou, i když na
+některé hráče (např. vzdálené nebo lidské) je nutné čekat.
+
+Modul obsahuje:
+
+- `AbstractAsyncPlayer`, společného abstraktního předka asynchronních hráčů,
+- `SyncPlayerAdapter`, obal existujících synchronních hráčů
+  (`AbstractPlayer`),
+- `StreamPlayer`, hráče napojeného na proud (socket nebo standardní vstup).
+"""
+
+import asyncio
+import sys
+from abc import ABC, abstractmethod
+from typing import Iterable, Optional
+
+from src.player.abstract_player import AbstractPlayer
+
+
+class AbstractAsyncPlayer(ABC):
+    """Abstraktní předek pro všechny asynchronní hráče. Poskytuje stejný
+    protokol jako `AbstractPlayer`, pouze metoda `guess_letter` je
+    korutinou."""
+
+    def __init__(self, player_name: str):
+        """Initor, který přijímá pouze jméno daného hráče."""
+        self._player_name = player_name
+
+    @property
+    def player_name(self) -> str:
+        """Jméno hráče."""
+        return self._player_name
+
+    def __repr__(self):
+        return self.player_name
+
+    @abstractmethod
+    async def guess_letter(self, already_guessed: Iterable[str],
+                           phrase: str) -> Optional[str]:
+        """Abstraktní korutina, která je odpovědná za pokus o uhodnutí
+        dalšího písmene v tajence.
+
+        K tomu dostává seznam písmen, která již byla použita, a z části
+        skrytou tajenku, do které má za úkol další znak uhodnout.
+        """
+
+
+class SyncPlayerAdapter(AbstractAsyncPlayer):
+    """Obal, který z libovolného synchronního hráče (`AbstractPlayer`)
+    vytvoří hráče asynchronního.
+
+    Rychlé hráče (NPC) volá přímo ve smyčce událostí. Blokující hráče (např.
+    `HumanPlayer`, který čeká na `input()`) volá v samostatném vlákně, aby
+    nezastavili ostatní hry. Vlákno nelze přerušit: vyprší-li moderátorovi
+    na dotaz časový limit, vlákno běží dál a další dotaz místo nového
+    vlákna počká na jeho tip. Tip vlákna, které doběhlo až po vypršení
+    limitu, se zahodí."""
+
+    def __init__(self, player: AbstractPlayer, blocking: bool = False):
+        """Initor, který přijímá obalovaného hráče a informaci, zda-li jeho
+        rozhodování blokuje (a má tedy běžet ve vlákně)."""
+        super().__init__(player.player_name)
+        self._player = player
+        self._blocking = blocking
+        self._pending: Optional[asyncio.Future] = None
+
+    @property
+    def player(self) -> AbstractPlayer:
+        """Obalený synchronní hráč."""
+        return self._player
+
+    async def guess_letter(self, already_guessed: Iterable[str],
+                           phrase: str) -> Optional[str]:
+        """Korutina předá dotaz obalenému hráči."""
+        if not self._blocking:
+            return self._player.guess_letter(already_guessed, phrase)
+
+        if self._pending is None or self._pending.done():
+            self._pending = asyncio.ensure_future(asyncio.to_thread(
+                self._player.guess_letter, tuple(already_guessed), phrase))
+        return await asyncio.shield(self._pending)
+
+
+class StreamPlayer(AbstractAsyncPlayer):
+    """Hráč, se kterým se komunikuje po řádcích přes proud (např. TCP
+    spojení nebo standardní vstup).
+
+    Každý dotaz je jeden řádek ve tvaru
+    `<číslo dotazu>\\t<tajenka>\\t<zkoušená písmena>`, odpovědí je řádek
+    `<číslo dotazu> <hádané písmeno>` (číslo a písmeno odděluje libovolný
+    bílý znak). Řádky s jiným číslem dotazu, např. opožděné odpovědi na
+    dotazy, na které moderátorovi vypršel časový limit, hráč zahodí.
+    Uzavře-li protistrana spojení, vrací hráč `None` (nemá co hádat)."""
+
+    def __init__(self, player_name: str, reader: asyncio.StreamReader,
+                 writer: Optional[asyncio.StreamWriter] = None):
+        """Initor, který přijímá jméno hráče, proud, ze kterého se čtou
+        odpovědi, a volitelně proud, do kterého se zapisují dotazy (bez něj
+        se dotazy vypisují na standardní výstup)."""
+        super().__init__(player_name)
+        self._reader = reader
+        self._writer = writer
+        self._query = 0
+
+    @classmethod
+    async def from_stdin(cls, player_name: str) -> "StreamPlayer":
+        """Korutina vytvoří hráče, který odpovídá přes standardní vstup."""
+        loop = asyncio.get_running_loop()
+        reader = asyncio.StreamReader()
+        await loop.connect_read_pipe(
+            lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+        return cls(player_name, reader)
+
+    async def guess_letter(self, already_guessed: Iterable[str],
+                           phrase: str) -> Optional[str]:
+        """Korutina odešle dotaz a počká na řádek s odpovědí na něj."""
+        self._query += 1
+        number = str(self._query)
+        query = f"{number}\t{phrase}\t{''.join(already_guessed)}\n"
+        if self._writer is None:
+            print(query, end="", flush=True)
+        else:
+            self._writer.write(query.encode())
+            await self._writer.drain()
+
+        while True:
+            line = await self._reader.readline()
+            if not line:
+                return None
+            reply = line.decode().split(None, 1)
+            if len(reply) == 2 and reply[0] == number:
+                return reply[1].strip().upper()
@@ -0,0 +1,286 @@
+"""Tento modul obsahuje definici hráče, který hádá na základě slovníku.
+
+Hráč rozdělí aktuální podobu tajenky na jednotlivá slova (např. `P_SL__N_`)
+a pro každé z nich si udržuje množinu kandidátů ze slovníku, kteří
+odpovídají již odkrytým písmenům a neobsahují žádné již zkoušené písmeno na
+skrytých pozicích. Tyto množiny zužuje průběžně (pouze o nové informace),
+místo aby slovník při každém tahu procházel znovu.
+
+Jako další písmeno volí to, které se vyskytuje v největším podílu kandidátů
+napříč slovy tajenky. Nemá-li žádné kandidáty, hádá podle pevného pořadí
+četnosti písmen (stejně jako `EntropyDrivenPlayer`).
+
+Počty kandidátů s jednotlivými písmeny si hráč pro každé slovo udržuje
+průběžně: na začátku hry je převezme z indexu, ubude-li kandidátů málo,
+odečte jen jejich příspěvky; jinak počty přepočítá pomocí bitových masek
+indexu (jen pro písmena, jejichž počet se mohl změnit). Zbude-li kandidátů
+málo, uchová si je jako seznam slov a dále je prochází přímo, takže cena
+tahu pak nezávisí na velikosti slovníku."""
+
+from collections import Counter
+from itertools import chain
+from typing import Iterable, Optional
+
+from src.game.phrase import AbstractSecretPhrase, Letter, fold_accents
+from src.player.abstract_player import AbstractPlayer
+from src.player.word_index import ALPHABET, WordIndex
+
+
+class _WordSlot:
+    """Instance této třídy reprezentují jedno slovo tajenky, množinu
+    (masku) jeho kandidátů ze slovníku a počty kandidátů s jednotlivými
+    písmeny (platné pro masku `counted` s `total` kandidáty). Zbude-li
+    kandidátů málo, uchovává je i jako seznam slov `words` zúžený podle
+    zkoušených písmen `letters`."""
+
+    __slots__ = ("start", "length", "candidates", "pattern", "counted",
+                 "total", "counts", "words", "letters")
+
+    def __init__(self, start: int, length: int, candidates: int):
+        """Initor, který přijímá pozici začátku slova v tajence, jeho délku
+        a počáteční masku kandidátů."""
+        self.start = start
+        self.length = length
+        self.candidates = candidates
+        self.pattern = Letter.WILDCARD * length
+        self.counted = 0
+        self.total = 0
+        self.counts: Optional[dict[str, int]] = None
+        self.words: Optional[list[str]] = None
+        self.letters: set[str] = set()
+
+
+class DictionaryPlayer(AbstractPlayer):
+    """Hráč, který hádá písmena na základě kandidátních slov ze slovníku.
+
+    Hráč si mezi tahy pamatuje stav aktuální hry. Pozná-li, že dodaná
+    tajenka nenavazuje na předchozí tah (jiná délka, jiná odkrytá písmena
+    nebo méně zkoušených písmen), začne novou hru; ručně lze stav vynulovat
+    metodou `reset`."""
+
+    # Příspěvky kandidátů se k počtům písmen přičítají (či se od nich
+    # odečítají) jednotlivě, je-li jich nejvýše takový díl všech slov dané
+    # délky; jinak se počty počítají pomocí masek, jejichž cena roste
+    # s počtem slov dané délky
+    WORD_SHARE = 256
+
+    def __init__(self, player_name: str, index: WordIndex,
+                 relative_occurrence: str = "OENATVSILKRDPMUZJYCBHFGXWQ"):
+        """Initor, který přijímá jméno hráče, index slovníku a pořadí
+        písmen podle četnosti, které se použije, nemá-li hráč kandidáty."""
+        super().__init__(player_name)
+        self._index = index
+        self._relative_occurrence = relative_occurrence
+        self.reset()
+
+    @property
+    def index(self) -> WordIndex:
+        """Index slovníku, se kterým hráč pracuje."""
+        return self._index
+
+    def reset(self):
+        """Metoda zapomene stav rozehrané hry."""
+        self._phrase: Optional[str] = None
+        self._guessed: set[str] = set()
+        self._slots: list[_WordSlot] = []
+
+    def guess_letter(self, already_guessed: Iterable[str], phrase: str) -> str:
+        """Metoda aktualizuje kandidáty podle dodané podoby tajenky a
+        zkoušených písmen a vrací písmeno, které se vyskytuje v největším
+        podílu kandidátů."""
+        guessed = {fold_accents(letter).upper() for letter in already_guessed}
+        self.update(guessed, phrase)
+
+        scores = self.letter_scores()
+        if scores:
+            return max(scores, key=scores.get)
+
+        for letter in self._relative_occurrence:
+            if letter not in guessed:
+                return letter
+
+    def update(self, guessed: set[str], phrase: str):
+        """Metoda zúží kandidáty o informace, které přibyly od posledního
+        tahu. Nenavazuje-li tajenka na předchozí stav, začne novou hru."""
+        if not self._continues(guessed, phrase):
+            self.reset()
+            self._slots = self._split(phrase)
+
+        index = self._index
+        wildcard = Letter.WILDCARD
+        new_letters = guessed - self._guessed
+
+        for slot in self._slots:
+            pattern = phrase[slot.start:slot.start + slot.length]
+            candidates = slot.candidates
+
+            # Nově odkrytá písmena musí kandidát mít na stejných pozicích
+            if pattern != slot.pattern:
+                for position, letter in enumerate(pattern):
+                    if letter != wildcard and slot.pattern[position] != letter:
+                        candidates &= index.position_mask(
+                            slot.length, position, fold_accents(letter))
+                slot.pattern = pattern
+
+            # Nově zkoušená písmena kandidát nesmí mít na skrytých pozicích;
+            # není-li písmeno odkryté, nesmí jej mít vůbec
+            folded = fold_accents(pattern).upper()
+            for letter in new_letters:
+                if letter not in folded:
+                    candidates &= ~index.letter_mask(slot.length, letter)
+                    continue
+                excluded = 0
+                for position, hidden in enumerate(pattern):
+                    if hidden == wildcard:
+                        excluded |= index.position_mask(
+                            slot.length, position, letter)
+                candidates &= ~excluded
+
+            slot.candidates = candidates
+
+        self._phrase = phrase
+        self._guessed = set(guessed)
+
+    def letter_scores(self) -> dict[str, float]:
+        """Metoda vrací pro každé dosud nezkoušené písmeno podíl kandidátů,
+        kteří jej obsahují, sečtený přes všechna slova tajenky, která mají
+        alespoň jednoho kandidáta."""
+        guessed = self._guessed
+        scores: dict[str, float] = {}
+        for slot in self._slots:
+            if Letter.WILDCARD not in slot.pattern:
+                continue
+            counts = self._letter_counts(slot)
+            total = slot.total
+            if not total:
+                continue
+            for letter in ALPHABET:
+                count = counts.get(letter)
+                if count and letter not in guessed:
+                    scores[letter] = scores.get(letter, 0) + count / total
+        return scores
+
+    def _letter_counts(self, slot: _WordSlot) -> dict[str, int]:
+        """Metoda vrací aktuální počty kandidátů slova, kteří obsahují
+        jednotlivá písmena. Počty (i celkový počet kandidátů `total`)
+        aktualizuje o kandidáty vyřazené od posledního dotazu."""
+        length = slot.length
+        candidates = slot.candidates
+        counts = slot.counts
+
+        if counts is None:
+            counts = dict(self._index.letter_counts(length))
+            slot.counted = self._index.all_candidates(length)
+            slot.total = len(self._index.words(length))
+        if slot.counted == candidates:
+            slot.counts = counts
+            return counts
+
+        if slot.words is not None:
+            # Málo kandidátů: vyřazení se najdou procházením slov
+            kept = self._filter(slot)
+            total = len(kept)
+            if len(slot.words) - total <= total:
+                _add_letters(counts, set(slot.words).difference(kept), -1)
+            else:
+                counts = {}
+                _add_letters(counts, kept, 1)
+            slot.words = kept
+        else:
+            # Kandidáti se jen vyřazují, vyřazených je tedy rozdíl počtů
+            total = candidates.bit_count()
+            limit = len(self._index.words(length)) // self.WORD_SHARE
+            if total <= limit:
+                slot.words = self._index.candidates(length, candidates)
+                slot.letters = set(self._guessed)
+                counts = {}
+                _add_letters(counts, slot.words, 1)
+            elif slot.total - total <= limit:
+                _add_letters(counts, self._index.candidates(
+                    length, slot.counted & ~candidates), -1)
+            else:
+                counts = self._count_letters(length, candidates, total,
+                                             counts, slot.total)
+
+        slot.counted = candidates
+        slot.total = total
+        slot.counts = counts
+        return counts
+
+    def _count_letters(self, length: int, candidates: int, total: int,
+                       previous: dict[str, int],
+                       previous_total: int) -> dict[str, int]:
+        """Metoda spočítá pomocí masek písmen z indexu pro každé nezkoušené
+        písmeno počet kandidátů, kteří jej obsahují. Písmeno, které dosud
+        neměl žádný kandidát (nebo které měli všichni), se nepočítá znovu,
+        protože kandidáti jsou podmnožinou předchozích."""
+        counts: dict[str, int] = {}
+        index = self._index
+        for letter in ALPHABET:
+            if letter in self._guessed:
+                continue
+            count = previous.get(letter, 0)
+            if count == previous_total:
+                counts[letter] = total
+            elif count:
+                counts[letter] = (candidates & index.letter_mask(
+                    length, letter)).bit_count()
+        return counts
+
+    def _filter(self, slot: _WordSlot) -> list[str]:
+        """Metoda vrací ty kandidáty ze seznamu slov `words`, kteří vyhovují
+        písmenům zkoušeným od jeho posledního zúžení (stejně jako v metodě
+        `update`): písmeno, které ve slově tajenky odkryto není, kandidát
+        nesmí obsahovat, jinak jej musí mít právě na odkrytých pozicích."""
+        words = slot.words
+        pattern = fold_accents(slot.pattern).upper()
+        for letter in self._guessed - slot.letters:
+            positions = [position for position, character
+                         in enumerate(pattern) if character == letter]
+            if not positions:
+                words = [word for word in words if letter not in word]
+            else:
+                occurrences = len(positions)
+                words = [word for word in words
+                         if word.count(letter) == occurrences
+                         and all(word[position] == letter
+                                 for position in positions)]
+        slot.letters = set(self._guessed)
+        return words
+
+    def _continues(self, guessed: set[str], phrase: str) -> bool:
+        """Metoda ověří, zda-li dodaný stav navazuje na předchozí tah."""
+        previous = self._phrase
+        if previous is None or len(previous) != len(phrase):
+            return False
+        if not self._guessed <= guessed:
+            return False
+        wildcard = Letter.WILDCARD
+        return all(old == wildcard or old == new
+                   for old, new in zip(previous, phrase))
+
+    def _split(self, phrase: str) -> list[_WordSlot]:
+        """Metoda rozdělí tajenku na slova oddělená speciálními znaky."""
+        separators = AbstractSecretPhrase.SPECIAL_CHARACTERS
+        slots = []
+        start = None
+        for position, letter in enumerate(phrase + separators[0]):
+            if letter in separators:
+                if start is not None:
+                    length = position - start
+                    slots.append(_WordSlot(
+                        start, length, self._index.all_candidates(length)))
+                    start = None
+            elif start is None:
+                start = position
+        return slots
+
+
+def _add_letters(counts: dict[str, int], words: Iterable[str],
+                 increment: int):
+    """Funkce přičte k počtům písmen příspěvky dodaných slov (každé písmeno
+    slova jednou) vynásobené `increment` (tedy při záporném přírustku je
+    odečte)."""
+    letters = Counter(chain.from_iterable(map(set, words)))
+    for letter, count in letters.items():
+        counts[letter] = counts.get(letter, 0) + increment * count
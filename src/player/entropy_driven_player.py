@@ -1,6 +1,7 @@
 """"""
-from typing import Iterable
+from typing import Iterable, Optional
 
+from src.game.letters import LetterRanking, guessed_mask
 from src.player.abstract_player import AbstractPlayer
 
 
@@ -8,19 +9,22 @@ class EntropyDrivenPlayer(AbstractPlayer):
     """"""
 
     def __init__(self, player_name: str, relative_occurrence: str):
+        """Pořadí `relative_occurrence` může obsahovat malá písmena
+        i písmena s diakritikou; hráč je hádá v normalizované podobě
+        a opakovaná písmena přeskočí (viz `LetterRanking`)."""
         super().__init__(player_name)
         self._relative_occurrence = relative_occurrence
+        self._ranking = LetterRanking(relative_occurrence)
 
     @property
     def relative_occurrence(self) -> tuple[str]:
         """"""
         return tuple(self._relative_occurrence)
 
-    def guess_letter(self, already_guessed: Iterable[str], phrase: str) -> str:
+    def guess_letter(self, already_guessed: Iterable[str],
+                     phrase: str) -> Optional[str]:
         """"""
-        for character in self.relative_occurrence:
-            if character not in already_guessed:
-                return character
+        return self._ranking.first_unguessed(guessed_mask(already_guessed))
 
 
 class EntropyDrivenPlayerEN(EntropyDrivenPlayer):
@@ -0,0 +1,236 @@
+"""Tento modul obsahuje definici hráče, který volí písmena podle očekávaného
+informačního zisku (entropie) nad kandidátními slovy ze slovníku.
+
+Pro každé slovo tajenky a každé dosud nezkoušené písmeno hráč zná rozložení
+možných výsledků pokusu: písmeno ve slově není, nebo je právě na určité
+množině pozic (signatuře). Entropie tohoto rozložení je očekávaný
+informační zisk pokusu; jeho součet přes slova tajenky hráč maximalizuje.
+Alternativně může hráč maximalizovat očekávaný počet odkrytých znaků, tedy
+očekávané skóre při libovolném multiplikátoru vytočeného klínu.
+
+Počty kandidátů pro jednotlivé signatury si hráč udržuje průběžně: ubude-li
+kandidátů málo, odečte jen jejich příspěvky; jinak tabulku přepočítá pomocí
+bitových masek indexu, a to jen pro písmena a signatury, jejichž počty se
+mohly změnit. Zbude-li kandidátů málo, uchová si je jako seznam slov (stejně
+jako `DictionaryPlayer`) a tabulku dále upravuje po jednotlivých slovech."""
+
+from math import log2
+from typing import Iterable, Optional
+
+from src.game.phrase import Letter, fold_accents
+from src.player.dictionary_player import DictionaryPlayer, _WordSlot
+from src.player.word_index import WordIndex, word_signatures
+
+
+class InformationPlayer(DictionaryPlayer):
+    """Hráč, který hádá písmeno s největším očekávaným informačním ziskem
+    (režim `INFORMATION`) nebo s největším očekávaným počtem výskytů
+    (režim `SCORE`) nad kandidátními slovy ze slovníku."""
+
+    # Režim maximalizující očekávaný informační zisk
+    INFORMATION = "information"
+
+    # Režim maximalizující očekávaný počet odkrytých znaků
+    SCORE = "score"
+
+    # Tabulka signatur se z masek počítá dráž než počty písmen, seznam
+    # kandidátů se proto uchovává dříve (viz `DictionaryPlayer.WORD_SHARE`)
+    WORD_SHARE = 64
+
+    # Maximální počet tabulek signatur, které si hráč pamatuje mezi hrami
+    # (nejstarší se zapomínají první)
+    CACHE_SIZE = 128
+
+    def __init__(self, player_name: str, index: WordIndex,
+                 mode: str = INFORMATION,
+                 relative_occurrence: str = "OENATVSILKRDPMUZJYCBHFGXWQ"):
+        """Initor, který přijímá jméno hráče, index slovníku, režim volby
+        písmene a pořadí písmen podle četnosti, které se použije, nemá-li
+        hráč žádné kandidáty."""
+        if mode not in (self.INFORMATION, self.SCORE):
+            raise ValueError(f"Neznámý režim hráče: '{mode}'")
+
+        self._mode = mode
+        self._cache: dict[tuple, dict[str, dict[int, int]]] = {}
+        super().__init__(player_name, index, relative_occurrence)
+
+    @property
+    def mode(self) -> str:
+        """Režim volby písmene."""
+        return self._mode
+
+    def reset(self):
+        """Metoda zapomene stav rozehrané hry včetně tabulek signatur."""
+        super().reset()
+        self._tables: dict[int, tuple[int, int,
+                                      dict[str, dict[int, int]]]] = {}
+
+    def letter_scores(self) -> dict[str, float]:
+        """Metoda vrací pro každé dosud nezkoušené písmeno jeho ohodnocení
+        sečtené přes všechna slova tajenky, která mají alespoň jednoho
+        kandidáta.
+
+        V režimu `INFORMATION` je ohodnocením dvojice (informační zisk,
+        očekávaný počet výskytů), aby při nulovém zisku rozhodovala jistota
+        zásahu; v režimu `SCORE` pouze očekávaný počet výskytů."""
+        information: dict[str, float] = {}
+        occurrences: dict[str, float] = {}
+
+        for slot in self._slots:
+            if Letter.WILDCARD not in slot.pattern:
+                continue
+            total, table = self._table(slot)
+            if not total:
+                continue
+
+            for letter, counts in table.items():
+                if letter in self._guessed:
+                    continue
+                present = 0
+                expected = 0.0
+                entropy = 0.0
+                for signature, count in counts.items():
+                    if count:
+                        present += count
+                        expected += count * signature.bit_count()
+                        entropy -= count * log2(count / total)
+                if not present:
+                    continue
+                absent = total - present
+                if absent:
+                    entropy -= absent * log2(absent / total)
+                information[letter] = (information.get(letter, 0.0)
+                                       + entropy / total)
+                occurrences[letter] = (occurrences.get(letter, 0.0)
+                                       + expected / total)
+
+        if self._mode == self.SCORE:
+            return occurrences
+        return {letter: (information[letter], occurrences[letter])
+                for letter in information}
+
+    def _table(self, slot: _WordSlot) -> tuple[int, dict[str, dict[int, int]]]:
+        """Metoda vrací počet kandidátů slova a aktuální tabulku jejich
+        počtů pro každé písmeno a signaturu. Tabulku aktualizuje
+        o kandidáty vyřazené od posledního dotazu."""
+        index = self._index
+        length = slot.length
+        candidates = slot.candidates
+        previous, total, table = self._tables.get(slot.start, (None, 0, None))
+        if previous == candidates:
+            return total, table
+
+        if slot.words is not None:
+            # Málo kandidátů: vyřazení se najdou procházením slov
+            kept = self._filter(slot)
+            if len(slot.words) - len(kept) <= len(kept):
+                self._add_words(table, set(slot.words).difference(kept), -1)
+            else:
+                table = {}
+                self._add_words(table, kept, 1)
+            slot.words = kept
+            total = len(kept)
+        elif candidates == index.all_candidates(length):
+            total = len(index.words(length))
+            table = {letter: dict(counts) for letter, counts
+                     in index.signature_counts(length).items()
+                     if letter not in self._guessed}
+        else:
+            count = candidates.bit_count()
+            limit = len(index.words(length)) // self.WORD_SHARE
+            if count <= limit:
+                slot.words = index.candidates(length, candidates)
+                slot.letters = set(self._guessed)
+                table = {}
+                self._add_words(table, slot.words, 1)
+            elif table is not None and total - count <= limit:
+                # Kandidáti se jen vyřazují, vyřazených je rozdíl počtů
+                self._add_words(table, index.candidates(
+                    length, previous & ~candidates), -1)
+            else:
+                table = self._cached_count(slot, table)
+            total = count
+
+        self._tables[slot.start] = (candidates, total, table)
+        return total, table
+
+    def _cached_count(self, slot: _WordSlot,
+                      previous: Optional[dict[str, dict[int, int]]]
+                      ) -> dict[str, dict[int, int]]:
+        """Metoda vrací tabulku pro aktuální kandidáty slova spočítanou
+        metodou `_count`. Kandidáti jsou dáni délkou slova, jeho odkrytými
+        písmeny a zkoušenými písmeny, tabulky se tedy pro tyto klíče
+        pamatují i mezi hrami (zejména stavy po prvním pokusu se opakují)."""
+        key = (slot.length, fold_accents(slot.pattern),
+               frozenset(self._guessed))
+        table = self._cache.get(key)
+        if table is None:
+            table = self._count(slot.length, slot.candidates, slot.pattern,
+                                previous)
+            if len(self._cache) >= self.CACHE_SIZE:
+                del self._cache[next(iter(self._cache))]
+            self._cache[key] = table
+        # Tabulka hry se upravuje, sdílet se tedy nesmí
+        return {letter: dict(counts) for letter, counts in table.items()}
+
+    def _count(self, length: int, candidates: int, pattern: str,
+               previous: Optional[dict[str, dict[int, int]]] = None
+               ) -> dict[str, dict[int, int]]:
+        """Metoda spočítá pomocí masek signatur z indexu tabulku počtů
+        kandidátů pro každé písmeno a signaturu.
+
+        Je-li dodána tabulka `previous` pro dřívější kandidáty (jejichž
+        podmnožinou jsou kandidáti současní), počítají se jen signatury,
+        které v ní mají nenulový počet, a písmeno, jehož počet kandidátů se
+        nezměnil, převezme dřívější počty."""
+        index = self._index
+        table: dict[str, dict[int, int]] = {}
+
+        # Nezkoušené písmeno může být jen na skrytých pozicích; signatury
+        # se procházejí od nejčastějších, dokud nejsou započtena všechna
+        # slova s daným písmenem
+        revealed = ~self._hidden_positions(pattern)
+        for letter, masks in index.signature_masks(length).items():
+            if letter in self._guessed:
+                continue
+            old = previous.get(letter, {}) if previous is not None else None
+            if old is not None and not any(old.values()):
+                table[letter] = {}
+                continue
+            with_letter = candidates & index.letter_mask(length, letter)
+            remaining = with_letter.bit_count()
+            if old is not None and remaining == sum(old.values()):
+                table[letter] = old
+                continue
+            counts = table[letter] = {}
+            for signature, mask in masks.items():
+                if not remaining:
+                    break
+                if signature & revealed or old is not None \
+                        and not old.get(signature):
+                    continue
+                count = (mask & with_letter).bit_count()
+                if count:
+                    counts[signature] = count
+                    remaining -= count
+        return table
+
+    @staticmethod
+    def _hidden_positions(pattern: str) -> int:
+        """Metoda vrací bitovou masku skrytých pozic slova."""
+        hidden = 0
+        for position, letter in enumerate(pattern):
+            if letter == Letter.WILDCARD:
+                hidden |= 1 << position
+        return hidden
+
+    def _add_words(self, table: dict[str, dict[int, int]],
+                   words: Iterable[str], increment: int):
+        """Metoda přičte k tabulce příspěvky dodaných slov vynásobené
+        `increment` (tedy při záporném přírustku je odečte)."""
+        guessed = self._guessed
+        for word in words:
+            for letter, signature in word_signatures(word).items():
+                if letter not in guessed:
+                    counts = table.setdefault(letter, {})
+                    counts[signature] = counts.get(signature, 0) + increment
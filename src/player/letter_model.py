@@ -0,0 +1,247 @@
+"""Tento modul obsahuje jazykový model písmen, podle kterého mohou hráči
+odhadovat písmena skrytá v tajence.
+
+Model (`LetterModel`) uchovává četnosti písmen abecedy (`ALPHABET`)
+vypočtené z korpusu textů:
+
+- unigramy: četnost každého písmene,
+- poziční četnosti: četnost písmene na dané pozici ve slově (pozice od
+  `POSITIONS - 1` dál jsou sloučeny do poslední),
+- bigramy: četnost dvojic sousedních symbolů, kde symbolem je písmeno nebo
+  hranice slova (`BOUNDARY`), takže bigramy zachycují i písmena na začátku
+  a na konci slov.
+
+Text se normalizuje stejně jako tajenka: diakritika se odstraní funkcí
+`fold_accents` (se shodným výsledkem jako `remove_accents`), písmena se
+převedou na velká a cokoliv mimo abecedu slova odděluje.
+
+Model se buduje proudově (`build_model`): soubory se čtou po blocích
+o pevné velikosti, z každého bloku se spočtou četnosti (volitelně ve více
+procesech) a přičtou se k souhrnu, takže paměť nezávisí na velikosti
+korpusu. Uložený model je malý binární soubor (hlavička `HEADER` a četnosti
+jako celá čísla o 8 bajtech), který se načte během milisekund.
+
+Model se z textových souborů vybuduje příkazem
+`python -m src.player.letter_model <výstup> <vstup>...`."""
+
+import argparse
+import re
+import struct
+import sys
+from array import array
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Iterator
+
+from src.game.phrase import fold_accents
+
+# Písmena, jejichž četnosti model uchovává
+ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+# Symbol hranice slova v bigramech
+BOUNDARY = " "
+
+# Symboly bigramů: hranice slova (index 0) a písmena abecedy
+SYMBOLS = BOUNDARY + ALPHABET
+
+# Počet rozlišovaných pozic písmene ve slově
+POSITIONS = 8
+
+# Počty četností jednotlivých částí modelu a jejich začátky v poli četností
+_UNIGRAMS = 0
+_POSITIONAL = _UNIGRAMS + len(ALPHABET)
+_BIGRAMS = _POSITIONAL + POSITIONS * len(ALPHABET)
+SIZE = _BIGRAMS + len(SYMBOLS) ** 2
+
+# Hlavička souboru modelu: magické číslo, verze, počet pozic a počet
+# četností, které za hlavičkou následují
+HEADER = struct.Struct("<4sHHI")
+
+# Magické číslo, kterým začíná každý soubor modelu
+MAGIC = b"WOFM"
+
+# Verze formátu souboru
+VERSION = 1
+
+# Výchozí velikost bloku textu (ve znacích), ze kterého se počítají četnosti
+DEFAULT_CHUNK_SIZE = 1 << 22
+
+# Slovo normalizovaného textu
+_WORD = re.compile(f"[{ALPHABET}]+")
+
+# Index symbolu podle znaku (písmena mají indexy od 1)
+_SYMBOL_INDEX = {symbol: index for index, symbol in enumerate(SYMBOLS)}
+
+
+class LetterModel:
+    """Instance této třídy reprezentují četnosti písmen, jejich pozic ve
+    slovech a bigramů vypočtené z korpusu (viz `build_model`)."""
+
+    def __init__(self, counts: Iterable[int] = ()):
+        """Initor, který přijímá četnosti v pořadí unigramy, poziční
+        četnosti a bigramy (viz `SIZE`); bez nich vytvoří prázdný model."""
+        self._counts = array("Q", counts) or array("Q", bytes(8 * SIZE))
+        if len(self._counts) != SIZE:
+            raise ValueError(f"Model musí mít {SIZE} četností: "
+                             f"{len(self._counts)}")
+
+    @classmethod
+    def from_file(cls, path: str) -> "LetterModel":
+        """Metoda načte model ze souboru (viz `save`)."""
+        with open(path, "rb") as file:
+            data = file.read()
+        if len(data) < HEADER.size:
+            raise ValueError(f"Soubor '{path}' není model písmen")
+        magic, version, positions, size = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"Soubor '{path}' není model písmen verze "
+                             f"{VERSION}")
+        if positions != POSITIONS or size != SIZE \
+                or len(data) != HEADER.size + 8 * size:
+            raise ValueError(f"Soubor '{path}' má nepodporovaný rozměr")
+
+        counts = array("Q")
+        counts.frombytes(data[HEADER.size:])
+        if sys.byteorder != "little":
+            counts.byteswap()
+        return cls(counts)
+
+    def save(self, path: str):
+        """Metoda uloží model do souboru."""
+        counts = array("Q", self._counts)
+        if sys.byteorder != "little":
+            counts.byteswap()
+        with open(path, "wb") as file:
+            file.write(HEADER.pack(MAGIC, VERSION, POSITIONS, SIZE))
+            file.write(counts.tobytes())
+
+    @property
+    def counts(self) -> array:
+        """Všechny četnosti modelu (viz `SIZE`)."""
+        return self._counts
+
+    @property
+    def total(self) -> int:
+        """Celkový počet písmen, ze kterých byl model vybudován."""
+        return sum(self._counts[_UNIGRAMS:_POSITIONAL])
+
+    def unigram(self, letter: str) -> int:
+        """Metoda vrací četnost dodaného písmene."""
+        return self._counts[_UNIGRAMS + ALPHABET.index(letter)]
+
+    def positional(self, position: int, letter: str) -> int:
+        """Metoda vrací četnost dodaného písmene na dané pozici ve slově
+        (číslováno od 0)."""
+        position = min(position, POSITIONS - 1)
+        return self._counts[_POSITIONAL + position * len(ALPHABET)
+                            + ALPHABET.index(letter)]
+
+    def bigram(self, previous: str, following: str) -> int:
+        """Metoda vrací četnost dvojice sousedních symbolů (písmen nebo
+        hranice slova `BOUNDARY`)."""
+        return self._counts[_BIGRAMS + SYMBOLS.index(previous) * len(SYMBOLS)
+                            + SYMBOLS.index(following)]
+
+    def ranking(self) -> str:
+        """Metoda vrací písmena abecedy seřazená sestupně podle četnosti
+        (při shodě podle abecedy), např. pro `EntropyDrivenPlayer`."""
+        return "".join(sorted(ALPHABET, key=lambda letter: (
+            -self.unigram(letter), letter)))
+
+    def update(self, counts: Iterable[int]):
+        """Metoda přičte k modelu dodané četnosti (např. z dalšího bloku
+        textu, viz `count_text`)."""
+        model = self._counts
+        for index, count in enumerate(counts):
+            model[index] += count
+
+
+def count_text(text: str) -> array:
+    """Funkce vrací četnosti (viz `LetterModel`) dodaného textu. Každé
+    různé slovo se zpracuje jen jednou a jeho příspěvek se vynásobí počtem
+    jeho výskytů."""
+    counts = array("Q", bytes(8 * SIZE))
+    symbols = len(SYMBOLS)
+    letters = len(ALPHABET)
+    last = (POSITIONS - 1) * letters
+    words = Counter(_WORD.findall(fold_accents(text).upper()))
+    for word, occurrences in words.items():
+        previous = _BIGRAMS
+        position = _POSITIONAL - 1
+        for letter in word:
+            index = _SYMBOL_INDEX[letter]
+            counts[_UNIGRAMS - 1 + index] += occurrences
+            counts[position + index] += occurrences
+            counts[previous + index] += occurrences
+            previous = _BIGRAMS + index * symbols
+            if position < _POSITIONAL - 1 + last:
+                position += letters
+        counts[previous] += occurrences
+    return counts
+
+
+def read_chunks(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE
+                ) -> Iterator[str]:
+    """Funkce postupně čte textový soubor (UTF-8, neplatné sekvence se
+    nahradí) po blocích o přibližně `chunk_size` znacích. Blok končí na
+    posledním bílém znaku, aby se slova mezi bloky nedělila; jen blok zcela
+    bez bílých znaků se rozdělí na pevné délce."""
+    if chunk_size < 1:
+        raise ValueError(f"Velikost bloku musí být kladná: {chunk_size}")
+
+    with open(path, encoding="utf-8", errors="replace") as file:
+        rest = ""
+        while block := file.read(chunk_size):
+            block = rest + block
+            cut = max(block.rfind("\n"), block.rfind(" ")) + 1 or len(block)
+            rest = block[cut:]
+            yield block[:cut]
+        if rest:
+            yield rest
+
+
+def build_model(paths: Iterable[str], chunk_size: int = DEFAULT_CHUNK_SIZE,
+                workers: int = 1) -> LetterModel:
+    """Funkce vybuduje model z dodaných textových souborů. Soubory se čtou
+    po blocích (viz `read_chunks`); je-li `workers` větší než 1, četnosti
+    bloků se počítají v daném počtu procesů. Najednou se zpracovává nejvýše
+    `2 * workers` bloků, paměť tedy nezávisí na velikosti souborů."""
+    if workers < 1:
+        raise ValueError(f"Počet procesů musí být kladný: {workers}")
+
+    model = LetterModel()
+    chunks = (chunk for path in paths
+              for chunk in read_chunks(path, chunk_size))
+    if workers == 1:
+        for chunk in chunks:
+            model.update(count_text(chunk))
+        return model
+
+    with ProcessPoolExecutor(workers) as executor:
+        pending = []
+        for chunk in chunks:
+            pending.append(executor.submit(count_text, chunk))
+            if len(pending) >= 2 * workers:
+                model.update(pending.pop(0).result())
+        for future in pending:
+            model.update(future.result())
+    return model
+
+
+def main():
+    """Vybudování modelu z textových souborů z příkazové řádky."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("target", help="výstupní soubor modelu")
+    parser.add_argument("sources", nargs="+", help="textové soubory korpusu")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args()
+
+    model = build_model(args.sources, args.chunk_size, args.workers)
+    model.save(args.target)
+    print(f"Model z {model.total} písmen uložen do '{args.target}', "
+          f"pořadí písmen {model.ranking()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+"""Tento modul obsahuje definici hráče, který volí písmeno podle výsledků
+náhodných pokračování hry (Monte Carlo).
+
+Hráč si stejně jako `DictionaryPlayer` udržuje kandidátní slova ze slovníku.
+V každém tahu vybere několik nejnadějnějších písmen a pak, dokud mu nevyprší
+časový limit tahu, opakovaně:
+
+1. doplní skrytá písmena tajenky náhodně zvolenými kandidáty (slovům bez
+   kandidátů náhodnými nezkoušenými písmeny podle četnosti),
+2. pro každé zvažované písmeno dohraje hru z aktuálního stavu do konce (viz
+   `src.game.rollout`) a zaznamená svůj náskok před nejlepším soupeřem.
+
+Hraje písmeno s největším průměrným náskokem. Aby znal skóre a pořadí hráčů,
+lze jej ke hře připojit metodou `attach`; jinak počítá s hrou jediného hráče
+s nulovým skóre. Rollouty lze rozložit do více procesů (`workers`)."""
+
+from concurrent.futures import ProcessPoolExecutor
+from itertools import accumulate
+from random import Random
+from time import perf_counter
+from typing import Iterable, Optional
+
+from src.game.game import AbstractGame
+from src.game.phrase import Letter, fold_accents
+from src.game.rollout import RolloutEngine, RolloutState
+from src.game.wheel import Wheel
+from src.player.dictionary_player import DictionaryPlayer
+from src.player.word_index import WordIndex
+
+
+class MonteCarloPlayer(DictionaryPlayer):
+    """Hráč, který hádá písmeno s největším průměrným náskokem v náhodných
+    pokračováních hry odehraných v rámci časového limitu tahu."""
+
+    # Počet vzorků tajenky mezi dvěma kontrolami časového limitu
+    CHECK_EVERY = 8
+
+    def __init__(self, player_name: str, index: WordIndex, wheel: Wheel,
+                 budget: float = 0.05, options: int = 6, workers: int = 1,
+                 seed: Optional[int] = None,
+                 relative_occurrence: str = "OENATVSILKRDPMUZJYCBHFGXWQ"):
+        """Initor, který přijímá jméno hráče, index slovníku, kolo štěstí
+        hry, časový limit jednoho tahu v sekundách, počet zvažovaných
+        písmen, počet procesů pro rollouty, semínko náhody a pořadí písmen
+        podle četnosti (podle něj hrají všichni hráči v rolloutech).
+
+        Rollouty točí vlastní kopií kola, aby neovlivnily náhodu hry."""
+        if budget <= 0:
+            raise ValueError(f"Časový limit tahu musí být kladný: {budget}")
+        if options < 1 or workers < 1:
+            raise ValueError(f"Počet písmen i procesů musí být kladný: "
+                             f"{options}, {workers}")
+
+        super().__init__(player_name, index, relative_occurrence)
+        self._wedges = wheel.wedges
+        self._budget = budget
+        self._options = options
+        self._workers = workers
+        self._random = Random(seed)
+        self._engine = RolloutEngine(
+            Wheel(wheel.wedges, self._random.getrandbits(64)),
+            relative_occurrence)
+        self._game: Optional[AbstractGame] = None
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._rollouts = 0
+
+    @property
+    def budget(self) -> float:
+        """Časový limit jednoho tahu v sekundách."""
+        return self._budget
+
+    @property
+    def rollouts(self) -> int:
+        """Celkový počet dosud odehraných rolloutů."""
+        return self._rollouts
+
+    def attach(self, game: AbstractGame):
+        """Metoda připojí hráče ke hře, ze které bude číst skóre hráčů a
+        hráče na tahu."""
+        self._game = game
+
+    def guess_letter(self, already_guessed: Iterable[str],
+                     phrase: str) -> Optional[str]:
+        """Metoda vrací zvažované písmeno s největším průměrným náskokem
+        v rolloutech."""
+        guessed = {fold_accents(letter).upper() for letter in already_guessed}
+        self.update(guessed, phrase)
+
+        options = self._choose_options()
+        if len(options) <= 1:
+            return options[0] if options else None
+
+        if self._game is not None:
+            scores = list(self._game.scores)
+            seat = self._game.player_slot(self)
+        else:
+            scores, seat = [0], 0
+
+        if self._workers == 1:
+            totals, rollouts = self.simulate(options, scores, seat,
+                                             self._budget)
+        else:
+            totals, rollouts = self._simulate_parallel(options, scores, seat)
+
+        self._rollouts += rollouts
+        best = max(range(len(options)), key=totals.__getitem__)
+        return options[best]
+
+    def simulate(self, options: list[str], scores: list[int], seat: int,
+                 budget: float) -> tuple[list[float], int]:
+        """Metoda odehrává rollouty pro zvažovaná písmena, dokud neuplyne
+        dodaný čas, a vrací dvojici (součty náskoků pro jednotlivá písmena,
+        počet odehraných rolloutů). Všechna písmena se hrají nad týmiž
+        vzorky tajenky, aby byla jejich srovnání co nejpřesnější."""
+        deadline = perf_counter() + budget
+        sample = self._sampler()
+        engine = self._engine
+        phrase = self._phrase
+        guessed = self._guessed
+        totals = [0.0] * len(options)
+        samples = 0
+
+        while True:
+            for _ in range(self.CHECK_EVERY):
+                base = RolloutState.from_phrase(
+                    sample(), phrase, guessed, scores, seat)
+                for position, letter in enumerate(options):
+                    state = engine.play_out(base.clone(), letter)
+                    totals[position] += self._margin(state.scores, seat)
+                samples += 1
+            if perf_counter() >= deadline:
+                break
+        return totals, samples * len(options)
+
+    def close(self):
+        """Metoda ukončí procesy pro rollouty, pokud nějaké běží."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _choose_options(self) -> list[str]:
+        """Metoda vrací zvažovaná písmena: nejlépe ohodnocená podle
+        kandidátů, doplněná nezkoušenými písmeny podle četnosti."""
+        scores = self.letter_scores()
+        options = sorted(scores, key=scores.get, reverse=True)
+        options = options[:self._options]
+        for letter in self._relative_occurrence:
+            if len(options) >= self._options:
+                break
+            if letter not in self._guessed and letter not in options:
+                options.append(letter)
+        return options
+
+    def _sampler(self):
+        """Metoda vrací funkci, která při každém volání vrací jednu náhodnou
+        úplnou podobu tajenky (seznam znaků) odpovídající aktuálnímu stavu.
+        """
+        random = self._random
+        wildcard = Letter.WILDCARD
+        letters = [letter for letter in self._relative_occurrence
+                   if letter not in self._guessed] or ["?"]
+        weights = list(accumulate(range(len(letters), 0, -1)))
+
+        slots = []
+        for slot in self._slots:
+            if wildcard in slot.pattern:
+                words = (self._index.candidates(slot.length, slot.candidates)
+                         if slot.candidates else None)
+                slots.append((slot.start, slot.pattern, words))
+
+        template = list(self._phrase)
+
+        def sample() -> list[str]:
+            phrase = template.copy()
+            for start, pattern, words in slots:
+                if words is not None:
+                    phrase[start:start + len(pattern)] = random.choice(words)
+                    continue
+                for position, letter in enumerate(pattern):
+                    if letter == wildcard:
+                        phrase[start + position] = random.choices(
+                            letters, cum_weights=weights)[0]
+            return phrase
+        return sample
+
+    @staticmethod
+    def _margin(scores: list[int], seat: int) -> int:
+        """Metoda vrací náskok hráče před nejlepším soupeřem (ve hře
+        jediného hráče jeho skóre)."""
+        if len(scores) == 1:
+            return scores[0]
+        return scores[seat] - max(score for other, score in enumerate(scores)
+                                  if other != seat)
+
+    def _simulate_parallel(self, options: list[str], scores: list[int],
+                           seat: int) -> tuple[list[float], int]:
+        """Metoda rozloží rollouty do procesů a sečte jejich výsledky."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                self._workers, initializer=_init_worker,
+                initargs=(self.player_name, self._index, self._wedges,
+                          self._relative_occurrence))
+
+        futures = [self._executor.submit(
+            _simulate_in_worker, self._random.getrandbits(64), self._guessed,
+            self._phrase, options, scores, seat, self._budget)
+            for _ in range(self._workers)]
+
+        totals = [0.0] * len(options)
+        rollouts = 0
+        for future in futures:
+            partial, count = future.result()
+            totals = [total + value for total, value in zip(totals, partial)]
+            rollouts += count
+        return totals, rollouts
+
+
+# Hráč, který v pracovním procesu odehrává rollouty
+_worker_player: Optional[MonteCarloPlayer] = None
+
+
+def _init_worker(player_name: str, index: WordIndex, wedges: tuple,
+                 relative_occurrence: str):
+    """Funkce, která připraví pracovní proces na odehrávání rolloutů."""
+    global _worker_player
+    _worker_player = MonteCarloPlayer(
+        player_name, index, Wheel(wedges),
+        relative_occurrence=relative_occurrence)
+
+
+def _simulate_in_worker(seed: int, guessed: set[str], phrase: str,
+                        options: list[str], scores: list[int], seat: int,
+                        budget: float) -> tuple[list[float], int]:
+    """Funkce odehraje v pracovním procesu rollouty pro jeden tah."""
+    player = _worker_player
+    player._random.seed(seed)
+    player._engine.seed(seed)
+    player.update(guessed, phrase)
+    return player.simulate(options, scores, seat, budget)
@@ -0,0 +1,127 @@
+"""Tento modul obsahuje definici hráče, který hádá podle jazykového modelu
+písmen (viz `src.player.letter_model`).
+
+Pro každou skrytou pozici tajenky hráč odhadne pravděpodobnost každého
+dosud nezkoušeného písmene podle jejích odkrytých sousedů: je-li znám levý
+soused (písmeno nebo hranice slova), použije pravděpodobnost bigramu
+`P(písmeno | levý soused)`, jinak poziční četnost písmene ve slově; je-li
+znám pravý soused, násobí ji pravděpodobností `P(pravý soused | písmeno)`.
+Odhady pozice normalizuje přes nezkoušená písmena (zkoušená písmena na
+skryté pozici být nemohou) a hádá písmeno s největším očekávaným počtem
+výskytů, tedy s největším součtem přes skryté pozice.
+
+Všechny pravděpodobnosti jsou vyhlazené (přičtením jedné ke každé
+četnosti), takže hráč hraje rozumně i s modelem z malého korpusu."""
+
+from typing import Iterable, Optional
+
+from src.game.letters import LetterRanking, guessed_mask, letter_bit
+from src.game.phrase import Letter
+from src.player.abstract_player import AbstractPlayer
+from src.player.letter_model import ALPHABET, POSITIONS, SYMBOLS, LetterModel
+
+
+class NGramPlayer(AbstractPlayer):
+    """Hráč, který hádá písmeno s největším očekávaným počtem výskytů
+    podle bigramů a pozičních četností jazykového modelu."""
+
+    def __init__(self, player_name: str, model: LetterModel):
+        """Initor, který přijímá jméno hráče a jazykový model písmen."""
+        super().__init__(player_name)
+        self._model = model
+        self._ranking = LetterRanking(model.ranking())
+
+        # Vyhlazené pravděpodobnosti: P(písmeno | levý symbol), P(pravý
+        # symbol | písmeno) a P(písmeno | pozice ve slově)
+        self._forward = [
+            _normalized([model.bigram(previous, letter)
+                         for letter in ALPHABET],
+                        sum(model.bigram(previous, symbol)
+                            for symbol in SYMBOLS), len(SYMBOLS))
+            for previous in SYMBOLS]
+        self._backward = [
+            _normalized([model.bigram(letter, following)
+                         for following in SYMBOLS],
+                        sum(model.bigram(letter, symbol)
+                            for symbol in SYMBOLS), len(SYMBOLS))
+            for letter in ALPHABET]
+        self._prior = [
+            _normalized(counts, sum(counts), len(ALPHABET))
+            for counts in ([model.positional(position, letter)
+                            for letter in ALPHABET]
+                           for position in range(POSITIONS))]
+
+    @property
+    def model(self) -> LetterModel:
+        """Jazykový model, podle kterého hráč hádá."""
+        return self._model
+
+    def guess_letter(self, already_guessed: Iterable[str],
+                     phrase: str) -> Optional[str]:
+        """Metoda vrací nezkoušené písmeno s největším očekávaným počtem
+        výskytů na skrytých pozicích tajenky. Nemá-li tajenka skryté
+        pozice, hádá podle celkové četnosti písmen v modelu."""
+        mask = guessed_mask(already_guessed)
+        candidates = [index for index, letter in enumerate(ALPHABET)
+                      if not mask & letter_bit(letter)]
+        expected = self.expected_occurrences(phrase, candidates)
+        if not expected:
+            return self._ranking.first_unguessed(mask)
+        return ALPHABET[max(expected, key=expected.get)]
+
+    def expected_occurrences(self, phrase: str,
+                             candidates: list[int]) -> dict[int, float]:
+        """Metoda vrací pro dodaná písmena (indexy do `ALPHABET`) jejich
+        očekávaný počet výskytů na skrytých pozicích tajenky."""
+        if not candidates:
+            return {}
+        symbols = [self._symbol(character) for character in phrase]
+        forward = self._forward
+        backward = self._backward
+        prior = self._prior
+        expected = dict.fromkeys(candidates, 0.0)
+        distributions: dict[tuple, list[float]] = {}
+
+        position = 0
+        for index, symbol in enumerate(symbols):
+            if symbol is not None and not symbol:
+                position = 0
+                continue
+            position += 1
+            if symbol is not None:
+                continue
+
+            left = symbols[index - 1] if index else 0
+            right = symbols[index + 1] if index + 1 < len(symbols) else 0
+            context = (left, right, min(position - 1, POSITIONS - 1))
+            distribution = distributions.get(context)
+            if distribution is None:
+                weights = (forward[left] if left is not None
+                           else prior[context[2]])
+                scores = [weights[letter] for letter in candidates]
+                if right is not None:
+                    scores = [score * backward[letter][right]
+                              for score, letter in zip(scores, candidates)]
+                total = sum(scores)
+                distribution = [score / total for score in scores]
+                distributions[context] = distribution
+
+            for letter, probability in zip(candidates, distribution):
+                expected[letter] += probability
+        return expected if distributions else {}
+
+    @staticmethod
+    def _symbol(character: str) -> Optional[int]:
+        """Metoda vrací index symbolu (viz `SYMBOLS`) odkrytého znaku
+        tajenky: písmeno abecedy, nebo 0 (hranice slova) pro ostatní
+        znaky. Pro skrytou pozici vrací `None`."""
+        if character == Letter.WILDCARD:
+            return None
+        key = Letter.process(character)
+        return max(SYMBOLS.find(key), 0) if len(key) == 1 else 0
+
+
+def _normalized(counts: list[int], total: int, outcomes: int) -> list[float]:
+    """Funkce vrací vyhlazené pravděpodobnosti z dodaných četností, jejich
+    celkového součtu a počtu možných výsledků (přičtením jedné)."""
+    return [(count + 1) / (total + outcomes) for count in counts]
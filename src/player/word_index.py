@@ -0,0 +1,194 @@
+"""Tento modul obsahuje index slovníku, pomocí kterého mohou hráči hledat
+slova odpovídající částečně odkrytým slovům tajenky (např. `P_SL__N_`).
+
+Slova jsou uložena bez diakritiky a velkými písmeny (stejně jako s nimi
+porovnává tajenka) a rozdělena podle své délky. Pro každou délku slova
+index uchovává bitové masky (celá čísla, kde bit `i` odpovídá `i`-tému slovu
+dané délky):
+
+- pro každou dvojici (pozice, písmeno) masku slov, která mají na dané
+  pozici dané písmeno,
+- pro každé písmeno masku slov, která dané písmeno obsahují,
+- pro každé písmeno a každou množinu pozic (tzv. signaturu, bitovou masku
+  pozic) masku slov, která mají dané písmeno právě na těchto pozicích;
+  tyto masky se budují až při prvním dotazu na danou délku slova.
+
+Množina kandidátů je pak rovněž bitovou maskou, kterou lze průběžně zužovat
+několika bitovými operacemi bez nutnosti procházet slovník znovu."""
+
+from typing import Iterable
+
+from src.game.phrase import fold_accents
+
+# Písmena, která se v indexovaných slovech mohou vyskytovat
+ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+class WordIndex:
+    """Instance této třídy reprezentují index slovníku podle délky slov a
+    písmen na jednotlivých pozicích.
+
+    Do indexu jsou zařazena pouze slova, která se po odstranění diakritiky
+    skládají výhradně z písmen anglické abecedy (viz `ALPHABET`); duplicitní
+    tvary (např. 'ŽENA' a 'ZENA') jsou sloučeny."""
+
+    def __init__(self, words: Iterable[str]):
+        """Initor, který přijímá slova slovníku, ze kterých index vybuduje.
+        """
+        buckets: dict[int, dict[str, None]] = {}
+        for word in words:
+            word = fold_accents(word.strip()).upper()
+            if word and word.isalpha() and word.isascii():
+                buckets.setdefault(len(word), {})[word] = None
+
+        self._words: dict[int, tuple[str]] = {}
+        self._position_masks: dict[int, dict[tuple[int, str], int]] = {}
+        self._letter_masks: dict[int, dict[str, int]] = {}
+        self._signature_masks: dict[int, dict[str, dict[int, int]]] = {}
+        self._signature_counts: dict[int, dict[str, dict[int, int]]] = {}
+        self._letter_counts: dict[int, dict[str, int]] = {}
+
+        for length, bucket in buckets.items():
+            words_of_length = tuple(bucket)
+            self._words[length] = words_of_length
+            self._position_masks[length] = _build_masks(
+                ((position, letter), index)
+                for index, word in enumerate(words_of_length)
+                for position, letter in enumerate(word))
+            self._letter_masks[length] = _build_masks(
+                (letter, index)
+                for index, word in enumerate(words_of_length)
+                for letter in set(word))
+
+    @classmethod
+    def from_file(cls, path: str, encoding: str = "utf-8") -> "WordIndex":
+        """Metoda vybuduje index ze souboru, který obsahuje jedno slovo na
+        každém řádku."""
+        with open(path, encoding=encoding) as file:
+            return cls(file)
+
+    @property
+    def lengths(self) -> tuple[int]:
+        """Délky slov, která index obsahuje."""
+        return tuple(sorted(self._words))
+
+    def __len__(self) -> int:
+        """Celkový počet slov v indexu."""
+        return sum(len(words) for words in self._words.values())
+
+    def words(self, length: int) -> tuple[str]:
+        """Všechna slova dané délky."""
+        return self._words.get(length, ())
+
+    def all_candidates(self, length: int) -> int:
+        """Maska všech slov dané délky."""
+        return (1 << len(self.words(length))) - 1
+
+    def position_mask(self, length: int, position: int, letter: str) -> int:
+        """Maska slov dané délky, která mají na dané pozici dané písmeno."""
+        masks = self._position_masks.get(length)
+        return masks.get((position, letter), 0) if masks else 0
+
+    def letter_mask(self, length: int, letter: str) -> int:
+        """Maska slov dané délky, která dané písmeno obsahují."""
+        masks = self._letter_masks.get(length)
+        return masks.get(letter, 0) if masks else 0
+
+    def letter_counts(self, length: int) -> dict[str, int]:
+        """Metoda vrací pro slova dané délky a pro každé písmeno počet slov,
+        která dané písmeno obsahují. Výsledek je uložen a nesmí být
+        upravován."""
+        counts = self._letter_counts.get(length)
+        if counts is None:
+            masks = self._letter_masks.get(length, {})
+            counts = self._letter_counts[length] = {
+                letter: masks[letter].bit_count()
+                for letter in ALPHABET if letter in masks}
+        return counts
+
+    def signature_masks(self, length: int) -> dict[str, dict[int, int]]:
+        """Metoda vrací pro slova dané délky a pro každé písmeno slovník,
+        který signatuře (bitové masce pozic, na kterých se písmeno ve slově
+        vyskytuje) přiřazuje masku slov s právě touto signaturou. Signatury
+        jsou seřazeny sestupně podle počtu slov."""
+        masks = self._signature_masks.get(length)
+        if masks is None:
+            flat = _build_masks(
+                (signature, index)
+                for index, word in enumerate(self.words(length))
+                for signature in word_signatures(word).items())
+            masks = {}
+            for (letter, signature), mask in sorted(
+                    flat.items(), key=lambda item: -item[1].bit_count()):
+                masks.setdefault(letter, {})[signature] = mask
+            self._signature_masks[length] = masks
+        return masks
+
+    def signature_counts(self, length: int) -> dict[str, dict[int, int]]:
+        """Metoda vrací pro slova dané délky a pro každé písmeno slovník,
+        který signatuře přiřazuje počet slov s právě touto signaturou.
+        Výsledek je uložen a nesmí být upravován."""
+        counts = self._signature_counts.get(length)
+        if counts is None:
+            counts = self._signature_counts[length] = {
+                letter: {signature: mask.bit_count()
+                         for signature, mask in masks.items()}
+                for letter, masks in self.signature_masks(length).items()}
+        return counts
+
+    def candidates(self, length: int, mask: int) -> list[str]:
+        """Metoda převede masku slov dané délky na seznam slov."""
+        # Nastavené bity se hledají v obráceném binárním zápisu masky (znak
+        # `i` odpovídá bitu `i`), bez opakovaných operací s velkým číslem
+        words = self.words(length)
+        bits = bin(mask)[:1:-1]
+        result = []
+        position = bits.find("1")
+        while position >= 0:
+            result.append(words[position])
+            position = bits.find("1", position + 1)
+        return result
+
+    def match(self, pattern: str, excluded: Iterable[str] = (),
+              wildcard: str = "_") -> int:
+        """Metoda vrací masku slov, která odpovídají dodanému vzoru (např.
+        `P_SL__N_`), přičemž na skrytých pozicích (`wildcard`) nesmí být
+        žádné z vyloučených písmen `excluded`."""
+        length = len(pattern)
+        mask = self.all_candidates(length)
+        hidden = [position for position, letter in enumerate(pattern)
+                  if letter == wildcard]
+
+        for position, letter in enumerate(pattern):
+            if letter != wildcard:
+                mask &= self.position_mask(length, position, letter)
+        for letter in set(excluded):
+            for position in hidden:
+                mask &= ~self.position_mask(length, position, letter)
+        return mask
+
+
+def word_signatures(word: str) -> dict[str, int]:
+    """Funkce vrací pro každé písmeno slova bitovou masku pozic, na kterých
+    se ve slově vyskytuje."""
+    signatures: dict[str, int] = {}
+    for position, letter in enumerate(word):
+        signatures[letter] = signatures.get(letter, 0) | 1 << position
+    return signatures
+
+
+def _build_masks(pairs: Iterable[tuple[object, int]]) -> dict[object, int]:
+    """Funkce sestaví bitové masky z dvojic (klíč, index slova). Bity se
+    nastavují v poli bajtů, které je nakonec převedeno na celé číslo, čímž
+    se předejde opakovanému vytváření velkých čísel."""
+    arrays: dict[object, bytearray] = {}
+    for key, index in pairs:
+        array = arrays.get(key)
+        if array is None:
+            array = arrays[key] = bytearray()
+        byte = index >> 3
+        if byte >= len(array):
+            array.extend(bytes(byte + 1 - len(array)))
+        array[byte] |= 1 << (index & 7)
+    return {key: int.from_bytes(array, "little")
+            for key, array in arrays.items()}
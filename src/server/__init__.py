@@ -0,0 +1,5 @@
+"""Balíček obsahuje lokální herní server, který hostí mnoho herních místností
+najednou, a zátěžového klienta, který server testuje.
+
+Server i klient komunikují přes TCP zprávami ve formátu JSON oddělenými
+novým řádkem (viz modul `src.server.protocol`)."""
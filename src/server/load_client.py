@@ -0,0 +1,132 @@
+"""Tento modul obsahuje zátěžového klienta herního serveru.
+
+Klient otevře zadaný počet spojení (místnosti × místa pro klienty v jedné
+místnosti), v každém odehraje zadaný počet her a změří latenci tahu, tedy
+dobu od odeslání písmene po příchod odpovědi serveru (zprávy `reveal`, nebo
+opětovné výzvy `guess`). Nakonec vypíše medián a 99. percentil latence.
+
+Klienti hádají podle pořadí písmen `EntropyDrivenPlayerCZ` a zakrytou tajenku
+si skládají ze zpráv serveru (viz `src.server.protocol.apply_delta`).
+
+Spuštění proti běžícímu serveru:
+`python -m src.server.load_client --port 8765 --rooms 100`, nebo s vlastním
+serverem spuštěným v témže procesu: `python -m src.server.load_client
+--serve --rooms 100`."""
+
+import argparse
+import asyncio
+from time import perf_counter
+from typing import Optional
+
+from src.player.entropy_driven_player import EntropyDrivenPlayerCZ
+from src.server.protocol import apply_delta, read_message, send_message
+from src.server.server import GameServer
+
+
+async def play_client(host: str, port: int, name: str, games: int,
+                      latencies: list[float]) -> int:
+    """Korutina odehraje za jednoho klienta dodaný počet her, naměřené
+    latence tahů přidává do seznamu `latencies` a vrací počet dohraných
+    her."""
+    reader, writer = await asyncio.open_connection(host, port)
+    strategy = EntropyDrivenPlayerCZ()
+    phrase = ""
+    sent: Optional[float] = None
+    played = 0
+
+    await send_message(writer, {"type": "join", "name": name})
+    while played < games:
+        message = await read_message(reader)
+        if message is None:
+            break
+        kind = message["type"]
+
+        if sent is not None and kind in ("reveal", "guess"):
+            latencies.append(perf_counter() - sent)
+            sent = None
+
+        if kind == "start":
+            phrase = message["phrase"]
+        elif kind == "reveal":
+            phrase = apply_delta(phrase, message)
+        elif kind == "guess":
+            letter = strategy.guess_letter(message["guessed"], phrase)
+            sent = perf_counter()
+            await send_message(writer, {
+                "type": "letter", "prompt": message["prompt"],
+                "letter": letter})
+        elif kind == "end":
+            played += 1
+            if played < games:
+                await send_message(writer, {"type": "join", "name": name})
+
+    writer.close()
+    await writer.wait_closed()
+    return played
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    """Funkce vrací dodaný percentil (jako podíl 0-1) seřazených hodnot."""
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+
+async def run_load(host: str, port: int, rooms: int, remote_seats: int,
+                   games: int, serve: bool) -> dict:
+    """Korutina spustí zátěž o dodaném počtu souběžných místností a vrací
+    souhrn měření. Je-li `serve` True, spustí v témže procesu i server
+    (na volném portu, je-li `port` 0)."""
+    listener = None
+    if serve:
+        listener = await GameServer(remote_seats=remote_seats).start(
+            host, port)
+        port = listener.sockets[0].getsockname()[1]
+
+    latencies: list[float] = []
+    start = perf_counter()
+    played = await asyncio.gather(*(
+        play_client(host, port, f"KLIENT{number}", games, latencies)
+        for number in range(rooms * remote_seats)))
+    duration = perf_counter() - start
+
+    if listener is not None:
+        listener.close()
+        await listener.wait_closed()
+
+    latencies.sort()
+    return {
+        "rooms": rooms,
+        "games": sum(played) // remote_seats,
+        "turns": len(latencies),
+        "duration_s": duration,
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+    }
+
+
+def main():
+    """Spuštění zátěžového klienta z příkazové řádky."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--rooms", type=int, default=100)
+    parser.add_argument("--remote-seats", type=int, default=1,
+                        help="musí odpovídat nastavení serveru")
+    parser.add_argument("--games", type=int, default=1,
+                        help="počet her odehraných každým klientem")
+    parser.add_argument("--serve", action="store_true",
+                        help="spustit server v témže procesu")
+    args = parser.parse_args()
+
+    port = 0 if args.serve and args.port == 8765 else args.port
+    summary = asyncio.run(run_load(args.host, port, args.rooms,
+                                   args.remote_seats, args.games, args.serve))
+    print(f"místnosti: {summary['rooms']}, her: {summary['games']}, "
+          f"tahů: {summary['turns']}, doba: {summary['duration_s']:.2f} s")
+    print(f"latence tahu: p50 {summary['p50_ms']:.2f} ms, "
+          f"p99 {summary['p99_ms']:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Tento modul obsahuje definici protokolu mezi herním serverem a klienty.
+
+Každá zpráva je jeden JSON objekt na jednom řádku s povinným klíčem `type`.
+Řádky, které nejsou JSON objektem (včetně neplatného JSON či UTF-8), server
+ignoruje.
+
+Zprávy klienta:
+
+- `{"type": "join", "name": <jméno hráče>}` - žádost o místo ve hře;
+  klient, který již na místo čeká nebo hraje, ji opakovat nemůže (další
+  žádosti server ignoruje až do konce jeho hry),
+- `{"type": "letter", "prompt": <číslo výzvy>, "letter": <písmeno>}` -
+  odpověď na výzvu `guess` s týmž číslem; odpověď s jiným číslem (např.
+  opožděná odpověď na výzvu, na kterou vypršel časový limit) a písmeno,
+  které není řetězcem, server nepřijme (resp. hráč přijde o tah).
+
+Zprávy serveru:
+
+- `{"type": "start", "room": <id>, "seat": <index>, "players": [...],
+  "phrase": <zakrytá tajenka>}` - začátek hry, jediná zpráva s celou tajenkou,
+- `{"type": "spin", "seat": <index>, "wedge": <název klínu>}` - zatočení,
+- `{"type": "guess", "prompt": <číslo výzvy>, "guessed": [...]}` - výzva
+  klientovi k tipu (výzvy jsou v rámci spojení číslovány vzestupně),
+- `{"type": "reveal", "seat": <index>, "letter": <písmeno>,
+  "revealed": [[pozice, znak], ...], "scores": [...]}` - změna tajenky
+  (pouze odkryté pozice, nikoliv celá tajenka; jen pokud by se pozice
+  nekryly se znaky, obsahuje zpráva místo `revealed` celou `phrase`),
+- `{"type": "end", "phrase": <tajenka>, "scores": [...]}` - konec hry.
+"""
+
+import asyncio
+import json
+from typing import Optional
+
+
+def encode_message(message: dict) -> bytes:
+    """Funkce vrací zprávu zakódovanou jako jeden řádek protokolu."""
+    return json.dumps(message, ensure_ascii=False).encode() + b"\n"
+
+
+async def send_message(writer: asyncio.StreamWriter, message: dict):
+    """Korutina odešle jednu zprávu do dodaného proudu."""
+    writer.write(encode_message(message))
+    await writer.drain()
+
+
+async def read_message(reader: asyncio.StreamReader) -> Optional[dict]:
+    """Korutina přečte jednu zprávu z dodaného proudu; řádky, které nejsou
+    JSON objektem, přeskočí. Po uzavření spojení vrací `None`."""
+    while line := await reader.readline():
+        try:
+            message = json.loads(line)
+        except ValueError:
+            continue
+        if isinstance(message, dict):
+            return message
+    return None
+
+
+def phrase_delta(old: str, new: str) -> dict:
+    """Funkce vrací rozdíl mezi dvěma podobami tajenky jako část zprávy
+    `reveal`, tedy seznam odkrytých pozic a jejich znaků."""
+    if len(old) != len(new):
+        return {"phrase": new}
+    return {"revealed": [[position, character] for position, (before,
+            character) in enumerate(zip(old, new)) if before != character]}
+
+
+def apply_delta(phrase: str, message: dict) -> str:
+    """Funkce aplikuje na zakrytou tajenku rozdíl ze zprávy `reveal` a
+    vrací její novou podobu."""
+    if "phrase" in message:
+        return message["phrase"]
+    characters = list(phrase)
+    for position, character in message["revealed"]:
+        characters[position] = character
+    return "".join(characters)
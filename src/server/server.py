@@ -0,0 +1,305 @@
+"""Tento modul obsahuje lokální herní server.
+
+Server přijímá TCP spojení klientů (viz protokol v `src.server.protocol`).
+Každý klient, který požádá o hru, je zařazen do čekárny; jakmile se sejde
+dostatek klientů, vznikne nová herní místnost. V ní klienti obsazují místa
+vzdálených hráčů (`RemotePlayer`) a zbylá místa obsazují NPC hráči, kteří
+běží přímo v procesu serveru. Každou místnost řídí asynchronní moderátor,
+takže jediná smyčka událostí obsluhuje mnoho místností najednou.
+
+Klientům se celá zakrytá tajenka posílá pouze na začátku hry; poté už jen
+rozdíly (nově odkryté pozice).
+
+Server lze spustit příkazem `python -m src.server.server`."""
+
+import argparse
+import asyncio
+from itertools import cycle
+from typing import Callable, Iterable, Optional
+
+from src.game import Wedge, default_wheel
+from src.game.async_moderator import AsyncModerator
+from src.game.game import MultiplayerGame
+from src.game.phrase import CompactSecretPhrase
+from src.game.simulation import Simulator
+from src.game.wheel import Wheel
+from src.player.abstract_player import AbstractPlayer
+from src.player.async_player import AbstractAsyncPlayer, SyncPlayerAdapter
+from src.player.entropy_driven_player import EntropyDrivenPlayerCZ
+from src.server.protocol import (
+    encode_message, phrase_delta, read_message, send_message)
+
+# Výchozí tajenky, se kterými server hraje, nejsou-li dodány jiné
+DEFAULT_PHRASES = (
+    "Poslušně hlásím, že jsem zase tady.",
+    "Kolo štěstí se točí.",
+    "Bez práce nejsou koláče.",
+    "Kdo jinému jámu kopá, sám do ní padá.",
+)
+
+
+class _Connection:
+    """Záznam o jednom připojeném klientovi."""
+
+    def __init__(self, reader: asyncio.StreamReader,
+                 writer: asyncio.StreamWriter):
+        """Initor, který přijímá proudy spojení s klientem."""
+        self.reader = reader
+        self.writer = writer
+        self.pending: Optional[asyncio.Future] = None
+        self.prompt = 0
+        self.joined = False
+        self.closed = False
+
+    def post(self, message: dict):
+        """Metoda zařadí zprávu k odeslání, aniž by čekala na její předání
+        operačnímu systému (pro rozesílání v rámci synchronních metod)."""
+        if not self.closed:
+            self.writer.write(encode_message(message))
+
+    def resolve(self, letter: Optional[str]):
+        """Metoda předá odpověď klienta čekajícímu dotazu, pokud nějaký je.
+        """
+        if self.pending is not None and not self.pending.done():
+            self.pending.set_result(letter)
+        self.pending = None
+
+
+class RemotePlayer(AbstractAsyncPlayer):
+    """Asynchronní hráč, jehož tipy zadává vzdálený klient. Po odpojení
+    klienta vrací `None` (přichází o tah)."""
+
+    def __init__(self, player_name: str, connection: _Connection):
+        """Initor, který přijímá jméno hráče a spojení s klientem."""
+        super().__init__(player_name)
+        self._connection = connection
+
+    @property
+    def is_connected(self) -> bool:
+        """Je-li klient stále připojen."""
+        return not self._connection.closed
+
+    async def guess_letter(self, already_guessed: Iterable[str],
+                           phrase: str) -> Optional[str]:
+        """Korutina vyzve klienta k tipu a počká na jeho odpověď. Tajenka se
+        klientovi neposílá, klient si ji skládá ze zpráv `reveal`."""
+        connection = self._connection
+        if connection.closed:
+            return None
+        connection.pending = asyncio.get_running_loop().create_future()
+        connection.prompt += 1
+        try:
+            await send_message(connection.writer, {
+                "type": "guess", "prompt": connection.prompt,
+                "guessed": list(already_guessed)})
+        except ConnectionError:
+            connection.closed = True
+            connection.resolve(None)
+            return None
+        return await connection.pending
+
+
+class RoomModerator(AsyncModerator):
+    """Asynchronní moderátor jedné herní místnosti, který průběh hry
+    rozesílá připojeným klientům."""
+
+    def __init__(self, game: MultiplayerGame, connections: list[_Connection],
+                 turn_timeout: Optional[float], max_turns: int):
+        """Initor, který přijímá hru, spojení s klienty, časový limit tahu
+        a maximální počet tahů hry."""
+        super().__init__(game, True, turn_timeout, max_turns=max_turns)
+        self._connections = connections
+
+    def broadcast(self, message: dict):
+        """Metoda rozešle zprávu všem klientům místnosti."""
+        for connection in self._connections:
+            connection.post(message)
+
+    def turn_wheel(self) -> Wedge:
+        """Metoda zatočí kolem a výsledek rozešle klientům."""
+        wedge = super().turn_wheel()
+        self.broadcast({
+            "type": "spin",
+            "seat": self.game.player_slot(self.game.current_player),
+            "wedge": wedge.name})
+        return wedge
+
+    async def player_guess(self, wedge: Wedge,
+                           player: AbstractAsyncPlayer) -> bool:
+        """Korutina odehraje tip hráče a klientům rozešle nově odkryté
+        pozice tajenky."""
+        before = self.game.phrase.current_phrase
+        guessed = len(self.game.guessed_letters)
+        result = await super().player_guess(wedge, player)
+
+        if len(self.game.guessed_letters) > guessed:
+            self.broadcast({
+                "type": "reveal",
+                "seat": self.game.player_slot(player),
+                "letter": self.game.guessed_letters[-1],
+                **phrase_delta(before, self.game.phrase.current_phrase),
+                "scores": list(self.game.scores)})
+        return result
+
+    def is_over(self) -> bool:
+        """Metoda vrací, zda-li hra skončila (viz `AsyncModerator.is_over`),
+        nebo se odpojili všichni hráči (pokud v místnosti nehrají NPC)."""
+        return super().is_over() or not any(
+            getattr(player, "is_connected", True)
+            for player in self.game.players)
+
+
+class GameServer:
+    """Instance této třídy hostí mnoho herních místností najednou."""
+
+    def __init__(self, phrases: Iterable[str] = DEFAULT_PHRASES,
+                 remote_seats: int = 1,
+                 npc_factories: Iterable[Callable[[], AbstractPlayer]] = (
+                     EntropyDrivenPlayerCZ,),
+                 wheel_factory: Callable[[], Wheel] = default_wheel,
+                 turn_timeout: Optional[float] = 30.0,
+                 max_turns: int = Simulator.DEFAULT_MAX_TURNS):
+        """Initor, který přijímá tajenky (hrají se postupně dokola), počet
+        míst pro vzdálené klienty v jedné místnosti, továrny NPC hráčů
+        obsazujících zbylá místa, továrnu kola štěstí, časový limit tahu
+        a maximální počet tahů jedné hry."""
+        if remote_seats < 1:
+            raise ValueError(f"Místnost musí mít alespoň jedno místo pro "
+                             f"klienta: {remote_seats}")
+
+        self._phrases = cycle(tuple(phrases))
+        self._remote_seats = remote_seats
+        self._npc_factories = tuple(npc_factories)
+        self._wheel_factory = wheel_factory
+        self._turn_timeout = turn_timeout
+        self._max_turns = max_turns
+        self._waiting: list[tuple[_Connection, str]] = []
+        self._rooms: set[asyncio.Task] = set()
+        self._rooms_started = 0
+
+    @property
+    def active_rooms(self) -> int:
+        """Počet právě probíhajících her."""
+        return len(self._rooms)
+
+    @property
+    def rooms_started(self) -> int:
+        """Celkový počet dosud založených místností."""
+        return self._rooms_started
+
+    async def start(self, host: str = "127.0.0.1",
+                    port: int = 8765) -> asyncio.AbstractServer:
+        """Korutina spustí naslouchání na dodané adrese a vrací server."""
+        return await asyncio.start_server(self._handle, host, port)
+
+    async def _handle(self, reader: asyncio.StreamReader,
+                      writer: asyncio.StreamWriter):
+        """Korutina obsluhuje jedno spojení s klientem. Žádost `join`
+        přijme, jen pokud klient dosud nečeká ani nehraje. Odpověď `letter`
+        přijme, jen nese-li číslo poslední výzvy `guess`; písmeno, které
+        není řetězcem, znamená ztrátu tahu."""
+        connection = _Connection(reader, writer)
+        try:
+            while (message := await read_message(reader)) is not None:
+                if message.get("type") == "join":
+                    if connection.joined:
+                        continue
+                    name = message.get("name")
+                    self._join(connection,
+                               name if isinstance(name, str) else "HOST")
+                elif message.get("type") == "letter":
+                    if message.get("prompt") != connection.prompt:
+                        continue
+                    letter = message.get("letter")
+                    connection.resolve(
+                        letter if isinstance(letter, str) else None)
+        except (ConnectionError, ValueError):
+            # Spojení selhalo nebo klient poslal příliš dlouhý řádek (viz
+            # `StreamReader.readline`)
+            pass
+        finally:
+            connection.closed = True
+            connection.resolve(None)
+            self._waiting = [(waiting, name) for waiting, name
+                             in self._waiting if waiting is not connection]
+            writer.close()
+
+    def _join(self, connection: _Connection, name: str):
+        """Metoda zařadí klienta do čekárny a sejde-li se dostatek klientů,
+        založí novou místnost."""
+        connection.joined = True
+        self._waiting.append((connection, name))
+        if len(self._waiting) >= self._remote_seats:
+            seated = self._waiting[:self._remote_seats]
+            del self._waiting[:self._remote_seats]
+            task = asyncio.create_task(self._run_room(seated))
+            self._rooms.add(task)
+            task.add_done_callback(self._rooms.discard)
+
+    async def _run_room(self, seated: list[tuple[_Connection, str]]):
+        """Korutina odehraje hru v jedné místnosti."""
+        room = self._rooms_started
+        self._rooms_started += 1
+
+        connections = [connection for connection, _ in seated]
+        players = [RemotePlayer(name, connection)
+                   for connection, name in seated]
+        players += [SyncPlayerAdapter(factory())
+                    for factory in self._npc_factories]
+        game = MultiplayerGame(
+            CompactSecretPhrase(next(self._phrases)), self._wheel_factory(),
+            players, max_players=None)
+
+        names = [player.player_name for player in players]
+        for seat, connection in enumerate(connections):
+            connection.post({
+                "type": "start", "room": room, "seat": seat,
+                "players": names, "phrase": game.phrase.current_phrase})
+
+        moderator = RoomModerator(
+            game, connections, self._turn_timeout, self._max_turns)
+        try:
+            await moderator.run_game()
+            moderator.broadcast({
+                "type": "end", "phrase": game.phrase.current_phrase,
+                "scores": list(game.scores)})
+        finally:
+            for connection in connections:
+                connection.joined = False
+
+
+async def serve(server: GameServer, host: str, port: int):
+    """Korutina spustí herní server a obsluhuje klienty až do ukončení."""
+    listener = await server.start(host, port)
+    async with listener:
+        print(f"Herní server naslouchá na {host}:{port}")
+        await listener.serve_forever()
+
+
+def main():
+    """Spuštění serveru z příkazové řádky."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--remote-seats", type=int, default=1)
+    parser.add_argument("--npc-seats", type=int, default=1)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--phrases", help="soubor s tajenkou na každém řádku")
+    args = parser.parse_args()
+
+    phrases = DEFAULT_PHRASES
+    if args.phrases:
+        with open(args.phrases, encoding="utf-8") as file:
+            phrases = [line.strip() for line in file if line.strip()]
+
+    server = GameServer(phrases, args.remote_seats,
+                        [EntropyDrivenPlayerCZ] * args.npc_seats,
+                        turn_timeout=args.timeout)
+    try:
+        asyncio.run(serve(server, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
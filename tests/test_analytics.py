@@ -0,0 +1,29 @@
+"""Testy analýz tajenek (`src.game.analytics`)."""
+
+import pytest
+
+from src.game.analytics import analyze
+from src.game.phrase import CompactSecretPhrase
+
+PHRASES = (
+    "Poslušně hlásím, že jsem zase tady.",
+    "Ωmega 42 & co",
+    "Café ö á",
+    "Ja\u0301 a ty",
+)
+
+
+@pytest.mark.parametrize("text", PHRASES)
+def test_histogram_matches_guessing(text):
+    analytics = analyze(text)
+    phrase = CompactSecretPhrase(text)
+    for key, count in analytics.histogram.items():
+        assert phrase.guess(key) == count
+    assert phrase.is_finished == analytics.is_solvable
+    assert analytics.is_solvable
+
+
+def test_unsolvable_phrase():
+    analytics = analyze("Straße")
+    assert not analytics.is_solvable
+    assert analytics.guessable == len("Straße") - 1
@@ -0,0 +1,55 @@
+"""Testy ukončení her asynchronního moderátora
+(`src.game.async_moderator.AsyncModerator`)."""
+
+import asyncio
+
+import pytest
+
+from src.game import default_wheel
+from src.game.async_moderator import AsyncModerator, run_games
+from src.game.game import MultiplayerGame
+from src.player.async_player import SyncPlayerAdapter
+from src.player.entropy_driven_player import EntropyDrivenPlayerCZ
+
+
+def _moderator(phrase: str, **options) -> AsyncModerator:
+    """Moderátor hry dvou NPC nad dodanou tajenkou."""
+    players = [SyncPlayerAdapter(EntropyDrivenPlayerCZ()) for _ in range(2)]
+    wheel = default_wheel()
+    wheel.seed(0)
+    return AsyncModerator(MultiplayerGame(phrase, wheel, players), True,
+                          **options)
+
+
+def test_unsolvable_game_ends_and_yields():
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0)
+
+    async def play(moderators):
+        task = asyncio.create_task(ticker())
+        await asyncio.wait_for(run_games(moderators), 10)
+        task.cancel()
+
+    moderators = [_moderator("abc 1"), _moderator("Kolo štěstí")]
+    asyncio.run(play(moderators))
+    unsolvable, solvable = moderators
+    assert not unsolvable.game.phrase.is_finished
+    assert solvable.game.phrase.is_finished
+    assert ticks >= unsolvable.turns
+
+
+@pytest.mark.parametrize("max_turns", [1, 3])
+def test_max_turns(max_turns):
+    moderator = _moderator("Poslušně hlásím", max_turns=max_turns)
+    asyncio.run(moderator.run_game())
+    assert moderator.turns == max_turns
+
+
+def test_max_turns_must_be_positive():
+    with pytest.raises(ValueError):
+        _moderator("abc", max_turns=0)
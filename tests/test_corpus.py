@@ -0,0 +1,19 @@
+"""Testy korpusu tajenek (`src.game.corpus`)."""
+
+import pytest
+
+from src.game.corpus import PhraseCorpus, write_corpus
+
+
+def test_round_trip(tmp_path):
+    phrases = ["Kolo štěstí se točí.", "A", "Straße 42"]
+    path = str(tmp_path / "korpus.bin")
+    assert write_corpus(path, phrases) == len(phrases)
+    with PhraseCorpus(path) as corpus:
+        assert [corpus[index] for index in range(len(corpus))] == phrases
+
+
+@pytest.mark.parametrize("phrase", ["", " ", "\t\n"])
+def test_empty_phrase_is_rejected(tmp_path, phrase):
+    with pytest.raises(ValueError):
+        write_corpus(str(tmp_path / "korpus.bin"), ["A", phrase])
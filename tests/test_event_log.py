@@ -0,0 +1,62 @@
+"""Testy záznamu her (`src.game.event_log`): přehraný záznam musí dát
+stejná skóre jako odehraná hra, a to po libovolném počtu tahů."""
+
+import pytest
+
+from src.game import default_wheel
+from src.game.event_log import MAX_PHRASE_SIZE, EventLog, read_log
+from src.game.game import MultiplayerGame, SinglePlayerGame
+from src.game.moderator import Moderator
+from src.player.entropy_driven_player import (
+    EntropyDrivenPlayerCZ, EntropyDrivenPlayerEN)
+
+PHRASES = (
+    "Poslušně hlásím, že jsem zase tady.",
+    "Příliš žluťoučký kůň úpěl ďábelské ódy!",
+    "Kdo jinému jámu kopá, sám do ní padá.",
+    "A",
+)
+
+
+def _record(path: str, create_game) -> list:
+    """Odehraje se záznamem hry nad tajenkami `PHRASES` a vrací je."""
+    wheel = default_wheel()
+    wheel.seed(3)
+    games = []
+    with EventLog(path) as event_log:
+        for text in PHRASES:
+            game = create_game(text, wheel)
+            Moderator(game, quiet=True, event_log=event_log).run_game()
+            games.append(game)
+    return games
+
+
+@pytest.mark.parametrize("create_game", [
+    lambda text, wheel: SinglePlayerGame(text, wheel,
+                                         EntropyDrivenPlayerCZ()),
+    lambda text, wheel: MultiplayerGame(
+        text, wheel, [EntropyDrivenPlayerCZ(), EntropyDrivenPlayerEN(),
+                      EntropyDrivenPlayerCZ()]),
+])
+def test_replay_matches_recorded_games(tmp_path, create_game):
+    path = str(tmp_path / "hry.wofe")
+    games = _record(path, create_game)
+    records = list(read_log(path))
+    assert len(records) == len(games)
+
+    for game, record in zip(games, records):
+        replayed = record.replay()
+        assert replayed.scores == game.scores
+        assert tuple(replayed.guessed_letters) == tuple(game.guessed_letters)
+        assert replayed.phrase.current_phrase == game.phrase.current_phrase
+        assert record.scores() == tuple(game.scores)
+        for turns in range(record.turn_count + 1):
+            assert record.scores(turns) == tuple(record.replay(turns).scores)
+
+
+def test_phrase_too_long(tmp_path):
+    game = SinglePlayerGame("ž" * (MAX_PHRASE_SIZE // 2 + 1), default_wheel(),
+                            EntropyDrivenPlayerCZ())
+    with EventLog(str(tmp_path / "hry.wofe")) as event_log:
+        with pytest.raises(ValueError):
+            Moderator(game, quiet=True, event_log=event_log)
@@ -0,0 +1,95 @@
+"""Testy shody zkompilovaného jádra hry (`src.game._kernel`) s referenční
+implementací v čistém Pythonu (viz `src.game.kernel`). Není-li jádro
+zkompilované, testy se přeskočí."""
+
+import pytest
+
+from src.game import default_wheel
+from src.game.game import MultiplayerGame, SinglePlayerGame
+from src.game.kernel import (ACCELERATED, FastSecretPhrase, PythonSecretPhrase,
+                             play_turn, python_play_turn)
+from src.game.phrase import GuessError
+from src.game.turn import GIVE_UP
+from src.game.wheel import Wedge, Wheel
+from src.player.entropy_driven_player import (
+    EntropyDrivenPlayerCZ, EntropyDrivenPlayerEN)
+
+pytestmark = pytest.mark.skipif(not ACCELERATED,
+                                reason="jádro není zkompilované")
+
+PHRASES = (
+    "Poslušně hlásím, že jsem zase tady.",
+    "Kolo štěstí se točí.",
+    "Příliš žluťoučký kůň úpěl ďábelské ódy!",
+    "Straße 42 & Ωmega",
+    "A",
+)
+
+
+class _DerivedGame(MultiplayerGame):
+    """Hra odvozené třídy, pro kterou jádro postupuje obecně."""
+
+
+def _weighted_wheel() -> Wheel:
+    """Výchozí kolo s různými vahami klínů."""
+    return Wheel([Wedge(wedge.name, wedge.multiplier, 1 + position % 3)
+                  for position, wedge in enumerate(default_wheel().wedges)])
+
+
+def _play(create_game, create_wheel, turn, phrase_factory) -> list:
+    """Dohraje hry nad tajenkami `PHRASES` s kolem inicializovaným
+    semínkem a vrací záznamy jejich průběhu."""
+    wheel = create_wheel()
+    wheel.seed(7)
+    records = []
+    for text in PHRASES:
+        game = create_game(phrase_factory(text), wheel)
+        outcomes = []
+        while not game.phrase.is_finished and len(outcomes) < 10_000:
+            outcomes.append(turn(game))
+            if outcomes[-1] == GIVE_UP:
+                break
+        records.append((outcomes, tuple(game.guessed_letters), game.scores,
+                        game.phrase.current_phrase, wheel.getstate()))
+    return records
+
+
+@pytest.mark.parametrize("create_wheel", [default_wheel, _weighted_wheel])
+@pytest.mark.parametrize("create_game", [
+    lambda phrase, wheel: MultiplayerGame(
+        phrase, wheel, [EntropyDrivenPlayerCZ(), EntropyDrivenPlayerEN()]),
+    lambda phrase, wheel: SinglePlayerGame(
+        phrase, wheel, EntropyDrivenPlayerCZ()),
+    lambda phrase, wheel: _DerivedGame(
+        phrase, wheel, [EntropyDrivenPlayerEN(), EntropyDrivenPlayerCZ()]),
+])
+def test_play_turn_matches_python(create_game, create_wheel):
+    reference = _play(create_game, create_wheel, python_play_turn,
+                      PythonSecretPhrase)
+    assert _play(create_game, create_wheel, play_turn,
+                 FastSecretPhrase) == reference
+
+
+@pytest.mark.parametrize("text", PHRASES)
+def test_secret_phrase_matches_python(text):
+    reference = PythonSecretPhrase(text)
+    phrase = FastSecretPhrase(text)
+    for letter in "eÉsSßAřRxž4Ω&.  ab":
+        try:
+            expected = reference.guess(letter)
+        except GuessError:
+            expected = GuessError
+        try:
+            actual = phrase.guess(letter)
+        except GuessError:
+            actual = GuessError
+        assert actual == expected
+        assert phrase.current_phrase == reference.current_phrase
+        assert phrase.is_finished == reference.is_finished
+
+
+def test_rotate_copies_random_choice():
+    # Zatočení kolem se stejnými vahami klínů v jádře kopíruje soukromou
+    # metodu `Random._randbelow`; bez shody se jádro vrací k `Wheel.rotate`
+    from src.game._kernel import _choice_matches
+    assert _choice_matches()
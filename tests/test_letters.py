@@ -0,0 +1,30 @@
+"""Testy evidence zkoušených písmen a pořadí písmen hráčů
+(`src.game.letters`)."""
+
+import pytest
+
+from src.game.letters import LetterRanking, guessed_mask
+from src.player.entropy_driven_player import EntropyDrivenPlayer
+
+
+def test_ranking_folds_and_skips_repeated_letters():
+    ranking = LetterRanking("áeAébC")
+    assert ranking.letters == ("A", "E", "B", "C")
+    assert ranking.first_unguessed(guessed_mask("ae")) == "B"
+
+
+def test_ranking_rejects_letters_outside_alphabet():
+    with pytest.raises(ValueError):
+        LetterRanking("A1")
+
+
+def test_player_guesses_like_the_ranking_loop():
+    ranking = "ÓoEšNATVSILKRDPMUZJYCBHFGXWQ"
+    player = EntropyDrivenPlayer("NPC", ranking)
+    guessed = []
+    while (letter := player.guess_letter(guessed, "")) is not None:
+        assert letter == next(
+            character.upper() for character in "OESNATVILKRDPMUZJYCBHFGXWQ"
+            if character not in guessed)
+        guessed.append(letter)
+    assert len(guessed) == 26
@@ -0,0 +1,117 @@
+"""Testy tajenek (`src.game.phrase`). Tajenky i tipy se generují náhodně
+(se semínkem) ze znaků, které zahrnují diakritiku, speciální znaky i znaky,
+které po odstranění diakritiky zmizí nebo se rozpadnou na více znaků; výsledky
+se porovnávají s přímočarým výpočtem pomocí `remove_accents`."""
+
+import random
+
+import pytest
+
+from src.game.kernel import FastSecretPhrase
+from src.game.phrase import (AbstractSecretPhrase, CompactSecretPhrase,
+                             SecretPhrase, fold_accents, fold_letter,
+                             remove_accents)
+
+# Znaky, ze kterých se skládají náhodné tajenky a tipy
+POOL = ("aábcčdďeéěfghiíjklmnňoópqrřsštťuúůvwxyýzž"
+        "AÁEÉZŽ .,!?-'\"0123ßıΩĲǄ́ﬁ")
+
+
+# Znaky pro test odstranění diakritiky: rozsah předpočtu i znaky za ním
+# (bez náhradních znaků UTF-16, které nelze zakódovat)
+CHARACTERS = [chr(code_point) for code_point in range(0x3000)
+              if not 0xD800 <= code_point < 0xE000]
+
+
+def _cases(seed: int) -> tuple[str, list[str]]:
+    """Vrací náhodnou tajenku a posloupnost tipů pro dodané semínko."""
+    rng = random.Random(seed)
+    text = "".join(rng.choice(POOL) for _ in range(rng.randint(1, 40)))
+    return text, [rng.choice(POOL) for _ in range(30)]
+
+
+def _key(character: str) -> str:
+    """Porovnávací tvar znaku spočítaný přímo pomocí `remove_accents`."""
+    return remove_accents(character).upper()
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_guess_counts_hidden_occurrences(seed):
+    text, guesses = _cases(seed)
+    phrase = SecretPhrase(text)
+    hidden = {position for position, character in enumerate(text)
+              if character not in AbstractSecretPhrase.SPECIAL_CHARACTERS}
+    for guess in guesses:
+        found = {position for position in hidden
+                 if _key(text[position].upper()) == _key(guess)}
+        assert phrase.guess(guess) == len(found)
+        hidden -= found
+
+
+def _render(text: str, revealed: set[int]) -> str:
+    """Podoba tajenky sestavená znovu od začátku."""
+    return "".join(character.upper() if position in revealed
+                   else "_" for position, character in enumerate(text))
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_rendering_matches_rebuilt_phrase(seed):
+    text, guesses = _cases(seed)
+    phrase = SecretPhrase(text)
+    revealed = {position for position, character in enumerate(text)
+                if character in AbstractSecretPhrase.SPECIAL_CHARACTERS}
+    for guess in guesses:
+        phrase.guess(guess)
+        revealed |= {position for position, character in enumerate(text)
+                     if _key(character.upper()) == _key(guess)}
+        assert phrase.current_phrase == _render(text, revealed)
+        assert phrase.is_finished == (len(revealed) == len(text))
+
+    mask = random.Random(seed).getrandbits(len(text))
+    phrase.restore_revealed(mask)
+    revealed = {position for position, character in enumerate(text)
+                if mask >> position & 1
+                or character in AbstractSecretPhrase.SPECIAL_CHARACTERS}
+    assert phrase.current_phrase == _render(text, revealed)
+    assert phrase.is_finished == (len(revealed) == len(text))
+
+
+def _state(phrase: AbstractSecretPhrase) -> tuple:
+    """Vše, co o tajence vidí hra, moderátor a hráči."""
+    return (phrase.current_phrase, phrase.is_finished, phrase.revealed_mask,
+            phrase.text, phrase.phrase_len, repr(phrase),
+            [letter.letter for letter in phrase.hidden_characters],
+            [letter.letter for letter in phrase.revealed_characters],
+            [letter.letter for letter in phrase.special_characters])
+
+
+@pytest.mark.parametrize("phrase_class",
+                         [CompactSecretPhrase, FastSecretPhrase])
+@pytest.mark.parametrize("seed", range(200))
+def test_compact_phrases_behave_like_secret_phrase(seed, phrase_class):
+    text, guesses = _cases(seed)
+    expected = SecretPhrase(text)
+    phrase = phrase_class(text)
+    assert _state(phrase) == _state(expected)
+    for guess in guesses:
+        assert phrase.guess(guess) == expected.guess(guess)
+        assert _state(phrase) == _state(expected)
+
+    mask = random.Random(seed).getrandbits(len(text))
+    phrase.restore_revealed(mask)
+    expected.restore_revealed(mask)
+    assert _state(phrase) == _state(expected)
+
+
+def test_fold_letter_matches_remove_accents():
+    for character in CHARACTERS:
+        assert fold_letter(character) == remove_accents(character)
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_fold_accents_matches_remove_accents(seed):
+    rng = random.Random(seed)
+    pool = POOL if seed % 2 else CHARACTERS
+    text = "".join(rng.choice(pool) for _ in range(rng.randint(0, 40)))
+    assert fold_accents(text) == remove_accents(text)
+    assert fold_letter(text) == remove_accents(text)
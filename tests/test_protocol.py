@@ -0,0 +1,16 @@
+"""Testy protokolu herního serveru (`src.server.protocol`)."""
+
+import asyncio
+
+from src.server.protocol import encode_message, read_message
+
+
+def test_read_message_skips_lines_that_are_not_objects():
+    async def read_all() -> list:
+        reader = asyncio.StreamReader()
+        reader.feed_data(b"not json\n\xff\xfe\n[1, 2]\n\n"
+                         + encode_message({"type": "join", "name": "Á"}))
+        reader.feed_eof()
+        return [await read_message(reader), await read_message(reader)]
+
+    assert asyncio.run(read_all()) == [{"type": "join", "name": "Á"}, None]
@@ -0,0 +1,100 @@
+"""Testy snímků rozehraných her (`src.game.snapshot`): snímek převedený do
+binárního tvaru a zpět je týž, hra obnovená ze snímku je ve stejném stavu
+a dohraje se stejně jako původní hra."""
+
+import random
+
+import pytest
+
+from src.game import default_wheel
+from src.game.game import MultiplayerGame, SinglePlayerGame
+from src.game.kernel import FastSecretPhrase, play_turn
+from src.game.phrase import CompactSecretPhrase, SecretPhrase
+from src.game.snapshot import GameSnapshot
+from src.game.turn import GIVE_UP
+from src.player.entropy_driven_player import (
+    EntropyDrivenPlayerCZ, EntropyDrivenPlayerEN)
+
+PHRASES = (
+    "Poslušně hlásím, že jsem zase tady.",
+    "Příliš žluťoučký kůň úpěl ďábelské ódy!",
+    "Kdo jinému jámu kopá, sám do ní padá.",
+    "A",
+)
+
+GAMES = {
+    "single": lambda phrase, wheel: SinglePlayerGame(
+        phrase, wheel, EntropyDrivenPlayerCZ()),
+    "multi": lambda phrase, wheel: MultiplayerGame(
+        phrase, wheel, [EntropyDrivenPlayerEN(), EntropyDrivenPlayerCZ(),
+                        EntropyDrivenPlayerEN()]),
+}
+
+
+def _finish(game) -> list:
+    """Dohraje hru a vrací výsledky jejích tahů a konečný stav."""
+    outcomes = []
+    while not game.phrase.is_finished and len(outcomes) < 10_000:
+        outcomes.append(play_turn(game))
+        if outcomes[-1] == GIVE_UP:
+            break
+    return [outcomes, game.snapshot()]
+
+
+def _started(seed: int, create_game, phrase_class=CompactSecretPhrase):
+    """Vrací hru nad náhodnou tajenkou rozehranou o náhodný počet tahů."""
+    rng = random.Random(seed)
+    wheel = default_wheel()
+    wheel.seed(seed)
+    game = create_game(phrase_class(rng.choice(PHRASES)), wheel)
+    for _ in range(rng.randint(0, 12)):
+        if game.phrase.is_finished or play_turn(game) == GIVE_UP:
+            break
+    return game
+
+
+@pytest.mark.parametrize("kind", GAMES)
+@pytest.mark.parametrize("seed", range(30))
+def test_bytes_round_trip(seed, kind):
+    game = _started(seed, GAMES[kind])
+    for snapshot in (game.snapshot(), game.snapshot(False)):
+        assert GameSnapshot.from_bytes(snapshot.to_bytes()) == snapshot
+
+
+@pytest.mark.parametrize("phrase_class",
+                         [SecretPhrase, CompactSecretPhrase,
+                          FastSecretPhrase])
+@pytest.mark.parametrize("kind", GAMES)
+@pytest.mark.parametrize("seed", range(30))
+def test_restored_game_continues_identically(seed, kind, phrase_class):
+    create_game = GAMES[kind]
+    game = _started(seed, create_game)
+    data = game.snapshot().to_bytes()
+
+    wheel = default_wheel()
+    restored = type(game).from_snapshot(
+        GameSnapshot.from_bytes(data), wheel, game.players, phrase_class)
+    assert restored.snapshot() == game.snapshot()
+    assert restored.phrase.current_phrase == game.phrase.current_phrase
+    assert _finish(restored) == _finish(game)
+
+    # Návrat původní hry do stavu snímku
+    game.restore(GameSnapshot.from_bytes(data))
+    restored = type(game).from_snapshot(
+        GameSnapshot.from_bytes(data), default_wheel(), game.players)
+    assert _finish(game) == _finish(restored)
+
+
+def test_stream_state_is_kept_in_memory_only():
+    wheel = default_wheel().stream(batch_size=8)
+    wheel.seed(1)
+    game = GAMES["multi"](CompactSecretPhrase(PHRASES[0]), wheel)
+    for _ in range(5):
+        play_turn(game)
+    snapshot = game.snapshot()
+    with pytest.raises(ValueError):
+        snapshot.to_bytes()
+
+    expected = _finish(game)
+    game.restore(snapshot)
+    assert _finish(game) == expected
@@ -0,0 +1,91 @@
+"""Testy řešitele hry pro jediného hráče (`src.game.solver`). Hodnoty
+řešitele se porovnávají s přímou rekurzí podle pravidel hry přes stavy
+(zbývající písmena, skóre), bez rozkladu hodnoty a bez symetrií."""
+
+import random
+from functools import lru_cache
+
+import pytest
+
+from src.game import create_bankrupt_wedge, create_wedge
+from src.game.phrase import remove_accents
+from src.game.solver import ExpectedValueSolver
+from src.game.wheel import Wheel
+
+
+def _reference(text: str, wheel: Wheel):
+    """Vrací funkci (zbývající písmena, skóre) -> nejlepší očekávané skóre
+    na konci hry, spočítanou přímo z pravidel."""
+    counts: dict[str, int] = {}
+    for character in text:
+        key = remove_accents(character).upper()
+        if key.isalpha():
+            counts[key] = counts.get(key, 0) + 1
+    outcomes = list(zip(wheel.wedges, wheel.probabilities))
+    bankrupt = sum(probability for wedge, probability in outcomes
+                   if wedge.is_bankrupt)
+
+    @lru_cache(maxsize=None)
+    def value(remaining: frozenset, score: int) -> float:
+        if not remaining:
+            return float(score)
+
+        def after_win(points: int) -> float:
+            """Očekávaná výhra po výherním zatočení bez bankrotu."""
+            total = 0.0
+            for wedge, probability in outcomes:
+                if not wedge.is_bankrupt:
+                    total += probability * max(
+                        value(remaining - {letter},
+                              points + wedge.multiplier * counts[letter])
+                        for letter in remaining)
+            return total
+
+        # Bankrot vynuluje skóre a hráč točí znovu:
+        # V(S, 0) = b * V(S, 0) + výhra(0), tedy V(S, 0) = výhra(0) / (1 - b)
+        restart = after_win(0) / (1 - bankrupt)
+        return bankrupt * restart + after_win(score)
+
+    return value, frozenset(counts)
+
+
+def _wheel(rng: random.Random) -> Wheel:
+    """Náhodné kolo s výherními klíny a alespoň jedním bankrotem."""
+    wedges = [create_wedge(rng.choice([100, 200, 500, 1000]),
+                           rng.randint(1, 3))
+              for _ in range(rng.randint(1, 4))]
+    wedges += [create_bankrupt_wedge(rng.randint(1, 3))
+               for _ in range(rng.randint(1, 2))]
+    return Wheel(wedges)
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_solver_matches_direct_recursion(seed):
+    rng = random.Random(seed)
+    text = "".join(rng.choice("aábcčde ") for _ in range(rng.randint(1, 12)))
+    if not text.strip():
+        text = "a"
+    wheel = _wheel(rng)
+    solver = ExpectedValueSolver(text, wheel)
+    reference, letters = _reference(text, wheel)
+
+    assert solver.expected_score == pytest.approx(reference(letters, 0))
+    for _ in range(10):
+        guessed = {letter for letter in letters if rng.random() < 0.5}
+        score = rng.choice([0, 100, 1500])
+        remaining = letters - guessed
+        assert solver.value(guessed, score) == pytest.approx(
+            reference(remaining, score))
+
+        # Optimální písmeno dosahuje nejlepší hodnoty ze všech písmen
+        multiplier = rng.choice([100, 500])
+        best = solver.best_letter(guessed, multiplier)
+        if not remaining:
+            assert best is None
+            continue
+        counts = {letter: sum(remove_accents(character).upper() == letter
+                              for character in text) for letter in remaining}
+        gains = {letter: reference(remaining - {letter},
+                                   score + multiplier * counts[letter])
+                 for letter in remaining}
+        assert gains[best] == pytest.approx(max(gains.values()))
@@ -0,0 +1,84 @@
+"""Testy kola štěstí (`src.game.wheel`): vzorkování tabulkou aliasů,
+dávková zatočení a proud předgenerovaných zatočení."""
+
+import math
+import random
+from collections import Counter
+
+import pytest
+
+import src.game.wheel as wheel_module
+from src.game import default_wheel
+from src.game.wheel import SpinStream, Wedge, Wheel, _alias_table
+
+
+def _weighted_wheel() -> Wheel:
+    """Výchozí kolo s různými vahami klínů."""
+    return Wheel([Wedge(wedge.name, wedge.multiplier, 1 + position % 3)
+                  for position, wedge in enumerate(default_wheel().wedges)])
+
+
+@pytest.mark.parametrize("seed", range(100))
+def test_alias_table_preserves_weights(seed):
+    rng = random.Random(seed)
+    weights = [rng.choice([rng.random() * 10, rng.randint(1, 5)])
+               for _ in range(rng.randint(1, 30))]
+    probabilities, aliases = _alias_table(weights)
+
+    # Pravděpodobnost klínu je součet přes sloupce, které jej vyberou
+    size = len(weights)
+    total = sum(weights)
+    for wedge, weight in enumerate(weights):
+        chance = probabilities[wedge] + sum(
+            1.0 - probabilities[column] for column in range(size)
+            if aliases[column] == wedge and column != wedge)
+        assert chance / size == pytest.approx(weight / total, abs=1e-9)
+
+
+@pytest.mark.parametrize("numpy", [True, False])
+@pytest.mark.parametrize("batch", [False, True])
+def test_spins_follow_weights(batch, numpy, monkeypatch):
+    if not numpy:
+        monkeypatch.setattr(wheel_module, "numpy", None)
+    wheel = _weighted_wheel()
+    wheel.seed(5)
+    spins = 60_000
+    if batch:
+        counts = Counter(list(wheel.rotate_many(spins)[0]))
+    else:
+        indices = {id(wedge): index
+                   for index, wedge in reversed(list(enumerate(wheel.wedges)))}
+        counts = Counter(indices[id(wheel.rotate())] for _ in range(spins))
+
+    # Četnost každého klínu leží do pěti směrodatných odchylek od očekávané
+    for index, probability in enumerate(wheel.probabilities):
+        expected = spins * probability
+        deviation = math.sqrt(expected * (1 - probability))
+        assert abs(counts[index] - expected) <= 5 * deviation
+
+
+@pytest.mark.parametrize("create_wheel", [default_wheel, _weighted_wheel])
+def test_rotate_many_does_not_depend_on_numpy(create_wheel, monkeypatch):
+    wheel = create_wheel()
+    wheel.seed(11)
+    indices, multipliers = wheel.rotate_many(5000)
+    expected = (list(indices), list(multipliers), wheel.getstate())
+
+    monkeypatch.setattr(wheel_module, "numpy", None)
+    wheel.seed(11)
+    indices, multipliers = wheel.rotate_many(5000)
+    assert (list(indices), list(multipliers), wheel.getstate()) == expected
+
+
+def test_stream_state_round_trip():
+    stream = SpinStream(_weighted_wheel(), batch_size=16)
+    stream.seed(3)
+    for _ in range(5):
+        stream.rotate()
+    state = stream.getstate()
+    spins = [stream.rotate() for _ in range(40)]
+
+    stream.setstate(state)
+    assert [stream.rotate() for _ in range(40)] == spins
+    with pytest.raises(ValueError):
+        stream.setstate((state[0], None, ()))